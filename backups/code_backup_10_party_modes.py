@@ -16,6 +16,7 @@ import random
 # Configuration
 NUM_STRIPS = 5
 LEDS_PER_STRIP = 8
+TOTAL_LEDS = NUM_STRIPS * LEDS_PER_STRIP  # All strips treated as one virtual strip
 FADE_DURATION = 5.0  # seconds for each LED to fade in
 LED_DELAY = 0.05  # Delay between each LED starting (seconds)
 STRIP_DELAY_LEDS = 4  # Next strip starts when previous has this many LEDs started
@@ -38,6 +39,9 @@ party_mode_index = 0
 PROXIMITY_THRESHOLD = 10  # Proximity value to consider "close" (0-255) - start low for testing
 PROXIMITY_HOLD_TIME = 3.0  # Seconds to hold proximity to activate/deactivate
 
+# Loop timing uses integer nanoseconds (time.monotonic_ns) so it keeps full precision
+NS_PER_SECOND = 1000000000
+
 # Warm color (warmer white - more red/orange, less green and blue)
 
 # Warm white ~2700K-3000K color temperature - incandescent-like
@@ -79,6 +83,25 @@ for i, pin in enumerate(STRIP_PINS):
     )
     strips.append(strip)
 
+OFF = (0, 0, 0, 0)
+
+def clear_strips():
+    """Blank every strip buffer (fill runs in C, one call per strip)"""
+    for strip in strips:
+        strip.fill(OFF)
+
+def write_all_strips(colors):
+    """Write a TOTAL_LEDS color list across the strips, one slice assignment per strip"""
+    start = 0
+    for strip in strips:
+        strip[0:LEDS_PER_STRIP] = colors[start:start + LEDS_PER_STRIP]
+        start += LEDS_PER_STRIP
+
+def show_all_strips():
+    """Send every strip's buffer back-to-back once all buffers are filled"""
+    for strip in strips:
+        strip.show()
+
 # Set all LEDs to warm color
 for strip in strips:
     strip.fill(WARM_COLOR)
@@ -101,6 +124,18 @@ for strip_index in range(NUM_STRIPS):
         strip_times.append(led_start)
     led_start_times.append(strip_times)
 
+# Start times in nanoseconds for the fade loop
+led_start_ns = [[int(t * NS_PER_SECOND) for t in strip_times] for strip_times in led_start_times]
+
+# Every LED follows the same fade curve, so the one that starts last is the dimmest
+last_led_start_ns = max(max(strip_times) for strip_times in led_start_ns)
+
+# Warm color scaled to 256 brightness steps (index 255 = full WARM_COLOR)
+WARM_TABLE = tuple(
+    (int(WARM_COLOR[0] * s), int(WARM_COLOR[1] * s), int(WARM_COLOR[2] * s), int(WARM_COLOR[3] * s))
+    for s in (i / 255 for i in range(256))
+)
+
 # Smooth easing function (ease-in-out)
 def ease_in_out(t):
     """Smooth easing function for natural fade"""
@@ -138,220 +173,278 @@ def hsv_to_rgbw(h, s=255, v=255):
     
     return (r, g, b, 0)
 
-def update_party_rainbow(frame, brightness):
+# Full-saturation, full-value hue table: HUE_LUT[h] = (r, g, b)
+HUE_LUT = tuple(hsv_to_rgbw(h, 255, 255)[:3] for h in range(256))
+
+# Sine table over one full turn in 256 phase steps, scaled to 0-255
+SIN_TABLE = bytes(int((math.sin(i * 2 * math.pi / 256) + 1) * 127.5) for i in range(256))
+
+# Matrix rain fade per channel value (85%)
+FADE85 = bytes(i * 85 // 100 for i in range(256))
+
+# Fireworks fade per channel value (92%)
+FADE92 = bytes(i * 92 // 100 for i in range(256))
+
+# Xorshift PRNG state for party animations (16-bit keeps every value a small int)
+_rng = random.getrandbits(16) or 0xACE1
+
+def fast_rand():
+    """Cheap 16-bit xorshift random number, 1-65535"""
+    global _rng
+    x = _rng
+    x ^= (x << 7) & 0xFFFF
+    x ^= x >> 9
+    x ^= (x << 8) & 0xFFFF
+    _rng = x
+    return x
+
+# Per-LED offsets along the virtual strip (strip-major); only the frame term changes per frame
+RAINBOW_HUE_OFFSETS = tuple(
+    strip_index * 32 + led_index * 4
+    for strip_index in range(NUM_STRIPS) for led_index in range(LEDS_PER_STRIP)
+)
+WAVE_OFFSETS = tuple(  # (hue offset, sine phase offset)
+    (strip_index * 51, strip_index * 16 + led_index * 4)
+    for strip_index in range(NUM_STRIPS) for led_index in range(LEDS_PER_STRIP)
+)
+SPIRAL_OFFSETS = tuple(  # (hue offset, sine phase offset)
+    (strip_index * 51 + led_index * 8, strip_index * 16 + led_index * 12)
+    for strip_index in range(NUM_STRIPS) for led_index in range(LEDS_PER_STRIP)
+)
+
+# Party animations bind globals as default arguments so hot loops use fast local lookups
+def update_party_rainbow(frame, brightness, _lut=HUE_LUT, _write=write_all_strips, _offsets=RAINBOW_HUE_OFFSETS):
     """Rainbow animation for party mode"""
-    for strip_index, strip in enumerate(strips):
-        for led_index in range(LEDS_PER_STRIP):
-            # Create rainbow effect
-            hue = ((frame * 2 + strip_index * 32 + led_index * 4) % 256)
-            r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness))
-            strip[led_index] = (r, g, b, w)
-
-def update_party_chase(frame, brightness):
+    vb = int(255 * brightness)
+    base_hue = frame * 2
+    colors = []
+    append = colors.append
+    for hue_offset in _offsets:
+        # Create rainbow effect
+        r, g, b = _lut[(base_hue + hue_offset) & 0xFF]
+        append(((r * vb) >> 8, (g * vb) >> 8, (b * vb) >> 8, 0))
+    _write(colors)
+
+def update_party_chase(frame, brightness, _strips=strips, _lut=HUE_LUT, _n=LEDS_PER_STRIP):
     """Chase animation for party mode"""
-    for strip_index, strip in enumerate(strips):
-        strip.fill((0, 0, 0, 0))
-        chase_pos = (frame + strip_index * 2) % LEDS_PER_STRIP
-        r, g, b, w = hsv_to_rgbw((frame * 5) % 256, 255, int(255 * brightness))
-        strip[chase_pos] = (r, g, b, w)
+    vb = int(255 * brightness)
+    r, g, b = _lut[(frame * 5) % 256]
+    r, g, b = (r * vb) >> 8, (g * vb) >> 8, (b * vb) >> 8
+    head = (r, g, b, 0)
+    tail = (r // 2, g // 2, b // 2, 0)
+    for strip_index, strip in enumerate(_strips):
+        # Build the whole strip (blank + head + tail) and write it in one call
+        colors = [OFF] * _n
+        chase_pos = (frame + strip_index * 2) % _n
+        colors[chase_pos] = head
         if chase_pos > 0:
-            fade = int(255 * brightness * 0.5)
-            strip[chase_pos - 1] = (r // 2, g // 2, b // 2, w // 2)
+            colors[chase_pos - 1] = tail
+        strip[0:_n] = colors
 
-def update_party_pulse(frame, brightness):
+def update_party_pulse(frame, brightness, _strips=strips, _lut=HUE_LUT, _sin=SIN_TABLE):
     """Pulse animation for party mode"""
-    pulse = (math.sin(frame * 0.1) + 1) / 2  # 0 to 1
-    pulse_brightness = brightness * (0.3 + pulse * 0.7)
-    r, g, b, w = hsv_to_rgbw((frame * 3) % 256, 255, int(255 * pulse_brightness))
-    color = (r, g, b, w)
-    for strip in strips:
+    # 0.1 rad per frame is ~4.075 phase steps per frame
+    pulse = _sin[(frame * 163 // 40) & 0xFF]  # 0 to 255
+    vb = (int(255 * brightness) * (77 + ((179 * pulse) >> 8))) >> 8  # 30% to 100%
+    r, g, b = _lut[(frame * 3) % 256]
+    color = ((r * vb) >> 8, (g * vb) >> 8, (b * vb) >> 8, 0)
+    for strip in _strips:
         strip.fill(color)
 
-def update_party_twinkle(frame, brightness):
+def update_party_twinkle(frame, brightness, _strips=strips, _lut=HUE_LUT, _rand=fast_rand, _n=LEDS_PER_STRIP):
     """Twinkle animation for party mode"""
     if frame % 3 == 0:  # Update every 3 frames
-        for strip in strips:
-            for led_index in range(LEDS_PER_STRIP):
-                if random.randint(0, 100) < 15:  # 15% chance to twinkle
-                    hue = random.randint(0, 255)
-                    r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness))
-                    strip[led_index] = (r, g, b, w)
+        vb = int(255 * brightness)
+        for strip in _strips:
+            # Read the strip once, update in place, write it back in one call
+            pixels = list(strip[0:_n])
+            for led_index in range(_n):
+                if _rand() % 100 < 15:  # 15% chance to twinkle
+                    r, g, b = _lut[_rand() & 0xFF]
+                    pixels[led_index] = ((r * vb) >> 8, (g * vb) >> 8, (b * vb) >> 8, 0)
                 else:
                     # Fade out
-                    r, g, b, w = strip[led_index]
-                    strip[led_index] = (r * 9 // 10, g * 9 // 10, b * 9 // 10, w * 9 // 10)
+                    r, g, b, w = pixels[led_index]
+                    pixels[led_index] = (r * 9 // 10, g * 9 // 10, b * 9 // 10, w * 9 // 10)
+            strip[0:_n] = pixels
 
-def update_party_wave(frame, brightness):
+def update_party_wave(frame, brightness, _lut=HUE_LUT, _sin=SIN_TABLE, _write=write_all_strips, _offsets=WAVE_OFFSETS):
     """Wave animation moving across strips"""
-    wave_speed = 0.3
-    wave_length = LEDS_PER_STRIP * 2
-    for strip_index, strip in enumerate(strips):
-        for led_index in range(LEDS_PER_STRIP):
-            # Create wave effect across strips
-            wave_pos = (frame * wave_speed + strip_index * 2 + led_index * 0.5) % wave_length
-            wave_intensity = (math.sin(wave_pos * math.pi / wave_length) + 1) / 2
-            hue = ((frame * 2 + strip_index * 51) % 256)
-            r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness * wave_intensity))
-            strip[led_index] = (r, g, b, w)
-
-def update_party_strip_chase(frame, brightness):
+    bv = int(255 * brightness)
+    base_hue = frame * 2
+    # Wave covers half a sine turn (phase 0-127); 0.3 positions per frame is 2.4 steps
+    frame_phase = frame * 12 // 5
+    colors = []
+    append = colors.append
+    for hue_offset, phase_offset in _offsets:
+        # Create wave effect across strips
+        r, g, b = _lut[(base_hue + hue_offset) & 0xFF]
+        vb = (bv * _sin[(frame_phase + phase_offset) & 0x7F]) >> 8
+        append(((r * vb) >> 8, (g * vb) >> 8, (b * vb) >> 8, 0))
+    _write(colors)
+
+def update_party_strip_chase(frame, brightness, _strips=strips, _lut=HUE_LUT, _n=LEDS_PER_STRIP, _total=TOTAL_LEDS):
     """Chase effect that moves between strips"""
     # Clear all strips
-    for strip in strips:
-        strip.fill((0, 0, 0, 0))
+    clear_strips()
     
     # Calculate which strip and LED position
-    total_positions = NUM_STRIPS * LEDS_PER_STRIP
-    chase_pos = frame % total_positions
-    strip_index = chase_pos // LEDS_PER_STRIP
-    led_index = chase_pos % LEDS_PER_STRIP
+    chase_pos = frame % _total
+    strip_index = chase_pos // _n
+    led_index = chase_pos % _n
     
     # Set the chase LED
-    hue = (frame * 10) % 256
-    r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness))
-    strips[strip_index][led_index] = (r, g, b, w)
+    vb = int(255 * brightness)
+    r, g, b = _lut[(frame * 10) % 256]
+    r, g, b = (r * vb) >> 8, (g * vb) >> 8, (b * vb) >> 8
+    _strips[strip_index][led_index] = (r, g, b, 0)
     
     # Add trailing effect
     for i in range(1, 4):
-        prev_pos = (chase_pos - i) % total_positions
-        prev_strip = prev_pos // LEDS_PER_STRIP
-        prev_led = prev_pos % LEDS_PER_STRIP
-        fade = int(255 * brightness * (1.0 - i * 0.25))
+        prev_pos = (chase_pos - i) % _total
+        prev_strip = prev_pos // _n
+        prev_led = prev_pos % _n
+        fade = vb * (4 - i) // 4  # 75%, 50%, 25%
         if fade > 0:
-            strips[prev_strip][prev_led] = (r * fade // 255, g * fade // 255, b * fade // 255, w * fade // 255)
+            _strips[prev_strip][prev_led] = (r * fade // 255, g * fade // 255, b * fade // 255, 0)
 
-def update_party_alternating(frame, brightness):
+def update_party_alternating(frame, brightness, _strips=strips, _lut=HUE_LUT):
     """Alternating colors between strips"""
-    for strip_index, strip in enumerate(strips):
+    vb = int(255 * brightness)
+    for strip_index, strip in enumerate(_strips):
         # Alternate between two colors
         color_index = (strip_index + (frame // 10)) % 2
         if color_index == 0:
             hue = (frame * 3) % 256
         else:
             hue = ((frame * 3) + 128) % 256
-        r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness))
-        strip.fill((r, g, b, w))
+        r, g, b = _lut[hue]
+        strip.fill(((r * vb) >> 8, (g * vb) >> 8, (b * vb) >> 8, 0))
 
-def update_party_spiral(frame, brightness):
+def update_party_spiral(frame, brightness, _lut=HUE_LUT, _sin=SIN_TABLE, _write=write_all_strips, _offsets=SPIRAL_OFFSETS):
     """Spiral effect rotating across strips"""
-    spiral_speed = 0.2
-    for strip_index, strip in enumerate(strips):
-        for led_index in range(LEDS_PER_STRIP):
-            # Create spiral effect
-            angle = (frame * spiral_speed + strip_index * 0.4 + led_index * 0.3) % (math.pi * 2)
-            spiral_intensity = (math.sin(angle) + 1) / 2
-            hue = ((frame * 2 + strip_index * 51 + led_index * 8) % 256)
-            r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness * (0.3 + spiral_intensity * 0.7)))
-            strip[led_index] = (r, g, b, w)
-
-def update_party_fireworks(frame, brightness):
+    bv = int(255 * brightness)
+    base_hue = frame * 2
+    # 0.2 rad per frame is ~8.15 phase steps per frame
+    frame_phase = frame * 163 // 20
+    colors = []
+    append = colors.append
+    for hue_offset, phase_offset in _offsets:
+        # Create spiral effect
+        spiral_intensity = _sin[(frame_phase + phase_offset) & 0xFF]
+        vb = (bv * (77 + ((179 * spiral_intensity) >> 8))) >> 8  # 30% to 100%
+        r, g, b = _lut[(base_hue + hue_offset) & 0xFF]
+        append(((r * vb) >> 8, (g * vb) >> 8, (b * vb) >> 8, 0))
+    _write(colors)
+
+def update_party_fireworks(frame, brightness, _strips=strips, _lut=HUE_LUT, _rand=fast_rand, _fade=FADE92, _n=LEDS_PER_STRIP):
     """Random fireworks bursts on different strips"""
     if frame % 5 == 0:  # Update every 5 frames
         # Random chance to create new firework
-        if random.randint(0, 100) < 20:  # 20% chance
-            strip_index = random.randint(0, NUM_STRIPS - 1)
-            led_index = random.randint(0, LEDS_PER_STRIP - 1)
-            hue = random.randint(0, 255)
-            r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness))
-            strips[strip_index][led_index] = (r, g, b, w)
+        if _rand() % 100 < 20:  # 20% chance
+            strip_index = _rand() % NUM_STRIPS
+            led_index = _rand() % _n
+            vb = int(255 * brightness)
+            r, g, b = _lut[_rand() & 0xFF]
+            _strips[strip_index][led_index] = ((r * vb) >> 8, (g * vb) >> 8, (b * vb) >> 8, 0)
     
     # Fade all LEDs
-    for strip in strips:
-        for led_index in range(LEDS_PER_STRIP):
-            r, g, b, w = strip[led_index]
-            strip[led_index] = (r * 92 // 100, g * 92 // 100, b * 92 // 100, w * 92 // 100)
+    for strip in _strips:
+        strip[0:_n] = [
+            (_fade[r], _fade[g], _fade[b], _fade[w])
+            for r, g, b, w in strip[0:_n]
+        ]
 
-def update_party_matrix(frame, brightness):
+def update_party_matrix(frame, brightness, _strips=strips, _lut=HUE_LUT, _rand=fast_rand, _fade=FADE85, _n=LEDS_PER_STRIP):
     """Matrix rain effect across strips"""
     if frame % 2 == 0:  # Update every 2 frames
-        for strip_index, strip in enumerate(strips):
-            # Shift all LEDs down
-            for led_index in range(LEDS_PER_STRIP - 1, 0, -1):
-                strip[led_index] = strip[led_index - 1]
-                # Fade as it falls
-                r, g, b, w = strip[led_index]
-                strip[led_index] = (r * 85 // 100, g * 85 // 100, b * 85 // 100, w * 85 // 100)
+        vb = int(255 * brightness)
+        for strip in _strips:
+            # Shift all LEDs down, fading as they fall
+            strip[1:_n] = [
+                (_fade[r], _fade[g], _fade[b], _fade[w])
+                for r, g, b, w in strip[0:_n - 1]
+            ]
             
             # Random chance to start new drop at top
-            if random.randint(0, 100) < 30:  # 30% chance
-                hue = random.randint(85, 170)  # Green-ish range
-                r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness))
-                strip[0] = (r, g, b, w)
+            if _rand() % 100 < 30:  # 30% chance
+                r, g, b = _lut[85 + _rand() % 86]  # Green-ish range
+                strip[0] = ((r * vb) >> 8, (g * vb) >> 8, (b * vb) >> 8, 0)
             else:
-                strip[0] = (0, 0, 0, 0)
+                strip[0] = OFF
+
+# Party animation functions, aligned 1:1 with PARTY_MODES
+PARTY_FNS = (
+    update_party_rainbow,
+    update_party_chase,
+    update_party_pulse,
+    update_party_twinkle,
+    update_party_wave,
+    update_party_strip_chase,
+    update_party_alternating,
+    update_party_spiral,
+    update_party_fireworks,
+    update_party_matrix,
+)
 
 # Main fade loop
-start_time = time.monotonic()
-last_update = start_time
-update_interval = 0.02  # Update every 20ms for smooth animation
-print_interval = 0.1  # Print brightness every 100ms
-last_print = start_time
+fade_duration_ns = int(FADE_DURATION * NS_PER_SECOND)
+start_ns = time.monotonic_ns()
+last_update_ns = start_ns
+update_interval_ns = 20000000  # Update every 20ms for smooth animation
+print_interval_ns = 100000000  # Print brightness every 100ms
+last_print_ns = start_ns
 
 while True:
-    current_time = time.monotonic()
-    elapsed = current_time - start_time
-    
-    # Track all brightness values to find the dimmest
-    brightness_values = []
+    now_ns = time.monotonic_ns()
+    elapsed_ns = now_ns - start_ns
     
-    # Update all LEDs
+    # Update all LEDs, one strip at a time
     all_at_max = True
     for strip_index, strip in enumerate(strips):
-        for led_index in range(LEDS_PER_STRIP):
-            led_start = led_start_times[strip_index][led_index]
-            
-            if elapsed < led_start:
+        colors = []
+        for led_start in led_start_ns[strip_index]:
+            if elapsed_ns < led_start:
                 # LED hasn't started yet - fully off
-                brightness = 0.0
+                scale = 0.0
                 all_at_max = False
             else:
                 # LED has started - calculate fade progress
-                fade_elapsed = elapsed - led_start
-                if fade_elapsed >= FADE_DURATION:
+                fade_elapsed = elapsed_ns - led_start
+                if fade_elapsed >= fade_duration_ns:
                     # Fully faded in
-                    brightness = TARGET_BRIGHTNESS
+                    scale = 1.0
                 else:
                     # Still fading - use smooth easing
-                    progress = fade_elapsed / FADE_DURATION
-                    eased_progress = ease_in_out(progress)
-                    brightness = eased_progress * TARGET_BRIGHTNESS
+                    scale = ease_in_out(fade_elapsed / fade_duration_ns)
                     all_at_max = False
             
-            # Store brightness value
-            brightness_values.append(brightness)
-            
-            # Apply brightness to this LED by scaling the color values
-            # brightness is 0.0 to TARGET_BRIGHTNESS, scale to 0.0 to 1.0
-            scale = brightness / TARGET_BRIGHTNESS if TARGET_BRIGHTNESS > 0 else 0.0
-            r, g, b, w = WARM_COLOR  # RGBW order: Red, Green, Blue, White
-            strip[led_index] = (
-                int(r * scale),
-                int(g * scale),
-                int(b * scale),
-                int(w * scale)
-            )
+            # Look up the warm color scaled to this LED's fade progress
+            colors.append(WARM_TABLE[int(scale * 255)])
+        
+        # Write the whole strip in one slice assignment
+        strip[0:LEDS_PER_STRIP] = colors
     
     # Find and print dimmest pixel brightness
-    if current_time - last_print >= print_interval:
-        if brightness_values:
-            dimmest_brightness = min(brightness_values)
-            print(f"Brightness (dimmest pixel): {dimmest_brightness:.4f} ({dimmest_brightness/TARGET_BRIGHTNESS*100:.2f}%)")
-        last_print = current_time
+    if now_ns - last_print_ns >= print_interval_ns:
+        progress = max(0.0, (elapsed_ns - last_led_start_ns) / fade_duration_ns)
+        dimmest = ease_in_out(progress) if progress < 1.0 else 1.0
+        dimmest_brightness = dimmest * TARGET_BRIGHTNESS
+        print(f"Brightness (dimmest pixel): {dimmest_brightness:.4f} ({dimmest*100:.2f}%)")
+        last_print_ns = now_ns
     
     # Show all strips
-    for strip in strips:
-        strip.show()
+    show_all_strips()
     
     # If all LEDs are at max, we're done fading
     if all_at_max:
         break
     
     # Sleep until next update
-    next_update = last_update + update_interval
-    sleep_time = max(0, next_update - current_time)
-    if sleep_time > 0:
-        time.sleep(sleep_time)
-    last_update = current_time
+    sleep_ns = last_update_ns + update_interval_ns - now_ns
+    if sleep_ns > 0:
+        time.sleep(sleep_ns / NS_PER_SECOND)
+    last_update_ns = now_ns
 
 # Hold at target brightness and monitor gestures/proximity
 print(f"Fade complete. All LEDs at {TARGET_BRIGHTNESS:.4f} brightness ({TARGET_BRIGHTNESS*100:.2f}%)")
@@ -362,29 +455,35 @@ print("Hold hand close for 3 seconds to enter Party Mode")
 current_brightness = TARGET_BRIGHTNESS
 leds_on = True  # Track if LEDs are on or off
 party_mode = False  # Track if in party mode
-last_gesture_time = time.monotonic()
-gesture_cooldown = 0.5  # Prevent gesture spam (0.5 seconds)
+last_gesture_ns = time.monotonic_ns()
+gesture_cooldown_ns = 500000000  # Prevent gesture spam (0.5 seconds)
+last_gesture_poll_ns = 0
+gesture_poll_interval_ns = 100000000  # Poll the gesture sensor every 100ms (I2C is slow)
 transition_speed = 0.02  # How fast to change brightness per update
 
 # Proximity tracking - simplified state machine
 proximity_state = "idle"  # idle, detecting, holding
-proximity_state_start = 0
+proximity_state_start_ns = 0
+proximity_hold_ns = int(PROXIMITY_HOLD_TIME * NS_PER_SECOND)
 party_frame = 0
-update_interval = 0.02  # Update every 20ms for smooth animation
-last_mode_switch_time = 0  # Cooldown after mode switch
-mode_switch_cooldown = 2.0  # Wait 2 seconds after switch before allowing another
-last_proximity_check = 0
-proximity_check_interval = 0.05  # Check proximity every 50ms
+update_interval_ns = 20000000  # Update every 20ms for smooth animation
+idle_interval_ns = 50000000  # Static light box: wake only as often as proximity is checked
+last_mode_switch_ns = 0  # Cooldown after mode switch
+mode_switch_cooldown_ns = 2000000000  # Wait 2 seconds after switch before allowing another
+last_proximity_check_ns = 0
+proximity_check_interval_ns = 50000000  # Check proximity every 50ms
+last_prox_print_ns = 0  # Last "Holding..." progress print (reset when back to idle)
+cooldown_warned_ns = 0  # Last cooldown warning print
 
 while True:
-    current_time = time.monotonic()
-    loop_start = current_time
+    now_ns = time.monotonic_ns()
+    loop_start_ns = now_ns
     
     # Check proximity more frequently with dedicated timing
-    if (current_time - last_proximity_check) >= proximity_check_interval:
-        last_proximity_check = current_time
-        cooldown_elapsed = current_time - last_mode_switch_time
-        can_switch = cooldown_elapsed >= mode_switch_cooldown
+    if (now_ns - last_proximity_check_ns) >= proximity_check_interval_ns:
+        last_proximity_check_ns = now_ns
+        cooldown_elapsed_ns = now_ns - last_mode_switch_ns
+        can_switch = cooldown_elapsed_ns >= mode_switch_cooldown_ns
         
         if GESTURE_ENABLED and apds:
             try:
@@ -394,27 +493,24 @@ while True:
                     # Proximity detected
                     if proximity_state == "idle":
                         proximity_state = "detecting"
-                        proximity_state_start = current_time
+                        proximity_state_start_ns = now_ns
                         print(f"Proximity detected! Hold for {PROXIMITY_HOLD_TIME}s...")
                     elif proximity_state == "detecting":
                         # Still detecting, check if we've held long enough
-                        elapsed = current_time - proximity_state_start
+                        held_ns = now_ns - proximity_state_start_ns
                         # Print progress every 0.5 seconds
-                        if not hasattr(apds, '_last_prox_print'):
-                            apds._last_prox_print = 0
-                        if (current_time - apds._last_prox_print) >= 0.5:
-                            print(f"  Holding... {elapsed:.1f}s / {PROXIMITY_HOLD_TIME}s (proximity: {proximity})")
-                            apds._last_prox_print = current_time
+                        if (now_ns - last_prox_print_ns) >= 500000000:
+                            print(f"  Holding... {held_ns / NS_PER_SECOND:.1f}s / {PROXIMITY_HOLD_TIME}s (proximity: {proximity})")
+                            last_prox_print_ns = now_ns
                         
                         # Check if held long enough
-                        if elapsed >= PROXIMITY_HOLD_TIME:
+                        if held_ns >= proximity_hold_ns:
                             if can_switch:
-                                print(f"*** SWITCHING MODE! *** Elapsed: {elapsed:.2f}s")
+                                print(f"*** SWITCHING MODE! *** Elapsed: {held_ns / NS_PER_SECOND:.2f}s")
                                 party_mode = not party_mode
                                 proximity_state = "idle"
-                                last_mode_switch_time = current_time
-                                if hasattr(apds, '_last_prox_print'):
-                                    delattr(apds, '_last_prox_print')
+                                last_mode_switch_ns = now_ns
+                                last_prox_print_ns = 0
                                 if party_mode:
                                     print("PARTY MODE ACTIVATED!")
                                     print(f"Mode: {PARTY_MODES[party_mode_index]}, Brightness: {PARTY_BRIGHTNESS_LEVELS[party_brightness_index]*100:.0f}%")
@@ -434,12 +530,12 @@ while True:
                                     )
                                     for strip in strips:
                                         strip.fill(color)
-                                        strip.show()
+                                    show_all_strips()
                             else:
                                 # Can't switch yet, but keep holding
-                                if not hasattr(apds, '_cooldown_warned') or (current_time - apds._cooldown_warned) >= 1.0:
-                                    print(f"  Held long enough but in cooldown ({cooldown_elapsed:.1f}s / {mode_switch_cooldown}s)")
-                                    apds._cooldown_warned = current_time
+                                if (now_ns - cooldown_warned_ns) >= NS_PER_SECOND:
+                                    print(f"  Held long enough but in cooldown ({cooldown_elapsed_ns / NS_PER_SECOND:.1f}s / {mode_switch_cooldown_ns / NS_PER_SECOND}s)")
+                                    cooldown_warned_ns = now_ns
                     # If state is "holding", we just switched, so ignore
                 else:
                     # Proximity lost
@@ -447,86 +543,62 @@ while True:
                         # Reset to idle
                         proximity_state = "idle"
                         print("Proximity lost, resetting timer")
-                        if hasattr(apds, '_last_prox_print'):
-                            delattr(apds, '_last_prox_print')
+                        last_prox_print_ns = 0
             except Exception as e:
                 print(f"Error reading proximity: {e}")
     
+    # Poll for gestures on their own cadence (only if not detecting proximity)
+    gesture = 0  # 0 = NONE
+    if (GESTURE_ENABLED and apds and proximity_state != "detecting"
+            and (now_ns - last_gesture_ns) >= gesture_cooldown_ns
+            and (now_ns - last_gesture_poll_ns) >= gesture_poll_interval_ns):
+        last_gesture_poll_ns = now_ns
+        try:
+            gesture = apds.gesture()
+        except Exception:
+            pass  # Ignore gesture errors
+        if gesture != 0:
+            last_gesture_ns = now_ns
+    
     # Handle mode-specific logic
     if party_mode:
         # PARTY MODE
         party_frame += 1
+        steady = False
         
-        # Check for gestures in party mode (only if not detecting proximity)
-        if GESTURE_ENABLED and apds and proximity_state != "detecting" and (current_time - last_gesture_time) >= gesture_cooldown:
-            try:
-                gesture = apds.gesture()
-                if gesture != 0:
-                    last_gesture_time = current_time
-                    
-                    if gesture == 1:  # UP - change party mode
-                        party_mode_index = (party_mode_index + 1) % len(PARTY_MODES)
-                        print(f"Party Mode: {PARTY_MODES[party_mode_index]}")
-                    elif gesture == 2:  # DOWN - change brightness
-                        party_brightness_index = (party_brightness_index + 1) % len(PARTY_BRIGHTNESS_LEVELS)
-                        print(f"Party Brightness: {PARTY_BRIGHTNESS_LEVELS[party_brightness_index]*100:.0f}%")
-            except Exception:
-                pass  # Ignore gesture errors
+        # Gestures in party mode
+        if gesture == 1:  # UP - change party mode
+            party_mode_index = (party_mode_index + 1) % len(PARTY_MODES)
+            print(f"Party Mode: {PARTY_MODES[party_mode_index]}")
+        elif gesture == 2:  # DOWN - change brightness
+            party_brightness_index = (party_brightness_index + 1) % len(PARTY_BRIGHTNESS_LEVELS)
+            print(f"Party Brightness: {PARTY_BRIGHTNESS_LEVELS[party_brightness_index]*100:.0f}%")
         
         # Update party animation
         party_brightness = PARTY_BRIGHTNESS_LEVELS[party_brightness_index]
         
-        if PARTY_MODES[party_mode_index] == "Rainbow":
-            update_party_rainbow(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Chase":
-            update_party_chase(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Pulse":
-            update_party_pulse(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Twinkle":
-            update_party_twinkle(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Wave":
-            update_party_wave(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Strip Chase":
-            update_party_strip_chase(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Alternating":
-            update_party_alternating(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Spiral":
-            update_party_spiral(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Fireworks":
-            update_party_fireworks(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Matrix":
-            update_party_matrix(party_frame, party_brightness)
+        PARTY_FNS[party_mode_index](party_frame, party_brightness)
         
         # Show all strips
-        for strip in strips:
-            strip.show()
+        show_all_strips()
         
     else:
         # LIGHT BOX MODE
-        # Check for gestures (only if not detecting proximity)
-        if GESTURE_ENABLED and apds and proximity_state != "detecting" and (current_time - last_gesture_time) >= gesture_cooldown:
-            try:
-                gesture = apds.gesture()
-                if gesture != 0:  # 0 = NONE
-                    last_gesture_time = current_time
-                    
-                    # Gesture values: 1=UP, 2=DOWN, 3=LEFT, 4=RIGHT
-                    if gesture == 1:  # UP - cycle through brightness modes
-                        if leds_on:
-                            current_mode_index = (current_mode_index + 1) % len(BRIGHTNESS_MODES)
-                            new_target = BRIGHTNESS_MODES[current_mode_index]
-                            TARGET_BRIGHTNESS = new_target
-                            print(f"Gesture UP: Switching to {new_target*100:.0f}% brightness")
-                        else:
-                            print("Gesture UP: LEDs are off, swipe DOWN to turn on")
-                    elif gesture == 2:  # DOWN - toggle on/off
-                        leds_on = not leds_on
-                        if leds_on:
-                            print(f"Gesture DOWN: Turning ON at {TARGET_BRIGHTNESS*100:.0f}% brightness")
-                        else:
-                            print("Gesture DOWN: Turning OFF")
-            except Exception:
-                pass  # Ignore gesture errors
+        # Gesture values: 1=UP, 2=DOWN, 3=LEFT, 4=RIGHT
+        if gesture == 1:  # UP - cycle through brightness modes
+            if leds_on:
+                current_mode_index = (current_mode_index + 1) % len(BRIGHTNESS_MODES)
+                new_target = BRIGHTNESS_MODES[current_mode_index]
+                TARGET_BRIGHTNESS = new_target
+                print(f"Gesture UP: Switching to {new_target*100:.0f}% brightness")
+            else:
+                print("Gesture UP: LEDs are off, swipe DOWN to turn on")
+        elif gesture == 2:  # DOWN - toggle on/off
+            leds_on = not leds_on
+            if leds_on:
+                print(f"Gesture DOWN: Turning ON at {TARGET_BRIGHTNESS*100:.0f}% brightness")
+            else:
+                print("Gesture DOWN: Turning OFF")
         
         # Determine target brightness based on on/off state
         if leds_on:
@@ -535,7 +607,8 @@ while True:
             target_brightness = 0.0
         
         # Smoothly transition to target brightness
-        if abs(current_brightness - target_brightness) > 0.001:
+        steady = abs(current_brightness - target_brightness) <= 0.001
+        if not steady:
             # Smooth transition
             if current_brightness < target_brightness:
                 current_brightness = min(current_brightness + transition_speed, target_brightness)
@@ -554,11 +627,11 @@ while True:
             
             for strip in strips:
                 strip.fill(color)
-                strip.show()
+            show_all_strips()
     
-    # Sleep to maintain consistent loop timing (proximity checked every iteration)
-    elapsed_in_loop = time.monotonic() - loop_start
-    sleep_time = max(0, update_interval - elapsed_in_loop)
-    if sleep_time > 0:
-        time.sleep(sleep_time)
+    # Sleep to maintain consistent loop timing; wake less often while the light box is static
+    loop_interval_ns = idle_interval_ns if steady else update_interval_ns
+    sleep_ns = loop_interval_ns - (time.monotonic_ns() - loop_start_ns)
+    if sleep_ns > 0:
+        time.sleep(sleep_ns / NS_PER_SECOND)
 
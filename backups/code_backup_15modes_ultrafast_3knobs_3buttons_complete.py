@@ -3,7 +3,6 @@
 
 """Three rotary encoders controlling 24 LED RGBW Neopixel ring with animation modes."""
 
-import time
 import board
 import neopixel
 import random
@@ -43,6 +42,9 @@ BRIGHTNESS_CHANGE_RATE = 0.01  # Brightness change per encoder step
 # Animation Direction
 REVERSE_DIRECTION_DEFAULT = False  # Default animation direction (False = forward)
 
+# Input Polling
+INPUT_POLL_FRAMES = 4  # Read encoders/buttons once every N frames (fewer I2C transactions)
+
 # Animation Modes List
 ANIMATION_MODES = [
     "Solid Color",
@@ -110,9 +112,18 @@ button_color_held = False
 button_index_held = False
 
 # Neopixel setup
-pixels = neopixel.NeoPixel(NEOPIXEL_PIN, NUM_PIXELS, brightness=BRIGHTNESS_DEFAULT,
+# Brightness is baked into the palettes (see set_brightness), so the driver runs at 1.0
+pixels = neopixel.NeoPixel(NEOPIXEL_PIN, NUM_PIXELS, brightness=1.0,
                           pixel_order=PIXEL_ORDER, auto_write=False)
 
+# Reusable frame buffer, written to the strip with a single slice assignment
+FRAME = [(0, 0, 0, 0)] * NUM_PIXELS
+
+# Per-pixel offsets that only depend on NUM_PIXELS, precomputed once
+HUE_OFFSETS = tuple(i * 256 // NUM_PIXELS for i in range(NUM_PIXELS))  # Rainbow, Color Wave
+DROP_OFFSETS = tuple(i * 3 for i in range(NUM_PIXELS))                # Matrix Rain drop position
+DROP_HUE_OFFSETS = tuple(i * 10 for i in range(NUM_PIXELS))           # Matrix Rain hue
+
 # Runtime control parameters (initialized from config)
 BRIGHTNESS = BRIGHTNESS_DEFAULT
 hue_value = HUE_DEFAULT
@@ -134,7 +145,6 @@ print("=" * 50)
 
 def wheel(pos):
     """Generate rainbow colors across 0-255 positions (RGBW)."""
-    pos = pos % 256
     if pos < 85:
         return (255 - pos * 3, pos * 3, 0, 0)
     elif pos < 170:
@@ -144,6 +154,9 @@ def wheel(pos):
         pos -= 170
         return (pos * 3, 0, 255 - pos * 3, 0)
 
+# Rainbow colors for every wheel position, indexed with a masked byte
+WHEEL_LUT = tuple(wheel(i) for i in range(256))
+
 def hsv_to_rgbw(h, s=255, v=255):
     """Convert HSV to RGBW. h=0-255, s=0-255, v=0-255."""
     h = h % 256
@@ -160,207 +173,275 @@ def hsv_to_rgbw(h, s=255, v=255):
     q = (v * (255 - ((s * remainder) >> 8))) >> 8
     t = (v * (255 - ((s * (255 - remainder)) >> 8))) >> 8
     
-    if region == 0:
-        r, g, b = v, t, p
-    elif region == 1:
-        r, g, b = q, v, p
-    elif region == 2:
-        r, g, b = p, v, t
-    elif region == 3:
-        r, g, b = p, q, v
-    elif region == 4:
-        r, g, b = t, p, v
-    else:
-        r, g, b = v, p, q
-    
-    return (r, g, b, 0)
+    # Channel permutation per hue region (0-5), indexed instead of branched
+    return ((v, q, p, p, t, v)[region],
+            (t, v, v, q, p, p)[region],
+            (p, p, t, v, v, q)[region],
+            0)
 
-def update_animation():
-    """Update pixels based on current animation mode."""
-    global animation_frame
-    
-    # Calculate speed divisor (1=fastest, 100=slowest)
-    # Lower speed_div = faster animation
-    # When animation_speed = 1, multiply frame by 1000 for 1000x speed
-    if animation_speed == ANIMATION_SPEED_MIN:
-        effective_frame = animation_frame * 1000
-        speed_div = 1
+def hsv255_to_rgbw(h, v):
+    """Full-saturation hsv_to_rgbw(h, 255, v) without clamping. h and v must be 0-255."""
+    region = h // 43
+    remainder = (h - (region * 43)) * 6
+    # With s=255, p is always 0
+    q = (v * (255 - ((255 * remainder) >> 8))) >> 8
+    t = (v * (255 - ((255 * (255 - remainder)) >> 8))) >> 8
+    return ((v, q, 0, 0, t, v)[region],
+            (t, v, v, q, 0, 0)[region],
+            (0, 0, t, v, v, q)[region],
+            0)
+
+# Full-saturation, full-value colors for every hue (HUE_LUT[h] == hsv_to_rgbw(h, 255, 255))
+HUE_LUT = tuple(hsv255_to_rgbw(h, 255) for h in range(256))
+
+def fire_color(intensity):
+    """Map a 0-255 fire intensity to a black-red-yellow-white RGBW color."""
+    if intensity < 85:
+        return (intensity * 3, intensity // 3, 0, 0)
+    elif intensity < 170:
+        return (255, (intensity - 85) * 3, 0, 0)
     else:
-        effective_frame = animation_frame
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-    
-    if ANIMATION_MODE == 0:  # Solid Color
-        color = hsv_to_rgbw(hue_value, 255, 255)
-        pixels.fill(color)
-    
-    elif ANIMATION_MODE == 1:  # Rainbow Rotate
-        direction = -1 if reverse_direction else 1
-        for i in range(NUM_PIXELS):
-            pixel_hue = ((i * 256 // NUM_PIXELS) + hue_value + (effective_frame * direction)) % 256
-            pixels[i] = wheel(pixel_hue)
-    
-    elif ANIMATION_MODE == 2:  # Chase/Spinner
-        pixels.fill((0, 0, 0, 0))
-        direction = -1 if reverse_direction else 1
-        chase_pos = ((effective_frame * direction) // speed_div) % NUM_PIXELS
-        if chase_pos < 0:
-            chase_pos = NUM_PIXELS + chase_pos
-        color = hsv_to_rgbw(hue_value, 255, 255)
-        for offset in range(3):
-            idx = (chase_pos + offset) % NUM_PIXELS
-            fade = 255 - (offset * 85)
-            r, g, b, w = color
-            pixels[idx] = (r * fade // 255, g * fade // 255, b * fade // 255, w * fade // 255)
-    
-    elif ANIMATION_MODE == 3:  # Pulse/Breathe
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-        pulse_phase = (effective_frame * 2 // speed_div) % 512
-        if pulse_phase < 256:
-            brightness_factor = pulse_phase
+        return (255, 255, (intensity - 170) * 3, 0)
+
+# Fire palette indexed by intensity, so the Fire mode needs no per-pixel branching
+FIRE_LUT = tuple(fire_color(i) for i in range(256))
+
+def scale_color(color, scale):
+    """Scale an RGBW color by a 16.16 fixed-point factor (65536 = unchanged)."""
+    r, g, b, w = color
+    return ((r * scale) >> 16, (g * scale) >> 16, (b * scale) >> 16, (w * scale) >> 16)
+
+def set_brightness(level):
+    """Rebuild the brightness-scaled palettes for a 0.0-1.0 brightness level."""
+    global BRIGHTNESS_SCALE, SCALED_HUE_LUT, SCALED_WHEEL_LUT, SCALED_FIRE_LUT
+    BRIGHTNESS_SCALE = int(level * 65536)
+    SCALED_HUE_LUT = tuple(scale_color(c, BRIGHTNESS_SCALE) for c in HUE_LUT)
+    SCALED_WHEEL_LUT = tuple(scale_color(c, BRIGHTNESS_SCALE) for c in WHEEL_LUT)
+    SCALED_FIRE_LUT = tuple(scale_color(c, BRIGHTNESS_SCALE) for c in FIRE_LUT)
+
+set_brightness(BRIGHTNESS)
+
+# Xorshift PRNG state for Twinkle (16-bit keeps every value a small int)
+_rng = random.getrandbits(16) or 0xACE1
+
+def fast_rand():
+    """Cheap 16-bit xorshift random number, 1-65535."""
+    global _rng
+    x = _rng
+    x ^= (x << 7) & 0xFFFF
+    x ^= x >> 9
+    x ^= (x << 8) & 0xFFFF
+    _rng = x
+    return x
+
+# Trail shapes for render_trail: (offset from head, value 0-255, hue shift)
+CHASE_TRAIL = ((0, 255, 0), (1, 170, 0), (2, 85, 0))
+SCANNER_TRAIL = ((0, 255, 0), (-1, 128, 0))
+KNIGHT_TRAIL = ((0, 255, 0), (-1, 128, 0), (-2, 64, 0))
+BOUNCE_TRAIL = ((0, 255, 0), (-1, 128, 0), (1, 128, 0))
+COMET_TRAIL = ((0, 255, 0), (-1, 204, 20), (-2, 153, 40), (-3, 102, 60), (-4, 51, 80))
+
+def render_trail(head, trail, step=1, wrap=True, pixel_hue_step=0):
+    """Clear the strip and draw a head plus its trail at the current hue and brightness.
+    
+    Trail offsets are multiplied by step (-1 mirrors the trail). Without wrap,
+    pixels falling off either end of the strip are skipped.
+    """
+    px = pixels
+    n = NUM_PIXELS
+    lut = SCALED_HUE_LUT
+    scale = BRIGHTNESS_SCALE
+    hue = hue_value
+    px.fill((0, 0, 0, 0))
+    for offset, value, hue_shift in trail:
+        idx = head + offset * step
+        if wrap:
+            idx %= n
+        elif idx < 0 or idx >= n:
+            continue
+        h = (hue + hue_shift + idx * pixel_hue_step) & 0xFF
+        if value == 255:
+            px[idx] = lut[h]
         else:
-            brightness_factor = 512 - pulse_phase
-        brightness_factor = 50 + (brightness_factor * 205 // 255)
-        color = hsv_to_rgbw(hue_value, 255, brightness_factor)
-        pixels.fill(color)
-    
-    elif ANIMATION_MODE == 4:  # Fire/Lava
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-        for i in range(NUM_PIXELS):
-            base_intensity = (i * 37 + (effective_frame * 3 // speed_div)) % 256
-            intensity = (base_intensity + (i % 3) * 20) % 256
-            if intensity < 85:
-                pixels[i] = (intensity * 3, intensity // 3, 0, 0)
-            elif intensity < 170:
-                pixels[i] = (255, (intensity - 85) * 3, 0, 0)
+            px[idx] = hsv255_to_rgbw(h, (value * scale) >> 16)
+
+def mode_solid(frame, speed_div, hue, direction):
+    """Solid Color"""
+    pixels.fill(SCALED_HUE_LUT[hue])
+    return (hue, BRIGHTNESS_SCALE)
+
+def mode_rainbow(frame, speed_div, hue, direction, _px=pixels, _n=NUM_PIXELS, _frame=FRAME, _offsets=HUE_OFFSETS):
+    """Rainbow Rotate"""
+    wheel_lut = SCALED_WHEEL_LUT
+    phase = hue + frame * direction
+    for i in range(_n):
+        _frame[i] = wheel_lut[(_offsets[i] + phase) & 0xFF]
+    _px[0:_n] = _frame
+
+def mode_chase(frame, speed_div, hue, direction):
+    """Chase/Spinner"""
+    render_trail(((frame * direction) // speed_div) % NUM_PIXELS, CHASE_TRAIL)
+
+def mode_pulse(frame, speed_div, hue, direction):
+    """Pulse/Breathe"""
+    pulse_phase = (frame * 2 // speed_div) % 512
+    if pulse_phase < 256:
+        brightness_factor = pulse_phase
+    else:
+        brightness_factor = 512 - pulse_phase
+    brightness_factor = 50 + (brightness_factor * 205 // 255)
+    pixels.fill(hsv255_to_rgbw(hue, (brightness_factor * BRIGHTNESS_SCALE) >> 16))
+
+def mode_fire(frame, speed_div, hue, direction, _px=pixels, _n=NUM_PIXELS, _frame=FRAME):
+    """Fire/Lava"""
+    phase = frame * 3 // speed_div
+    fire_lut = SCALED_FIRE_LUT
+    for i in range(_n):
+        _frame[i] = fire_lut[(i * 37 + phase + (i % 3) * 20) & 0xFF]
+    _px[0:_n] = _frame
+
+def mode_twinkle(frame, speed_div, hue, direction, _px=pixels, _n=NUM_PIXELS, _frame=FRAME, _rand=fast_rand):
+    """Twinkle"""
+    if frame % (speed_div * 2) == 0:
+        lut = SCALED_HUE_LUT
+        _frame[0:_n] = _px[0:_n]
+        for i in range(_n):
+            if _rand() % 101 < 10:
+                _frame[i] = lut[(hue + _rand() % 61 - 30) & 0xFF]
             else:
-                pixels[i] = (255, 255, (intensity - 170) * 3, 0)
-    
-    elif ANIMATION_MODE == 5:  # Twinkle
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-        if effective_frame % (speed_div * 2) == 0:
-            for i in range(NUM_PIXELS):
-                if random.randint(0, 100) < 10:
-                    pixels[i] = hsv_to_rgbw(hue_value + random.randint(-30, 30), 255, 255)
-                else:
-                    r, g, b, w = pixels[i]
-                    pixels[i] = (r * 9 // 10, g * 9 // 10, b * 9 // 10, w * 9 // 10)
-    
-    elif ANIMATION_MODE == 6:  # Color Wave
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-        direction = -1 if reverse_direction else 1
-        for i in range(NUM_PIXELS):
-            wave_pos = (i * 256 // NUM_PIXELS + (effective_frame * direction // speed_div)) % 256
-            wave_hue = (hue_value + int(128 * (1 + (wave_pos / 128 - 1) ** 2))) % 256
-            pixels[i] = hsv_to_rgbw(wave_hue, 255, 255)
-    
-    elif ANIMATION_MODE == 7:  # Scanner
-        pixels.fill((0, 0, 0, 0))
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-        direction = -1 if reverse_direction else 1
-        scan_pos = ((effective_frame * direction) // speed_div) % (NUM_PIXELS * 2)
-        if scan_pos < 0:
-            scan_pos = NUM_PIXELS * 2 + scan_pos
-        if scan_pos < NUM_PIXELS:
-            color = hsv_to_rgbw(hue_value, 255, 255)
-            pixels[scan_pos] = color
-            if scan_pos > 0:
-                fade_color = hsv_to_rgbw(hue_value, 255, 128)
-                pixels[scan_pos - 1] = fade_color
-        else:
-            reverse_pos = NUM_PIXELS * 2 - scan_pos - 1
-            color = hsv_to_rgbw(hue_value, 255, 255)
-            pixels[reverse_pos] = color
-            if reverse_pos < NUM_PIXELS - 1:
-                fade_color = hsv_to_rgbw(hue_value, 255, 128)
-                pixels[reverse_pos + 1] = fade_color
-    
-    elif ANIMATION_MODE == 8:  # Knight Rider
-        pixels.fill((0, 0, 0, 0))
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-        direction = -1 if reverse_direction else 1
-        pos = ((effective_frame * direction) // speed_div) % (NUM_PIXELS * 2)
-        if pos < 0:
-            pos = NUM_PIXELS * 2 + pos
-        if pos < NUM_PIXELS:
-            pixels[pos] = hsv_to_rgbw(hue_value, 255, 255)
-            if pos > 0:
-                pixels[pos - 1] = hsv_to_rgbw(hue_value, 255, 128)
-            if pos > 1:
-                pixels[pos - 2] = hsv_to_rgbw(hue_value, 255, 64)
+                r, g, b, w = _frame[i]
+                _frame[i] = (r * 9 // 10, g * 9 // 10, b * 9 // 10, w * 9 // 10)
+        _px[0:_n] = _frame
+
+def mode_wave(frame, speed_div, hue, direction, _px=pixels, _n=NUM_PIXELS, _frame=FRAME, _offsets=HUE_OFFSETS):
+    """Color Wave"""
+    lut = SCALED_HUE_LUT
+    phase = frame * direction // speed_div
+    hue_base = hue + 128
+    for i in range(_n):
+        wave_offset = ((_offsets[i] + phase) & 0xFF) - 128
+        _frame[i] = lut[(hue_base + ((wave_offset * wave_offset) >> 7)) & 0xFF]
+    _px[0:_n] = _frame
+
+def mode_scanner(frame, speed_div, hue, direction, _trail=SCANNER_TRAIL):
+    """Scanner (also Knight Rider with a longer trail)"""
+    pos = ((frame * direction) // speed_div) % (NUM_PIXELS * 2)
+    if pos < NUM_PIXELS:
+        render_trail(pos, _trail, wrap=False)
+    else:
+        render_trail(NUM_PIXELS * 2 - pos - 1, _trail, step=-1, wrap=False)
+
+def mode_knight_rider(frame, speed_div, hue, direction):
+    """Knight Rider"""
+    mode_scanner(frame, speed_div, hue, direction, KNIGHT_TRAIL)
+
+def mode_matrix(frame, speed_div, hue, direction, _px=pixels, _n=NUM_PIXELS, _frame=FRAME, _hsv=hsv255_to_rgbw,
+                _drop_offsets=DROP_OFFSETS, _hue_offsets=DROP_HUE_OFFSETS):
+    """Matrix Rain"""
+    scale = BRIGHTNESS_SCALE
+    phase = frame // speed_div
+    span = _n * 2
+    for i in range(_n):
+        drop_pos = (_drop_offsets[i] + phase) % span
+        if drop_pos < _n:
+            intensity = 255 - (drop_pos * 255 // _n)
+            _frame[i] = _hsv((hue + _hue_offsets[i]) & 0xFF, (intensity * scale) >> 16)
         else:
-            rpos = NUM_PIXELS * 2 - pos - 1
-            pixels[rpos] = hsv_to_rgbw(hue_value, 255, 255)
-            if rpos < NUM_PIXELS - 1:
-                pixels[rpos + 1] = hsv_to_rgbw(hue_value, 255, 128)
-            if rpos < NUM_PIXELS - 2:
-                pixels[rpos + 2] = hsv_to_rgbw(hue_value, 255, 64)
-    
-    elif ANIMATION_MODE == 9:  # Matrix Rain
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-        for i in range(NUM_PIXELS):
-            drop_pos = (i * 3 + (effective_frame // speed_div)) % (NUM_PIXELS * 2)
-            if drop_pos < NUM_PIXELS:
-                intensity = 255 - (drop_pos * 255 // NUM_PIXELS)
-                pixels[i] = hsv_to_rgbw((hue_value + i * 10) % 256, 255, intensity)
-            else:
-                pixels[i] = (0, 0, 0, 0)
-    
-    elif ANIMATION_MODE == 10:  # Plasma
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-        for i in range(NUM_PIXELS):
-            angle1 = (i * 2 + effective_frame // speed_div) % 256
-            angle2 = (i * 3 + effective_frame // speed_div * 2) % 256
-            plasma = ((angle1 + angle2) // 2) % 256
-            pixels[i] = hsv_to_rgbw((hue_value + plasma) % 256, 255, 255)
-    
-    elif ANIMATION_MODE == 11:  # Spiral
-        pixels.fill((0, 0, 0, 0))
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-        direction = -1 if reverse_direction else 1
-        spiral_pos = ((effective_frame * direction) // speed_div) % NUM_PIXELS
-        for i in range(3):
-            idx = (spiral_pos + i) % NUM_PIXELS
-            fade = 255 - (i * 85)
-            pixels[idx] = hsv_to_rgbw((hue_value + idx * 10) % 256, 255, fade)
-    
-    elif ANIMATION_MODE == 12:  # Bounce
+            _frame[i] = (0, 0, 0, 0)
+    _px[0:_n] = _frame
+
+def mode_plasma(frame, speed_div, hue, direction, _px=pixels, _n=NUM_PIXELS, _frame=FRAME):
+    """Plasma"""
+    lut = SCALED_HUE_LUT
+    phase1 = frame // speed_div
+    phase2 = phase1 * 2
+    for i in range(_n):
+        angle1 = (i * 2 + phase1) & 0xFF
+        angle2 = (i * 3 + phase2) & 0xFF
+        _frame[i] = lut[(hue + ((angle1 + angle2) >> 1)) & 0xFF]
+    _px[0:_n] = _frame
+
+def mode_spiral(frame, speed_div, hue, direction):
+    """Spiral"""
+    render_trail(((frame * direction) // speed_div) % NUM_PIXELS, CHASE_TRAIL, pixel_hue_step=10)
+
+def mode_bounce(frame, speed_div, hue, direction):
+    """Bounce"""
+    bounce_pos = abs(((frame * direction) // speed_div) % (NUM_PIXELS * 2 - 2) - (NUM_PIXELS - 1))
+    render_trail(bounce_pos, BOUNCE_TRAIL, wrap=False)
+
+def mode_strobe(frame, speed_div, hue, direction):
+    """Strobe"""
+    strobe_on = (frame // speed_div) % 2 == 0
+    if strobe_on:
+        pixels.fill(SCALED_HUE_LUT[hue])
+    else:
         pixels.fill((0, 0, 0, 0))
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-        direction = -1 if reverse_direction else 1
-        bounce_pos = abs(((effective_frame * direction) // speed_div) % (NUM_PIXELS * 2 - 2) - (NUM_PIXELS - 1))
-        pixels[bounce_pos] = hsv_to_rgbw(hue_value, 255, 255)
-        if bounce_pos > 0:
-            pixels[bounce_pos - 1] = hsv_to_rgbw(hue_value, 255, 128)
-        if bounce_pos < NUM_PIXELS - 1:
-            pixels[bounce_pos + 1] = hsv_to_rgbw(hue_value, 255, 128)
-    
-    elif ANIMATION_MODE == 13:  # Strobe
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-        if (effective_frame // speed_div) % 2 == 0:
-            pixels.fill(hsv_to_rgbw(hue_value, 255, 255))
-        else:
-            pixels.fill((0, 0, 0, 0))
+    return (hue, BRIGHTNESS_SCALE, strobe_on)
+
+def mode_comet(frame, speed_div, hue, direction):
+    """Comet"""
+    render_trail(((frame * direction) // speed_div) % NUM_PIXELS, COMET_TRAIL)
+
+# Mode functions indexed by ANIMATION_MODE (same order as ANIMATION_MODES).
+# Static modes return a key describing their frame; None means the frame always changes.
+MODE_FNS = (
+    mode_solid,
+    mode_rainbow,
+    mode_chase,
+    mode_pulse,
+    mode_fire,
+    mode_twinkle,
+    mode_wave,
+    mode_scanner,
+    mode_knight_rider,
+    mode_matrix,
+    mode_plasma,
+    mode_spiral,
+    mode_bounce,
+    mode_strobe,
+    mode_comet,
+)
+
+def set_speed(speed):
+    """Cache the frame multiplier and divisor for an animation speed (1=fastest, 100=slowest)."""
+    global FRAME_MUL, SPEED_DIV
+    # Lower speed_div = faster animation
+    # When animation_speed = 1, multiply frame by 1000 for 1000x speed
+    if speed == ANIMATION_SPEED_MIN:
+        FRAME_MUL = 1000
+        SPEED_DIV = 1
+    else:
+        FRAME_MUL = 1
+        SPEED_DIV = max(1, speed // ANIMATION_SPEED_DIVISOR)
+
+set_speed(animation_speed)
+
+last_frame_key = None
+
+def update_animation():
+    """Update pixels based on current animation mode."""
+    global animation_frame, last_frame_key
     
-    elif ANIMATION_MODE == 14:  # Comet
-        pixels.fill((0, 0, 0, 0))
-        speed_div = max(1, animation_speed // ANIMATION_SPEED_DIVISOR)
-        direction = -1 if reverse_direction else 1
-        comet_pos = ((effective_frame * direction) // speed_div) % NUM_PIXELS
-        if comet_pos < 0:
-            comet_pos = NUM_PIXELS + comet_pos
-        for i in range(5):
-            idx = (comet_pos - i) % NUM_PIXELS
-            fade = 255 - (i * 51)
-            pixels[idx] = hsv_to_rgbw((hue_value + i * 20) % 256, 255, fade)
+    direction = -1 if reverse_direction else 1
+    frame_key = MODE_FNS[ANIMATION_MODE](animation_frame * FRAME_MUL, SPEED_DIV, hue_value, direction)
     
-    pixels.show()
+    # Only resend the strip when the frame can differ from the one already shown
+    if frame_key is None or frame_key != last_frame_key:
+        pixels.show()
+    last_frame_key = frame_key
     animation_frame += 1
 
 # Main loop
-last_update = time.monotonic()
+poll_countdown = 0
 
 while True:
-    current_time = time.monotonic()
+    # Knobs and buttons are only read every INPUT_POLL_FRAMES frames
+    if poll_countdown:
+        poll_countdown -= 1
+        update_animation()
+        continue
+    poll_countdown = INPUT_POLL_FRAMES - 1
     
     # Read encoder positions with error handling
     try:
@@ -389,7 +470,7 @@ while True:
     if pos_color != last_pos_color:
         change = pos_color - last_pos_color
         BRIGHTNESS = max(BRIGHTNESS_MIN, min(MAX_BRIGHTNESS, BRIGHTNESS + (change * BRIGHTNESS_CHANGE_RATE)))
-        pixels.brightness = BRIGHTNESS
+        set_brightness(BRIGHTNESS)
         print(f"Brightness: {int(BRIGHTNESS * 100)}%")
         last_pos_color = pos_color
     
@@ -397,25 +478,28 @@ while True:
     if pos_index != last_pos_index:
         change = pos_index - last_pos_index
         animation_speed = max(ANIMATION_SPEED_MIN, min(ANIMATION_SPEED_MAX, animation_speed + change))
+        set_speed(animation_speed)
         print(f"Animation Speed: {animation_speed} (1=fastest, 100=slowest)")
         last_pos_index = pos_index
     
     # Handle button 1: Next animation mode
     try:
-        if not button_brightness.value and not button_brightness_held:
+        pressed = not button_brightness.value  # One I2C read per button per loop
+        if pressed and not button_brightness_held:
             button_brightness_held = True
             ANIMATION_MODE = (ANIMATION_MODE + 1) % len(ANIMATION_MODES)
             animation_frame = 0  # Reset animation frame when changing modes
             print(f"Animation Mode: {ANIMATION_MODES[ANIMATION_MODE]}")
         
-        if button_brightness.value and button_brightness_held:
+        if not pressed and button_brightness_held:
             button_brightness_held = False
     except (OSError, AttributeError):
         pass  # Encoder not available, skip button handling
     
     # Handle button 2: Randomize all settings
     try:
-        if not button_color.value and not button_color_held:
+        pressed = not button_color.value
+        if pressed and not button_color_held:
             button_color_held = True
             # Random brightness (MIN_BRIGHTNESS to MAX_BRIGHTNESS)
             BRIGHTNESS = random.uniform(BRIGHTNESS_MIN, MAX_BRIGHTNESS)
@@ -423,30 +507,30 @@ while True:
             hue_value = random.randint(0, 255)
             # Random animation speed
             animation_speed = random.randint(ANIMATION_SPEED_MIN, ANIMATION_SPEED_MAX)
+            set_speed(animation_speed)
             # Random direction
             reverse_direction = random.choice([True, False])
-            pixels.brightness = BRIGHTNESS
+            set_brightness(BRIGHTNESS)
             print(f"Randomized: Brightness={int(BRIGHTNESS*100)}%, Hue={hue_value}, Speed={animation_speed}, Direction={'Reversed' if reverse_direction else 'Normal'}")
         
-        if button_color.value and button_color_held:
+        if not pressed and button_color_held:
             button_color_held = False
     except (OSError, AttributeError):
         pass  # Encoder not available, skip button handling
     
     # Handle button 3: Reverse animation direction
     try:
-        if not button_index.value and not button_index_held:
+        pressed = not button_index.value
+        if pressed and not button_index_held:
             button_index_held = True
             reverse_direction = not reverse_direction
             direction_text = "Reversed" if reverse_direction else "Normal"
             print(f"Animation Direction: {direction_text}")
         
-        if button_index.value and button_index_held:
+        if not pressed and button_index_held:
             button_index_held = False
     except (OSError, AttributeError):
         pass  # Encoder not available, skip button handling
     
     # Update animation as fast as possible (no throttling for smooth animations)
     update_animation()
-    
-    time.sleep(0.0001)  # Ultra-minimal delay (0.1ms) for maximum refresh rate
@@ -11,7 +11,7 @@ import time
 import board
 import neopixel
 import math
-import random
+import os
 
 # Configuration
 NUM_STRIPS = 9
@@ -26,6 +26,8 @@ DEFAULT_BRIGHTNESS = 0.05  # 5% - dim default for menorah
 
 # Brightness modes (0.0 to 1.0)
 BRIGHTNESS_MODES = [0.25, 0.50, 0.75, 0.99]  # 25%, 50%, 75%, 99%
+# Brightness -> Q8 WARM_COLOR scale (the top mode maps to 256, i.e. full WARM_COLOR)
+BRIGHTNESS_TO_Q8 = 256 / BRIGHTNESS_MODES[-1] if BRIGHTNESS_MODES[-1] > 0 else 0
 current_mode_index = 0  # Start at first brightness mode
 TARGET_BRIGHTNESS = DEFAULT_BRIGHTNESS  # Start at dim default
 
@@ -91,6 +93,8 @@ except Exception as e:
     apds = None
 
 # Initialize NeoPixel strips
+# On RP2040 show() goes through neopixel_write, which clocks the bits out with a
+# PIO state machine, so no per-bit CPU bit-banging happens here
 strips = []
 for i, pin in enumerate(STRIP_PINS):
     strip = neopixel.NeoPixel(
@@ -102,6 +106,36 @@ for i, pin in enumerate(STRIP_PINS):
     )
     strips.append(strip)
 
+# Solid color last written to each strip by fill_strip (None = drawn some other way)
+strip_colors = [None] * NUM_STRIPS
+# Strips whose buffer changed since it was last sent
+strip_dirty = [True] * NUM_STRIPS
+
+def fill_strip(strip_index, color):
+    """Fill one strip with a solid color, marking it dirty only if the color changed"""
+    if strip_colors[strip_index] != color:
+        strips[strip_index].fill(color)
+        strip_colors[strip_index] = color
+        strip_dirty[strip_index] = True
+
+def show_dirty_strips():
+    """Send only the strips whose buffers changed since they were last sent"""
+    for strip_index in range(NUM_STRIPS):
+        if strip_dirty[strip_index]:
+            strips[strip_index].show()
+            strip_dirty[strip_index] = False
+
+def show_all_strips():
+    """Send every strip's buffer back-to-back once all buffers are filled
+    The NeoPixel buffers act as the back buffer: animations draw into them
+    while nothing is being sent, and show() then streams them out in one burst.
+    Used after per-pixel drawing, so the fill_strip color tracking is reset.
+    """
+    for strip_index, strip in enumerate(strips):
+        strip.show()
+        strip_colors[strip_index] = None
+        strip_dirty[strip_index] = False
+
 # Set all LEDs to warm color
 for strip in strips:
     strip.fill(WARM_COLOR)
@@ -130,6 +164,9 @@ def ease_in_out(t):
     return t * t * (3.0 - 2.0 * t)
 
 # Party mode animation functions
+# (r, g, b) source indices into (v, p, t, q) for each of the six hue regions
+HSV_SECTORS = ((0, 2, 1), (3, 0, 1), (1, 0, 2), (1, 3, 0), (2, 1, 0), (0, 1, 3))
+
 def hsv_to_rgbw(h, s=255, v=255):
     """Convert HSV to RGBW. h=0-255, s=0-255, v=0-255."""
     h = h % 256
@@ -146,82 +183,130 @@ def hsv_to_rgbw(h, s=255, v=255):
     q = (v * (255 - ((s * remainder) >> 8))) >> 8
     t = (v * (255 - ((s * (255 - remainder)) >> 8))) >> 8
     
-    if region == 0:
-        r, g, b = v, t, p
-    elif region == 1:
-        r, g, b = q, v, p
-    elif region == 2:
-        r, g, b = p, v, t
-    elif region == 3:
-        r, g, b = p, q, v
-    elif region == 4:
-        r, g, b = t, p, v
-    else:
-        r, g, b = v, p, q
-    
-    return (r, g, b, 0)
-
-def update_party_rainbow(frame, brightness):
+    vals = (v, p, t, q)
+    r_src, g_src, b_src = HSV_SECTORS[region]
+    return (vals[r_src], vals[g_src], vals[b_src], 0)
+
+# Sine table over one full turn in 256 phase steps, scaled to 0-255 (i.e. (sin + 1) / 2 * 255)
+SIN_TABLE = bytes(int((math.sin(i * 2 * math.pi / 256) + 1) * 127.5) for i in range(256))
+SIN_STEPS_PER_RADIAN = 256 / (2 * math.pi)  # Radians -> SIN_TABLE index
+
+# Per-channel fade tables for Twinkle (90%), Fireworks (92%) and Matrix (85%)
+FADE90 = bytes(i * 9 // 10 for i in range(256))
+FADE92 = bytes(i * 92 // 100 for i in range(256))
+FADE85 = bytes(i * 85 // 100 for i in range(256))
+
+# Full-saturation hue table for the current party value, rebuilt only when the value changes
+_hue_lut_v = -1
+_hue_lut = None
+
+def get_hue_lut(v):
+    """Return a 256-entry table of hsv_to_rgbw(h, 255, v) colors indexed by hue"""
+    global _hue_lut_v, _hue_lut
+    if v != _hue_lut_v:
+        _hue_lut = tuple(hsv_to_rgbw(h, 255, v) for h in range(256))
+        _hue_lut_v = v
+    return _hue_lut
+
+# Per-LED offsets for each strip; only the frame term changes per frame
+RAINBOW_OFFSETS = tuple(
+    tuple(strip_index * 32 + led_index * 4 for led_index in range(LEDS_PER_STRIP))
+    for strip_index in range(NUM_STRIPS)
+)
+WAVE_OFFSETS = tuple(
+    tuple(strip_index * 2 + led_index * 0.5 for led_index in range(LEDS_PER_STRIP))
+    for strip_index in range(NUM_STRIPS)
+)
+SPIRAL_OFFSETS = tuple(
+    tuple(strip_index * 0.4 + led_index * 0.3 for led_index in range(LEDS_PER_STRIP))
+    for strip_index in range(NUM_STRIPS)
+)
+
+def update_party_rainbow(frame, brightness, _strips=strips, _n=LEDS_PER_STRIP, _offsets=RAINBOW_OFFSETS):
     """Rainbow animation for party mode"""
-    for strip_index, strip in enumerate(strips):
-        for led_index in range(LEDS_PER_STRIP):
-            # Create rainbow effect
-            hue = ((frame * 2 + strip_index * 32 + led_index * 4) % 256)
-            r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness))
-            strip[led_index] = (r, g, b, w)
+    lut = get_hue_lut(int(255 * brightness))
+    base_hue = frame * 2
+    for strip, offsets in zip(_strips, _offsets):
+        # Create rainbow effect - build the whole strip, then write it in one slice
+        strip[0:_n] = [lut[(base_hue + offset) % 256] for offset in offsets]
+
+# LEDs lit by the previous Chase / Strip Chase frame as (strip, led); None = clear every strip
+_chase_lit = None
+
+def clear_chase_lit():
+    """Turn off only the LEDs the previous chase frame lit (or everything after a mode change)"""
+    if _chase_lit is None:
+        for strip in strips:
+            strip.fill((0, 0, 0, 0))
+    else:
+        for strip_index, led_index in _chase_lit:
+            strips[strip_index][led_index] = (0, 0, 0, 0)
 
 def update_party_chase(frame, brightness):
     """Chase animation for party mode"""
+    global _chase_lit
+    clear_chase_lit()
+    # Every strip uses the same head color this frame
+    color = get_hue_lut(int(255 * brightness))[(frame * 5) % 256]
+    r, g, b, w = color
+    trail = (r // 2, g // 2, b // 2, w // 2)
+    lit = []
     for strip_index, strip in enumerate(strips):
-        strip.fill((0, 0, 0, 0))
         chase_pos = (frame + strip_index * 2) % LEDS_PER_STRIP
-        r, g, b, w = hsv_to_rgbw((frame * 5) % 256, 255, int(255 * brightness))
-        strip[chase_pos] = (r, g, b, w)
+        strip[chase_pos] = color
+        lit.append((strip_index, chase_pos))
         if chase_pos > 0:
-            fade = int(255 * brightness * 0.5)
-            strip[chase_pos - 1] = (r // 2, g // 2, b // 2, w // 2)
+            strip[chase_pos - 1] = trail
+            lit.append((strip_index, chase_pos - 1))
+    _chase_lit = lit
 
 def update_party_pulse(frame, brightness):
     """Pulse animation for party mode"""
-    pulse = (math.sin(frame * 0.1) + 1) / 2  # 0 to 1
+    pulse = SIN_TABLE[int(frame * 0.1 * SIN_STEPS_PER_RADIAN) & 0xFF] / 255  # 0 to 1
     pulse_brightness = brightness * (0.3 + pulse * 0.7)
     r, g, b, w = hsv_to_rgbw((frame * 3) % 256, 255, int(255 * pulse_brightness))
     color = (r, g, b, w)
     for strip in strips:
         strip.fill(color)
 
-def update_party_twinkle(frame, brightness):
+def update_party_twinkle(frame, brightness, _strips=strips, _n=LEDS_PER_STRIP, _urandom=os.urandom, _fade=FADE90):
     """Twinkle animation for party mode"""
     if frame % 3 == 0:  # Update every 3 frames
-        for strip in strips:
-            for led_index in range(LEDS_PER_STRIP):
-                if random.randint(0, 100) < 15:  # 15% chance to twinkle
-                    hue = random.randint(0, 255)
-                    r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness))
-                    strip[led_index] = (r, g, b, w)
-                else:
-                    # Fade out
-                    r, g, b, w = strip[led_index]
-                    strip[led_index] = (r * 9 // 10, g * 9 // 10, b * 9 // 10, w * 9 // 10)
-
-def update_party_wave(frame, brightness):
+        lut = get_hue_lut(int(255 * brightness))
+        rng = _urandom(NUM_STRIPS * _n * 2)  # Chance byte + hue byte for every LED
+        k = 0
+        for strip in _strips:
+            # Fade the whole strip in one pass, then drop in the new twinkles
+            pixels = [(_fade[r], _fade[g], _fade[b], _fade[w]) for r, g, b, w in strip[0:_n]]
+            for led_index in range(_n):
+                if rng[k] < 38:  # ~15% chance to twinkle
+                    pixels[led_index] = lut[rng[k + 1]]
+                k += 2
+            strip[0:_n] = pixels
+
+def update_party_wave(frame, brightness, _strips=strips, _n=LEDS_PER_STRIP, _sin=SIN_TABLE, _hsv=hsv_to_rgbw, _offsets=WAVE_OFFSETS):
     """Wave animation moving across strips"""
     wave_speed = 0.3
-    wave_length = LEDS_PER_STRIP * 2
-    for strip_index, strip in enumerate(strips):
-        for led_index in range(LEDS_PER_STRIP):
+    wave_length = _n * 2
+    bv = 255 * brightness
+    frame_pos = frame * wave_speed
+    for strip_index, strip in enumerate(_strips):
+        # Hue is constant along a strip
+        hue = ((frame * 2 + strip_index * 51) % 256)
+        pixels = []
+        for offset in _offsets[strip_index]:
             # Create wave effect across strips
-            wave_pos = (frame * wave_speed + strip_index * 2 + led_index * 0.5) % wave_length
-            wave_intensity = (math.sin(wave_pos * math.pi / wave_length) + 1) / 2
-            hue = ((frame * 2 + strip_index * 51) % 256)
-            r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness * wave_intensity))
-            strip[led_index] = (r, g, b, w)
+            wave_pos = (frame_pos + offset) % wave_length
+            # sin(wave_pos * pi / wave_length): half a turn across the wave length
+            wave_intensity = _sin[int(wave_pos * 128 / wave_length) & 0xFF] / 255
+            pixels.append(_hsv(hue, 255, int(bv * wave_intensity)))
+        strip[0:_n] = pixels
 
 def update_party_strip_chase(frame, brightness):
     """Chase effect that moves between strips"""
-    # Clear all strips
-    for strip in strips:
-        strip.fill((0, 0, 0, 0))
+    global _chase_lit
+    # Clear the previous head and trail
+    clear_chase_lit()
     
     # Calculate which strip and LED position
     total_positions = NUM_STRIPS * LEDS_PER_STRIP
@@ -231,8 +316,9 @@ def update_party_strip_chase(frame, brightness):
     
     # Set the chase LED
     hue = (frame * 10) % 256
-    r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness))
+    r, g, b, w = get_hue_lut(int(255 * brightness))[hue]
     strips[strip_index][led_index] = (r, g, b, w)
+    lit = [(strip_index, led_index)]
     
     # Add trailing effect
     for i in range(1, 4):
@@ -242,66 +328,80 @@ def update_party_strip_chase(frame, brightness):
         fade = int(255 * brightness * (1.0 - i * 0.25))
         if fade > 0:
             strips[prev_strip][prev_led] = (r * fade // 255, g * fade // 255, b * fade // 255, w * fade // 255)
+            lit.append((prev_strip, prev_led))
+    _chase_lit = lit
 
 def update_party_alternating(frame, brightness):
     """Alternating colors between strips"""
+    lut = get_hue_lut(int(255 * brightness))
+    color_a = lut[(frame * 3) % 256]
+    color_b = lut[((frame * 3) + 128) % 256]
     for strip_index, strip in enumerate(strips):
         # Alternate between two colors
         color_index = (strip_index + (frame // 10)) % 2
-        if color_index == 0:
-            hue = (frame * 3) % 256
-        else:
-            hue = ((frame * 3) + 128) % 256
-        r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness))
-        strip.fill((r, g, b, w))
+        strip.fill(color_a if color_index == 0 else color_b)
 
-def update_party_spiral(frame, brightness):
+def update_party_spiral(frame, brightness, _strips=strips, _n=LEDS_PER_STRIP, _sin=SIN_TABLE, _hsv=hsv_to_rgbw, _offsets=SPIRAL_OFFSETS):
     """Spiral effect rotating across strips"""
     spiral_speed = 0.2
-    for strip_index, strip in enumerate(strips):
-        for led_index in range(LEDS_PER_STRIP):
+    bv = 255 * brightness
+    frame_angle = frame * spiral_speed
+    for strip_index, strip in enumerate(_strips):
+        offsets = _offsets[strip_index]
+        pixels = []
+        for led_index in range(_n):
             # Create spiral effect
-            angle = (frame * spiral_speed + strip_index * 0.4 + led_index * 0.3) % (math.pi * 2)
-            spiral_intensity = (math.sin(angle) + 1) / 2
+            angle = (frame_angle + offsets[led_index]) % (math.pi * 2)
+            spiral_intensity = _sin[int(angle * SIN_STEPS_PER_RADIAN) & 0xFF] / 255
             hue = ((frame * 2 + strip_index * 51 + led_index * 8) % 256)
-            r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness * (0.3 + spiral_intensity * 0.7)))
-            strip[led_index] = (r, g, b, w)
+            pixels.append(_hsv(hue, 255, int(bv * (0.3 + spiral_intensity * 0.7))))
+        strip[0:_n] = pixels
 
-def update_party_fireworks(frame, brightness):
+def update_party_fireworks(frame, brightness, _strips=strips, _n=LEDS_PER_STRIP, _urandom=os.urandom, _fade=FADE92):
     """Random fireworks bursts on different strips"""
     if frame % 5 == 0:  # Update every 5 frames
         # Random chance to create new firework
-        if random.randint(0, 100) < 20:  # 20% chance
-            strip_index = random.randint(0, NUM_STRIPS - 1)
-            led_index = random.randint(0, LEDS_PER_STRIP - 1)
-            hue = random.randint(0, 255)
-            r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness))
-            strips[strip_index][led_index] = (r, g, b, w)
+        rng = _urandom(4)
+        if rng[0] < 51:  # ~20% chance
+            strip_index = rng[1] % NUM_STRIPS
+            led_index = rng[2] % _n
+            hue = rng[3]
+            _strips[strip_index][led_index] = get_hue_lut(int(255 * brightness))[hue]
     
     # Fade all LEDs
-    for strip in strips:
-        for led_index in range(LEDS_PER_STRIP):
-            r, g, b, w = strip[led_index]
-            strip[led_index] = (r * 92 // 100, g * 92 // 100, b * 92 // 100, w * 92 // 100)
+    for strip in _strips:
+        strip[0:_n] = [(_fade[r], _fade[g], _fade[b], _fade[w]) for r, g, b, w in strip[0:_n]]
 
-def update_party_matrix(frame, brightness):
+def update_party_matrix(frame, brightness, _strips=strips, _n=LEDS_PER_STRIP, _urandom=os.urandom, _fade=FADE85):
     """Matrix rain effect across strips"""
     if frame % 2 == 0:  # Update every 2 frames
-        for strip_index, strip in enumerate(strips):
-            # Shift all LEDs down
-            for led_index in range(LEDS_PER_STRIP - 1, 0, -1):
-                strip[led_index] = strip[led_index - 1]
-                # Fade as it falls
-                r, g, b, w = strip[led_index]
-                strip[led_index] = (r * 85 // 100, g * 85 // 100, b * 85 // 100, w * 85 // 100)
+        lut = get_hue_lut(int(255 * brightness))
+        rng = _urandom(NUM_STRIPS * 2)  # Chance byte + hue byte for every strip
+        for strip_index, strip in enumerate(_strips):
+            # Shift all LEDs down, fading as they fall
+            falling = [(_fade[r], _fade[g], _fade[b], _fade[w]) for r, g, b, w in strip[0:_n - 1]]
             
             # Random chance to start new drop at top
-            if random.randint(0, 100) < 30:  # 30% chance
-                hue = random.randint(85, 170)  # Green-ish range
-                r, g, b, w = hsv_to_rgbw(hue, 255, int(255 * brightness))
-                strip[0] = (r, g, b, w)
+            if rng[strip_index * 2] < 77:  # ~30% chance
+                hue = 85 + rng[strip_index * 2 + 1] % 86  # Green-ish range (85-170)
+                top = lut[hue]
             else:
-                strip[0] = (0, 0, 0, 0)
+                top = (0, 0, 0, 0)
+            strip[0:_n] = [top] + falling
+
+# Party animation functions, aligned 1:1 with PARTY_MODES
+PARTY_FNS = (
+    update_party_rainbow,
+    update_party_chase,
+    update_party_pulse,
+    update_party_twinkle,
+    update_party_wave,
+    update_party_strip_chase,
+    update_party_alternating,
+    update_party_spiral,
+    update_party_fireworks,
+    update_party_matrix,
+)
 
 def update_shimmer(frame, base_brightness):
     """Shimmer effect - flowing brightness modulation across LEDs"""
@@ -310,48 +410,56 @@ def update_shimmer(frame, base_brightness):
         for led_index in range(LEDS_PER_STRIP):
             # Create flowing wave effect
             wave_pos = (frame * SHIMMER_SPEED + strip_index * 0.5 + led_index * 0.3)
-            shimmer_variation = (math.sin(wave_pos) + 1) / 2  # 0 to 1
+            shimmer_variation = SIN_TABLE[int(wave_pos * SIN_STEPS_PER_RADIAN) & 0xFF] / 255  # 0 to 1
             # Apply shimmer: base brightness ± variation amount
             shimmer_brightness = base_brightness * (1.0 - SHIMMER_BRIGHTNESS_AMOUNT + 
                                                    shimmer_variation * SHIMMER_BRIGHTNESS_AMOUNT * 2)
-            scale = shimmer_brightness / BRIGHTNESS_MODES[-1] if BRIGHTNESS_MODES[-1] > 0 else 0.0
+            scale_q8 = int(shimmer_brightness * BRIGHTNESS_TO_Q8)
             strip[led_index] = (
-                int(r * scale),
-                int(g * scale),
-                int(b * scale),
-                int(w * scale)
+                (r * scale_q8) >> 8,
+                (g * scale_q8) >> 8,
+                (b * scale_q8) >> 8,
+                (w * scale_q8) >> 8
             )
 
+# Flicker amount in Q8 and the flame scale at full (1.0) brightness
+MENORAH_FLICKER_Q8 = int(MENORAH_FLICKER_AMOUNT * 256)
+MENORAH_MAX_SCALE_Q8 = int(BRIGHTNESS_TO_Q8)
+
 def update_menorah_flame(frame, brightness):
     """Flame flicker effect for menorah candle (first strip)"""
-    # Oscillate between two colors with flicker
-    flicker = (math.sin(frame * MENORAH_FLICKER_SPEED) + 1) / 2  # 0 to 1
-    # Add random flicker variation
-    random_flicker = random.uniform(-MENORAH_FLICKER_AMOUNT, MENORAH_FLICKER_AMOUNT)
-    flicker_brightness = brightness * (1.0 + random_flicker)
-    flicker_brightness = max(0.0, min(1.0, flicker_brightness))  # Clamp to 0-1
+    # Add random flicker variation (+/- MENORAH_FLICKER_AMOUNT around the base brightness)
+    random_flicker = ((os.urandom(1)[0] - 128) * MENORAH_FLICKER_Q8) >> 7
+    scale_q8 = (int(brightness * BRIGHTNESS_TO_Q8) * (256 + random_flicker)) >> 8
+    # Clamp to 0-1 brightness
+    if scale_q8 < 0:
+        scale_q8 = 0
+    elif scale_q8 > MENORAH_MAX_SCALE_Q8:
+        scale_q8 = MENORAH_MAX_SCALE_Q8
     
     # Interpolate between two flame colors
     r1, g1, b1, w1 = MENORAH_FLAME_COLOR_1
     r2, g2, b2, w2 = MENORAH_FLAME_COLOR_2
     # Use flicker to blend between colors
-    blend = (math.sin(frame * MENORAH_FLICKER_SPEED * 0.7) + 1) / 2  # Slower color oscillation
-    r = int(r1 + (r2 - r1) * blend)
-    g = int(g1 + (g2 - g1) * blend)
-    b = int(b1 + (b2 - b1) * blend)
-    w = int(w1 + (w2 - w1) * blend)
+    blend = SIN_TABLE[int(frame * MENORAH_FLICKER_SPEED * 0.7 * SIN_STEPS_PER_RADIAN) & 0xFF]  # Slower color oscillation, 0-255
+    r = r1 + (r2 - r1) * blend // 255
+    g = g1 + (g2 - g1) * blend // 255
+    b = b1 + (b2 - b1) * blend // 255
+    w = w1 + (w2 - w1) * blend // 255
     
     # Apply brightness with flicker
-    scale = flicker_brightness / BRIGHTNESS_MODES[-1] if BRIGHTNESS_MODES[-1] > 0 else 0.0
     color = (
-        int(r * scale),
-        int(g * scale),
-        int(b * scale),
-        int(w * scale)
+        (r * scale_q8) >> 8,
+        (g * scale_q8) >> 8,
+        (b * scale_q8) >> 8,
+        (w * scale_q8) >> 8
     )
     
     # Apply to first strip (shamash candle)
-    strips[0].fill(color)
+    fill_strip(0, color)
+
+# (nights, brightness) currently drawn on the candle strips; None forces a redraw
+_last_menorah_key = None
 
 def update_menorah_strips(nights, brightness):
     """Light up the specified number of candles for menorah (reversed direction)
@@ -362,14 +470,21 @@ def update_menorah_strips(nights, brightness):
     Night 2: shamash + 2 candles (strips 7-8)
     ...
     Night 8: shamash + 8 candles (strips 1-8 - all of them)
+    Does nothing when the candle strips already show this night and brightness.
     """
+    global _last_menorah_key
+    key = (nights, brightness)
+    if key == _last_menorah_key:
+        return
+    _last_menorah_key = key
+    
     r, g, b, w = WARM_COLOR
-    scale = brightness / BRIGHTNESS_MODES[-1] if BRIGHTNESS_MODES[-1] > 0 else 0.0
+    scale_q8 = int(brightness * BRIGHTNESS_TO_Q8)
     color = (
-        int(r * scale),
-        int(g * scale),
-        int(b * scale),
-        int(w * scale)
+        (r * scale_q8) >> 8,
+        (g * scale_q8) >> 8,
+        (b * scale_q8) >> 8,
+        (w * scale_q8) >> 8
     )
     
     # Light up strips from the end backwards (strip 0 is the shamash with flame, always lit separately)
@@ -382,11 +497,11 @@ def update_menorah_strips(nights, brightness):
     
     for strip_index in range(end_strip, start_strip + 1):
         if strip_index >= 1 and strip_index < NUM_STRIPS:
-            strips[strip_index].fill(color)
+            fill_strip(strip_index, color)
     
     # Turn off remaining strips (strips before the lit ones)
     for strip_index in range(1, end_strip):
-        strips[strip_index].fill((0, 0, 0, 0))
+        fill_strip(strip_index, (0, 0, 0, 0))
 
 # Skip fade-in sequence - start directly with dim light
 print("Starting in Light Box Mode (dim default)")
@@ -414,6 +529,9 @@ last_mode_switch_time = 0  # Cooldown after mode switch
 mode_switch_cooldown = 2.0  # Wait 2 seconds after switch before allowing another
 last_proximity_check = 0
 proximity_check_interval = 0.05  # Check proximity every 50ms
+last_prox_print = 0  # Last "Holding..." progress print (reset when back to idle)
+cooldown_warned = 0  # Last cooldown warning print
+last_lightbox_key = None  # (leds_on, brightness) last drawn in light box mode; None forces a redraw
 
 while True:
     current_time = time.monotonic()
@@ -439,11 +557,9 @@ while True:
                         # Still detecting, check if we've held long enough
                         elapsed = current_time - proximity_state_start
                         # Print progress every 0.5 seconds
-                        if not hasattr(apds, '_last_prox_print'):
-                            apds._last_prox_print = 0
-                        if (current_time - apds._last_prox_print) >= 0.5:
+                        if (current_time - last_prox_print) >= 0.5:
                             print(f"  Holding... {elapsed:.1f}s / {PROXIMITY_HOLD_TIME}s (proximity: {proximity})")
-                            apds._last_prox_print = current_time
+                            last_prox_print = current_time
                         
                         # Check if held long enough
                         if elapsed >= PROXIMITY_HOLD_TIME:
@@ -455,6 +571,7 @@ while True:
                                     # Activate menorah mode
                                     menorah_mode = True
                                     leds_on = True
+                                    _last_menorah_key = None  # Other modes drew over the candle strips
                                     print("MENORAH MODE ACTIVATED!")
                                     print(f"Night: {MENORAH_NIGHTS[menorah_night_index]}, Brightness: {MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]*100:.0f}%")
                                     print("LEFT/RIGHT=change nights, UP/DOWN=change brightness")
@@ -468,6 +585,7 @@ while True:
                                 elif not menorah_mode:
                                     # Toggle party mode (existing behavior)
                                     party_mode = not party_mode
+                                    _chase_lit = None  # Strips hold light box colors, clear fully
                                     if party_mode:
                                         print("PARTY MODE ACTIVATED!")
                                         print(f"Mode: {PARTY_MODES[party_mode_index]}, Brightness: {PARTY_BRIGHTNESS_LEVELS[party_brightness_index]*100:.0f}%")
@@ -477,27 +595,26 @@ while True:
                                         # Immediately refresh LEDs to warm white
                                         leds_on = True
                                         current_brightness = TARGET_BRIGHTNESS
-                                        scale = current_brightness / BRIGHTNESS_MODES[-1] if BRIGHTNESS_MODES[-1] > 0 else 0.0
+                                        scale_q8 = int(current_brightness * BRIGHTNESS_TO_Q8)
                                         r, g, b, w = WARM_COLOR
                                         color = (
-                                            int(r * scale),
-                                            int(g * scale),
-                                            int(b * scale),
-                                            int(w * scale)
+                                            (r * scale_q8) >> 8,
+                                            (g * scale_q8) >> 8,
+                                            (b * scale_q8) >> 8,
+                                            (w * scale_q8) >> 8
                                         )
                                         for strip in strips:
                                             strip.fill(color)
-                                            strip.show()
+                                        show_all_strips()
                                 
                                 proximity_state = "idle"
                                 last_mode_switch_time = current_time
-                                if hasattr(apds, '_last_prox_print'):
-                                    delattr(apds, '_last_prox_print')
+                                last_prox_print = 0
                             else:
                                 # Can't switch yet, but keep holding
-                                if not hasattr(apds, '_cooldown_warned') or (current_time - apds._cooldown_warned) >= 1.0:
+                                if (current_time - cooldown_warned) >= 1.0:
                                     print(f"  Held long enough but in cooldown ({cooldown_elapsed:.1f}s / {mode_switch_cooldown}s)")
-                                    apds._cooldown_warned = current_time
+                                    cooldown_warned = current_time
                     # If state is "holding", we just switched, so ignore
                 else:
                     # Proximity lost
@@ -505,8 +622,7 @@ while True:
                         # Reset to idle
                         proximity_state = "idle"
                         print("Proximity lost, resetting timer")
-                        if hasattr(apds, '_last_prox_print'):
-                            delattr(apds, '_last_prox_print')
+                        last_prox_print = 0
             except Exception as e:
                 print(f"Error reading proximity: {e}")
     
@@ -547,9 +663,9 @@ while True:
         # Strips 1-8: light up candles for the current night
         update_menorah_strips(nights, menorah_brightness)
         
-        # Show all strips
-        for strip in strips:
-            strip.show()
+        # Show only strips that changed (usually just the shamash)
+        show_dirty_strips()
+        last_lightbox_key = None
         
     elif party_mode:
         # PARTY MODE
@@ -564,6 +680,7 @@ while True:
                     
                     if gesture == 1:  # UP - change party mode
                         party_mode_index = (party_mode_index + 1) % len(PARTY_MODES)
+                        _chase_lit = None  # Previous mode drew everywhere, clear fully
                         print(f"Party Mode: {PARTY_MODES[party_mode_index]}")
                     elif gesture == 2:  # DOWN - change brightness
                         party_brightness_index = (party_brightness_index + 1) % len(PARTY_BRIGHTNESS_LEVELS)
@@ -574,30 +691,11 @@ while True:
         # Update party animation
         party_brightness = PARTY_BRIGHTNESS_LEVELS[party_brightness_index]
         
-        if PARTY_MODES[party_mode_index] == "Rainbow":
-            update_party_rainbow(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Chase":
-            update_party_chase(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Pulse":
-            update_party_pulse(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Twinkle":
-            update_party_twinkle(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Wave":
-            update_party_wave(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Strip Chase":
-            update_party_strip_chase(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Alternating":
-            update_party_alternating(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Spiral":
-            update_party_spiral(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Fireworks":
-            update_party_fireworks(party_frame, party_brightness)
-        elif PARTY_MODES[party_mode_index] == "Matrix":
-            update_party_matrix(party_frame, party_brightness)
+        PARTY_FNS[party_mode_index](party_frame, party_brightness)
         
         # Show all strips
-        for strip in strips:
-            strip.show()
+        show_all_strips()
+        last_lightbox_key = None
         
     else:
         # LIGHT BOX MODE
@@ -641,25 +739,28 @@ while True:
                 current_brightness = max(current_brightness - transition_speed, target_brightness)
         
         # Apply brightness to all LEDs (no shimmer in light box mode)
-        if leds_on and current_brightness > 0:
-            scale = current_brightness / BRIGHTNESS_MODES[-1] if BRIGHTNESS_MODES[-1] > 0 else 0.0
+        lightbox_key = (leds_on, current_brightness)
+        if lightbox_key == last_lightbox_key:
+            pass  # Strips already hold this brightness
+        elif leds_on and current_brightness > 0:
+            scale_q8 = int(current_brightness * BRIGHTNESS_TO_Q8)
             r, g, b, w = WARM_COLOR
             color = (
-                int(r * scale),
-                int(g * scale),
-                int(b * scale),
-                int(w * scale)
+                (r * scale_q8) >> 8,
+                (g * scale_q8) >> 8,
+                (b * scale_q8) >> 8,
+                (w * scale_q8) >> 8
             )
-            for strip in strips:
-                strip.fill(color)
+            for strip_index in range(NUM_STRIPS):
+                fill_strip(strip_index, color)
         else:
             # LEDs off - clear all
-            for strip in strips:
-                strip.fill((0, 0, 0, 0))
+            for strip_index in range(NUM_STRIPS):
+                fill_strip(strip_index, (0, 0, 0, 0))
+        last_lightbox_key = lightbox_key
         
-        # Show all strips
-        for strip in strips:
-            strip.show()
+        # Show only strips that changed (none while the brightness is steady)
+        show_dirty_strips()
     
     # Sleep to maintain consistent loop timing (proximity checked every iteration)
     elapsed_in_loop = time.monotonic() - loop_start
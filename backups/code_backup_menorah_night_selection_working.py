@@ -7,6 +7,7 @@ Gesture control via APDS-9960: LEFT/RIGHT to change nights, UP/DOWN to change br
 """
 
 import time
+import asyncio
 import board
 import neopixel
 
@@ -24,6 +25,11 @@ WARM_COLOR = (50, 255, 5, 180)  # Warm white with slight green tint
 # Brightness levels available for menorah candles (0.0 to 1.0)
 MENORAH_BRIGHTNESS_LEVELS = [0.10, 0.20, 0.30, 0.40, 0.50]  # 10%, 20%, 30%, 40%, 50%
 menorah_brightness_index = 2  # Current brightness level index (starts at 30%)
+# Warm white candle color pre-scaled for each brightness level (same order as MENORAH_BRIGHTNESS_LEVELS)
+MENORAH_COLORS = tuple(
+    tuple(int(c * level) for c in WARM_COLOR)
+    for level in MENORAH_BRIGHTNESS_LEVELS
+)
 
 # Menorah Night Configuration
 # Number of candles to light for each night (1-8, not including shamash)
@@ -33,6 +39,8 @@ menorah_night_index = 0  # Current night index (starts at night 1)
 
 # Startup Configuration
 STARTUP_BRIGHTNESS = 0.30  # Brightness for startup LED (0.0 to 1.0)
+STARTUP_COLOR = tuple(int(c * STARTUP_BRIGHTNESS) for c in WARM_COLOR)  # Warm white at startup brightness
+OFF_COLOR = (0, 0, 0, 0)
 
 # Physical Candle-to-Strip Mapping (offset by one position)
 # This mapping defines which strip controls which night's candle
@@ -66,6 +74,11 @@ CANDLE_PINS = [
     board.D9,   # Night 8 (last candle)
 ]
 
+# APDS-9960 INT pin (active low) - set to the GPIO wired to the sensor's INT pin
+# so gestures are only read over I2C while a hand is near the sensor.
+# None = no INT wire, poll the sensor over I2C every loop
+GESTURE_INT_PIN = None
+
 # Initialize APDS-9960 Gesture Sensor
 # Used for gesture control: LEFT/RIGHT to change nights, UP/DOWN to change brightness
 try:
@@ -85,6 +98,13 @@ try:
     # Start with maximum sensitivity 
     apds.gesture_gain = 3  # Gesture sensitivity (0-3, higher = more sensitive) - trying maximum
     print(f"DEBUG: Gesture gain set to: {apds.gesture_gain}")
+    gesture_int = None
+    if GESTURE_INT_PIN is not None:
+        import digitalio
+        gesture_int = digitalio.DigitalInOut(GESTURE_INT_PIN)
+        gesture_int.pull = digitalio.Pull.UP  # INT is open-drain, pulled low when asserted
+        # Proximity interrupt asserts INT while something is close enough to start a gesture
+        apds.enable_proximity_interrupt = True
     time.sleep(0.5)  # Longer delay for sensor initialization
     GESTURE_ENABLED = True
     print("APDS-9960 gesture sensor is initialized")
@@ -92,6 +112,7 @@ except Exception as e:
     print(f"APDS-9960 not found: {e}")
     GESTURE_ENABLED = False
     apds = None
+    gesture_int = None
 
 # Initialize NeoPixel Strips
 # Create NeoPixel objects for shamash and candles separately
@@ -119,13 +140,32 @@ for pin in CANDLE_PINS:
     )
     candle_strips.append(strip)
 
+# Solid color last written to each candle strip (None = unknown, forces a write)
+candle_colors = [None] * len(candle_strips)
+# Candle strips whose buffer changed since it was last sent
+candle_dirty = [False] * len(candle_strips)
+
+
+def fill_candle(i, color):
+    """Fill one candle strip with a solid color, marking it dirty only if the color changed"""
+    if candle_colors[i] != color:
+        candle_strips[i].fill(color)
+        candle_colors[i] = color
+        candle_dirty[i] = True
+
+def show_dirty_candles():
+    """Send only the candle strips whose buffers changed since they were last sent"""
+    for i, strip in enumerate(candle_strips):
+        if candle_dirty[i]:
+            strip.show()
+            candle_dirty[i] = False
 
-def update_menorah_strips(nights, brightness):
+def update_menorah_strips(nights, brightness_index):
     """Light up the specified number of candles for the current night
     
     Args:
         nights: Number of candles to light (1-8), not including the shamash
-        brightness: Brightness level (0.0 to 1.0) to apply to all candles
+        brightness_index: Index into MENORAH_BRIGHTNESS_LEVELS to apply to all candles
     
     Note: The order of CANDLE_PINS array determines night order.
     Night 1: lights candle_strips[0] (first candle)
@@ -133,27 +173,41 @@ def update_menorah_strips(nights, brightness):
     ...
     Night 8: lights candle_strips[0-7] (all 8 candles)
     """
-    # Calculate warm white color with brightness scaling
-    r, g, b, w = WARM_COLOR
-    scale = brightness
-    color = (
-        int(r * scale),
-        int(g * scale),
-        int(b * scale),
-        int(w * scale)
-    )
+    # Warm white color with brightness scaling
+    color = MENORAH_COLORS[brightness_index]
     
     # Light up candles based on night number
     # Array order determines night order: [0] = Night 1, [1] = Night 2, etc.
+    # Whole-strip fill() is done in C by CircuitPython's pixelbuf, one call per strip
     for i in range(nights):
         if i < len(candle_strips):
-            candle_strips[i].fill(color)
+            fill_candle(i, color)
     
     # Turn off any candles that should not be lit
     for i in range(nights, len(candle_strips)):
-        candle_strips[i].fill((0, 0, 0, 0))
+        fill_candle(i, OFF_COLOR)
+
+def read_gesture():
+    """Read a gesture from the sensor, skipping the I2C read while INT is not asserted
+    
+    Returns 0 (no gesture) without touching the sensor when the INT pin is wired
+    and high (nothing near the sensor).
+    """
+    if gesture_int is not None:
+        if gesture_int.value:
+            return 0
+        gesture = apds.gesture()
+        apds.clear_interrupt()  # Re-arm INT (asserts again if the hand is still there)
+        return gesture
+    return apds.gesture()
 
-def select_startup_night():
+# Night step for each startup selection gesture (RIGHT confirms, LEFT is ignored)
+STARTUP_NIGHT_STEPS = {
+    0x02: 1,  # DOWN gesture -> increase night (1->2->...->8->1)
+    0x01: -1,  # UP gesture -> decrease night (8->7->...->1->8)
+}
+
+async def select_startup_night():
     """Startup night selection function
     
     Lights the first LED on the shamash candle (LED 0) and waits for
@@ -168,127 +222,132 @@ def select_startup_night():
     print("DOWN=increase night, UP=decrease night, LEFT=confirm and exit")
     
     # Clear all strips
-    shamash_strip.fill((0, 0, 0, 0))
+    shamash_strip.fill(OFF_COLOR)
     for strip in candle_strips:
-        strip.fill((0, 0, 0, 0))
+        strip.fill(OFF_COLOR)
     
     # Light first LED on shamash (LED 0) with startup brightness
-    r, g, b, w = WARM_COLOR
-    scale = STARTUP_BRIGHTNESS
-    startup_color = (
-        int(r * scale),
-        int(g * scale),
-        int(b * scale),
-        int(w * scale)
-    )
-    shamash_strip[0] = startup_color
+    shamash_strip[0] = STARTUP_COLOR
     shamash_strip.show()
     
     # State for gesture detection
-    last_gesture_time = time.monotonic()
     gesture_cooldown = 0.5  # Prevent gesture spam
     current_night_index = menorah_night_index  # Start with default night
     
     print(f"Current Night: {MENORAH_NIGHTS[current_night_index]}")
     
-    # Night selection loop
+    # Night selection loop - a gesture is followed by a cooldown sleep instead of a
+    # timestamp check, so no clock reads are needed (startup begins with one too).
+    # The startup LED shown above never changes here, so the loop does no LED writes
+    # or show() calls until a night is picked
+    await asyncio.sleep(gesture_cooldown)
     while True:
-        current_time = time.monotonic()
-        
         # Check for gestures
         if GESTURE_ENABLED and apds:
-            cooldown_elapsed = current_time - last_gesture_time
-            if cooldown_elapsed >= gesture_cooldown:
-                try:
-                    # Read gesture - Adafruit example uses 0x01-0x04 values
-                    gesture = apds.gesture()
-                    
-                    if gesture != 0:  # 0 = no gesture detected
-                        last_gesture_time = current_time
-                        
-                        # Adafruit gesture values: 0x01=UP, 0x02=DOWN, 0x03=LEFT, 0x04=RIGHT
-                        # Sensor is mounted sideways, so remap directions:
-                        # LEFT (0x03) -> UP (confirm), UP (0x01) -> RIGHT (decrease), 
-                        # RIGHT (0x04) -> DOWN (ignore), DOWN (0x02) -> LEFT (increase)
-                        # Note: Gestures 3 and 4 are swapped
-                        if gesture == 0x04 or gesture == 4:  # RIGHT gesture -> confirm selection and exit
-                            print(f"Night {MENORAH_NIGHTS[current_night_index]} selected")
-                            return current_night_index
-                        elif gesture == 0x02 or gesture == 2:  # DOWN gesture -> increase night (1->2->...->8->1)
-                            current_night_index = (current_night_index + 1) % len(MENORAH_NIGHTS)
-                            print(f"Night: {MENORAH_NIGHTS[current_night_index]}")
-                        elif gesture == 0x01 or gesture == 1:  # UP gesture -> decrease night (8->7->...->1->8)
-                            current_night_index = (current_night_index - 1) % len(MENORAH_NIGHTS)
-                            print(f"Night: {MENORAH_NIGHTS[current_night_index]}")
-                        elif gesture == 0x03 or gesture == 3:  # LEFT gesture -> not used in selection
-                            pass  # Ignore left gesture
-                except Exception:
-                    pass  # Ignore gesture errors
+            try:
+                # Read gesture - Adafruit example uses 0x01-0x04 values
+                gesture = read_gesture()
+                
+                if gesture != 0:  # 0 = no gesture detected
+                    # Adafruit gesture values: 0x01=UP, 0x02=DOWN, 0x03=LEFT, 0x04=RIGHT
+                    # Sensor is mounted sideways, so remap directions:
+                    # LEFT (0x03) -> UP (confirm), UP (0x01) -> RIGHT (decrease), 
+                    # RIGHT (0x04) -> DOWN (ignore), DOWN (0x02) -> LEFT (increase)
+                    # Note: Gestures 3 and 4 are swapped
+                    if gesture == 0x04:  # RIGHT gesture -> confirm selection and exit
+                        print(f"Night {MENORAH_NIGHTS[current_night_index]} selected")
+                        return current_night_index
+                    step = STARTUP_NIGHT_STEPS.get(gesture)  # LEFT gesture is not used in selection
+                    if step:
+                        current_night_index = (current_night_index + step) % len(MENORAH_NIGHTS)
+                        print(f"Night: {MENORAH_NIGHTS[current_night_index]}")
+                    await asyncio.sleep(gesture_cooldown)
+                    continue
+            except Exception:
+                pass  # Ignore gesture errors
         
-        # Small delay to prevent busy loop
-        time.sleep(0.05)
-
-# Startup: Night Selection
-# Light first LED on shamash and allow user to select night via gestures
-menorah_night_index = select_startup_night()
+        # Small delay to prevent busy loop (yields to other tasks)
+        await asyncio.sleep(0.05)
 
 # Runtime State Variables
-last_gesture_time = time.monotonic()  # Timestamp of last gesture detection
 gesture_cooldown = 0.5  # Minimum time between gesture detections (prevents spam)
-menorah_frame = 0  # Frame counter for animation timing
-update_interval = 0.02  # Main loop update interval (20ms = 50Hz for smooth animation)
+update_interval = 0.02  # Render/poll interval (20ms = 50Hz for smooth animation)
 
-# Main Menorah Control Loop
-while True:
-    current_time = time.monotonic()
-    loop_start = current_time
-    
-    # Increment frame counter for animation timing
-    menorah_frame += 1
+def change_night(step):
+    """Move to the next (step=1) or previous (step=-1) night"""
+    global menorah_night_index
+    menorah_night_index = (menorah_night_index + step) % len(MENORAH_NIGHTS)
+    print(f"Menorah Night: {MENORAH_NIGHTS[menorah_night_index]}")
+
+def change_brightness(step):
+    """Move to the next (step=1) or previous (step=-1) brightness level"""
+    global menorah_brightness_index
+    menorah_brightness_index = (menorah_brightness_index + step) % len(MENORAH_BRIGHTNESS_LEVELS)
+    print(f"Menorah Brightness: {MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]*100:.0f}%")
+
+# Adafruit gesture values: 0x01=UP, 0x02=DOWN, 0x03=LEFT, 0x04=RIGHT
+# Sensor is mounted sideways, so remap directions:
+# LEFT (0x03) -> UP (increase brightness), UP (0x01) -> RIGHT (increase night),
+# RIGHT (0x04) -> DOWN (decrease brightness), DOWN (0x02) -> LEFT (decrease night)
+# Note: Gestures 3 and 4 are swapped
+GESTURE_ACTIONS = {
+    0x04: (change_brightness, 1),  # RIGHT gesture -> increase brightness
+    0x02: (change_night, -1),  # DOWN gesture -> decrease night (go to previous night)
+    0x01: (change_night, 1),  # UP gesture -> increase night (go to next night)
+    0x03: (change_brightness, -1),  # LEFT gesture -> decrease brightness
+}
+
+async def gesture_task():
+    """Poll the gesture sensor and change the night or brightness
     
-    # Gesture Detection and Control
-    # Check for gestures if sensor is enabled and cooldown period has elapsed
-    if GESTURE_ENABLED and apds and (current_time - last_gesture_time) >= gesture_cooldown:
+    Waits out gesture_cooldown after each detected gesture (prevents spam),
+    otherwise polls every update_interval.
+    """
+    while True:
         try:
-            gesture = apds.gesture()
-            if gesture != 0:  # 0 = no gesture detected
-                last_gesture_time = current_time
-                
-                # Adafruit gesture values: 0x01=UP, 0x02=DOWN, 0x03=LEFT, 0x04=RIGHT
-                # Sensor is mounted sideways, so remap directions:
-                # LEFT (0x03) -> UP (increase brightness), UP (0x01) -> RIGHT (increase night),
-                # RIGHT (0x04) -> DOWN (decrease brightness), DOWN (0x02) -> LEFT (decrease night)
-                # Note: Gestures 3 and 4 are swapped
-                if gesture == 0x04 or gesture == 4:  # RIGHT gesture -> increase brightness
-                    menorah_brightness_index = (menorah_brightness_index + 1) % len(MENORAH_BRIGHTNESS_LEVELS)
-                    print(f"Menorah Brightness: {MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]*100:.0f}%")
-                elif gesture == 0x02 or gesture == 2:  # DOWN gesture -> decrease night (go to previous night)
-                    menorah_night_index = (menorah_night_index - 1) % len(MENORAH_NIGHTS)
-                    print(f"Menorah Night: {MENORAH_NIGHTS[menorah_night_index]}")
-                elif gesture == 0x01 or gesture == 1:  # UP gesture -> increase night (go to next night)
-                    menorah_night_index = (menorah_night_index + 1) % len(MENORAH_NIGHTS)
-                    print(f"Menorah Night: {MENORAH_NIGHTS[menorah_night_index]}")
-                elif gesture == 0x03 or gesture == 3:  # LEFT gesture -> decrease brightness
-                    menorah_brightness_index = (menorah_brightness_index - 1) % len(MENORAH_BRIGHTNESS_LEVELS)
-                    print(f"Menorah Brightness: {MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]*100:.0f}%")
+            gesture = read_gesture()
         except Exception:
-            pass  # Ignore gesture errors (sensor may be temporarily unavailable)
-    
-    # Get current menorah settings
-    menorah_brightness = MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]
-    nights = MENORAH_NIGHTS[menorah_night_index]
-    
-    # Update menorah display - light up candles for the current night
-    update_menorah_strips(nights, menorah_brightness)
-    
-    # Update all NeoPixel strips to display the current state
-    shamash_strip.show()
-    for strip in candle_strips:
-        strip.show()
+            gesture = 0  # Ignore gesture errors (sensor may be temporarily unavailable)
+        
+        if gesture == 0:  # 0 = no gesture detected
+            await asyncio.sleep(update_interval)
+            continue
+        
+        action = GESTURE_ACTIONS.get(gesture)
+        if action:
+            change, step = action
+            change(step)
+        await asyncio.sleep(gesture_cooldown)
+
+async def render_task():
+    """Keep the candle strips showing the current night and brightness"""
+    last_menorah_state = None  # (night index, brightness index) currently shown; None forces a redraw
+    while True:
+        # Redraw only when the night or brightness changed - the strips hold their state otherwise
+        menorah_state = (menorah_night_index, menorah_brightness_index)
+        if menorah_state != last_menorah_state:
+            last_menorah_state = menorah_state
+            nights = MENORAH_NIGHTS[menorah_night_index]
+            
+            # Update menorah display - light up candles for the current night
+            update_menorah_strips(nights, menorah_brightness_index)
+            
+            # Send only the candles that changed (the shamash keeps its startup LED)
+            show_dirty_candles()
+        
+        await asyncio.sleep(update_interval)
+
+async def main():
+    """Select the starting night, then run gesture control and rendering side by side"""
+    global menorah_night_index
+    # Startup: Night Selection
+    # Light first LED on shamash and allow user to select night via gestures
+    menorah_night_index = await select_startup_night()
     
-    # Maintain consistent loop timing (20ms update interval)
-    # Calculate how long the loop took and sleep for the remainder
-    elapsed_in_loop = time.monotonic() - loop_start
-    sleep_time = max(0, update_interval - elapsed_in_loop)
-    if sleep_time > 0:
-        time.sleep(sleep_time)
+    # Main Menorah Control Tasks
+    tasks = [render_task()]
+    if GESTURE_ENABLED and apds:
+        tasks.append(gesture_task())
+    await asyncio.gather(*tasks)
+
+asyncio.run(main())
@@ -15,6 +15,7 @@ import time
 import board
 import neopixel
 import math
+import array
 
 # Configuration
 NUM_STRIPS = 5
@@ -45,14 +46,13 @@ for i, pin in enumerate(STRIP_PINS):
     )
     strips.append(strip)
 
-# Set all LEDs to warm color
+# Start with all LEDs off - each one is only written once it starts fading in
 for strip in strips:
-    strip.fill(WARM_COLOR)
+    strip.fill((0, 0, 0, 0))
 
-# Calculate start time for each LED
-led_start_times = []
+# Calculate start time for each LED as (start time, strip index, led index)
+led_starts = []
 for strip_index in range(NUM_STRIPS):
-    strip_times = []
     for led_index in range(LEDS_PER_STRIP):
         # Calculate when this strip should start
         if strip_index == 0:
@@ -64,70 +64,73 @@ for strip_index in range(NUM_STRIPS):
         
         # Each LED in the strip starts slightly after the previous
         led_start = strip_start + (led_index * LED_DELAY)
-        strip_times.append(led_start)
-    led_start_times.append(strip_times)
+        led_starts.append((led_start, strip_index, led_index))
+
+# Flatten in start order: every LED fades for FADE_DURATION, so the LEDs still fading
+# are always one contiguous window of this order
+led_starts.sort()
+NUM_LEDS = len(led_starts)
+led_start_times = array.array('f', [start for start, _, _ in led_starts])
+# (strip, led index) for each entry of led_start_times
+led_slots = tuple((strips[strip_index], led_index) for _, strip_index, led_index in led_starts)
 
 # Smooth easing function (ease-in-out)
 def ease_in_out(t):
     """Smooth easing function for natural fade"""
     return t * t * (3.0 - 2.0 * t)
 
+# Eased fade level (0-255) for fade progress quantized to 0-255
+EASE_LUT = bytes(int(ease_in_out(t / 255) * 255 + 0.5) for t in range(256))
+# WARM_COLOR scaled to each eased fade level (RGBW order: Red, Green, Blue, White)
+SCALED_COLOR_LUT = tuple(
+    tuple(c * level // 255 for c in WARM_COLOR)
+    for level in range(256)
+)
+
 # Main fade loop
 start_time = time.monotonic()
 last_update = start_time
 update_interval = 0.02  # Update every 20ms for smooth animation
 print_interval = 0.1  # Print brightness every 100ms
 last_print = start_time
+first_unfinished = 0  # LEDs before this index are at TARGET_BRIGHTNESS
+next_start = 0  # LEDs from this index on haven't started yet (fully off)
 
 while True:
     current_time = time.monotonic()
     elapsed = current_time - start_time
     
-    # Track all brightness values to find the dimmest
-    brightness_values = []
+    # Start every LED whose start time has passed
+    while next_start < NUM_LEDS and led_start_times[next_start] <= elapsed:
+        next_start += 1
+    
+    # Track the dimmest fade level this frame - LEDs that haven't started are fully off
+    dimmest_level = 0 if next_start < NUM_LEDS else 256
     
-    # Update all LEDs
-    all_at_max = True
-    for strip_index, strip in enumerate(strips):
-        for led_index in range(LEDS_PER_STRIP):
-            led_start = led_start_times[strip_index][led_index]
-            
-            if elapsed < led_start:
-                # LED hasn't started yet - fully off
-                brightness = 0.0
-                all_at_max = False
-            else:
-                # LED has started - calculate fade progress
-                fade_elapsed = elapsed - led_start
-                if fade_elapsed >= FADE_DURATION:
-                    # Fully faded in
-                    brightness = TARGET_BRIGHTNESS
-                else:
-                    # Still fading - use smooth easing
-                    progress = fade_elapsed / FADE_DURATION
-                    eased_progress = ease_in_out(progress)
-                    brightness = eased_progress * TARGET_BRIGHTNESS
-                    all_at_max = False
-            
-            # Store brightness value
-            brightness_values.append(brightness)
-            
-            # Apply brightness to this LED by scaling the color values
-            # brightness is 0.0 to TARGET_BRIGHTNESS, scale to 0.0 to 1.0
-            scale = brightness / TARGET_BRIGHTNESS if TARGET_BRIGHTNESS > 0 else 0.0
-            r, g, b, w = WARM_COLOR  # RGBW order: Red, Green, Blue, White
-            strip[led_index] = (
-                int(r * scale),
-                int(g * scale),
-                int(b * scale),
-                int(w * scale)
-            )
+    # Update only the LEDs that are fading (finished ones already hold TARGET_BRIGHTNESS)
+    for idx in range(first_unfinished, next_start):
+        strip, led_index = led_slots[idx]
+        # LED has started - calculate fade progress
+        fade_elapsed = elapsed - led_start_times[idx]
+        if fade_elapsed >= FADE_DURATION:
+            # Fully faded in
+            level = 255
+            if idx == first_unfinished:
+                first_unfinished += 1
+        else:
+            # Still fading - use smooth easing
+            level = EASE_LUT[int(fade_elapsed / FADE_DURATION * 255)]
+        
+        if level < dimmest_level:
+            dimmest_level = level
+        
+        # Apply brightness to this LED with the pre-scaled color
+        strip[led_index] = SCALED_COLOR_LUT[level]
     
     # Find and print dimmest pixel brightness
     if current_time - last_print >= print_interval:
-        if brightness_values:
-            dimmest_brightness = min(brightness_values)
-            print(f"Brightness (dimmest pixel): {dimmest_brightness:.4f} ({dimmest_brightness/TARGET_BRIGHTNESS*100:.2f}%)")
+        dimmest_brightness = dimmest_level * TARGET_BRIGHTNESS / 255  # 0.0 to TARGET_BRIGHTNESS
+        print(f"Brightness (dimmest pixel): {dimmest_brightness:.4f} ({dimmest_brightness/TARGET_BRIGHTNESS*100:.2f}%)")
         last_print = current_time
     
     # Show all strips
@@ -135,7 +138,7 @@ while True:
         strip.show()
     
     # If all LEDs are at max, we're done fading
-    if all_at_max:
+    if first_unfinished == NUM_LEDS:
         break
     
     # Sleep until next update
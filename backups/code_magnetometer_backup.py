@@ -5,6 +5,7 @@
 
 import time
 import math
+import array
 import board
 import neopixel
 from adafruit_lis2mdl import LIS2MDL
@@ -18,6 +19,15 @@ magnetometer = LIS2MDL(i2c)
 # Neopixel setup - 24 RGBW LEDs on GP22
 NEOPIXEL_PIN = board.GP22
 NUM_PIXELS = 24
+TWO_PI = 2 * math.pi
+LED_ANGLE_STEP = TWO_PI / NUM_PIXELS  # Angle between neighbouring LEDs (radians)
+LED_ANGLES = tuple(i * LED_ANGLE_STEP for i in range(NUM_PIXELS))  # Angle of each LED (radians)
+
+# Field direction hue (0-255) for X, Y quantized to 64 steps each over -1 to 1
+ATAN2_HUE = bytes(
+    int((math.atan2((yi - 32) / 32, (xi - 32) / 32) + math.pi) / TWO_PI * 256) & 0xFF
+    for yi in range(64) for xi in range(64)
+)
 BRIGHTNESS = 0.25  # Max brightness 25%
 pixels = neopixel.NeoPixel(NEOPIXEL_PIN, NUM_PIXELS, brightness=BRIGHTNESS,
                           pixel_order=neopixel.GRBW, auto_write=False)
@@ -46,6 +56,9 @@ def wheel(pos):
         pos -= 170
         return (pos * 3, 0, 255 - pos * 3, 0)
 
+# (r, g, b) source indices into (v, p, t, q) for each of the six hue regions
+HSV_SECTORS = ((0, 2, 1), (3, 0, 1), (1, 0, 2), (1, 3, 0), (2, 1, 0), (0, 1, 3))
+
 def hsv_to_rgbw(h, s=255, v=255):
     """Convert HSV to RGBW. h=0-255, s=0-255, v=0-255."""
     h = h % 256
@@ -55,27 +68,18 @@ def hsv_to_rgbw(h, s=255, v=255):
     if s == 0:
         return (0, 0, 0, v)  # Grayscale uses white channel
     
-    region = h // 43
-    remainder = (h - (region * 43)) * 6
+    # Six regions of 256/6 hues each; multiply and shift instead of dividing by 43
+    h6 = h * 6
+    region = h6 >> 8
+    remainder = h6 & 0xFF
     
     p = (v * (255 - s)) >> 8
     q = (v * (255 - ((s * remainder) >> 8))) >> 8
     t = (v * (255 - ((s * (255 - remainder)) >> 8))) >> 8
     
-    if region == 0:
-        r, g, b = v, t, p
-    elif region == 1:
-        r, g, b = q, v, p
-    elif region == 2:
-        r, g, b = p, v, t
-    elif region == 3:
-        r, g, b = p, q, v
-    elif region == 4:
-        r, g, b = t, p, v
-    else:
-        r, g, b = v, p, q
-    
-    return (r, g, b, 0)
+    vals = (v, p, t, q)
+    r_src, g_src, b_src = HSV_SECTORS[region]
+    return (vals[r_src], vals[g_src], vals[b_src], 0)
 
 def calibrate_magnetometer():
     """Calibrate magnetometer by sampling magnetic field range."""
@@ -85,26 +89,20 @@ def calibrate_magnetometer():
     pixels.fill((0, 0, 0, 50))  # Dim white during calibration
     pixels.show()
     
+    # Collect all samples first, then find the ranges in one pass per axis
+    xs = array.array('f', [0.0] * calibration_samples)
+    ys = array.array('f', [0.0] * calibration_samples)
+    zs = array.array('f', [0.0] * calibration_samples)
     for i in range(calibration_samples):
-        mag = magnetometer.magnetic
-        x, y, z = mag
-        
-        if i == 0:
-            min_x = max_x = x
-            min_y = max_y = y
-            min_z = max_z = z
-        else:
-            min_x = min(min_x, x)
-            max_x = max(max_x, x)
-            min_y = min(min_y, y)
-            max_y = max(max_y, y)
-            min_z = min(min_z, z)
-            max_z = max(max_z, z)
+        xs[i], ys[i], zs[i] = magnetometer.magnetic
         
         if i % 10 == 0:
             print(f"Calibration: {i}/{calibration_samples}")
         time.sleep(0.05)
     
+    min_x, max_x = min(xs), max(xs)
+    min_y, max_y = min(ys), max(ys)
+    min_z, max_z = min(zs), max(zs)
     calibrated = True
     print("Calibration complete!")
     print(f"X range: {min_x:.2f} to {max_x:.2f}")
@@ -119,13 +117,38 @@ def normalize(value, min_val, max_val):
         return 0.5
     return (value - min_val) / (max_val - min_val)
 
-def update_leds_from_magnetometer():
-    """Update LED ring based on magnetometer readings."""
+# Per-LED fade around the field direction, recomputed only when the angle moves
+FADE_ANGLE_THRESHOLD = math.radians(1)  # Minimum angle change before recomputing fades
+fade_angle = None  # Angle the fades were computed for (None = not computed yet)
+led_fades = [0.0] * NUM_PIXELS
+
+def update_led_fades(angle):
+    """Recompute the per-LED fade (1% at the field direction to 100% opposite)."""
+    global fade_angle
+    if fade_angle is not None and abs(angle - fade_angle) < FADE_ANGLE_THRESHOLD:
+        return
+    fade_angle = angle
+    for i, led_angle in enumerate(LED_ANGLES):
+        # Calculate distance from this LED to the direction LED
+        angle_diff = abs(angle - led_angle)
+        # Normalize angle difference to 0-1
+        if angle_diff > math.pi:
+            angle_diff = TWO_PI - angle_diff
+        angle_diff_norm = angle_diff / math.pi
+        
+        # Inverted brightness: dimmest (1%) at direction, brighter as distance increases
+        # At direction (angle_diff_norm = 0): fade = 0.01 (1%)
+        # At opposite (angle_diff_norm = 1): fade = 1.0 (100%)
+        fade = 0.01 + (angle_diff_norm * 0.99)  # 1% to 100% brightness
+        led_fades[i] = max(0.01, min(1.0, fade))
+
+def update_leds_from_magnetometer(frame):
+    """Update LED ring based on magnetometer readings (debug print every 10th frame)."""
     mag = magnetometer.magnetic
     x, y, z = mag
     
-    # Calculate magnitude (strength) of magnetic field
-    magnitude = math.sqrt(x*x + y*y + z*z)
+    # Squared magnitude (strength) of magnetic field - sqrt only when needed
+    mag_sq = x*x + y*y + z*z
     
     # Normalize X, Y to -1 to 1 range (for direction)
     if calibrated:
@@ -138,61 +161,50 @@ def update_leds_from_magnetometer():
         norm_x = max(-1, min(1, norm_x))
         norm_y = max(-1, min(1, norm_y))
     
-    # Calculate angle from X, Y (compass direction)
-    angle = math.atan2(norm_y, norm_x)
-    # Convert to 0-2π range, then to 0-255 for color wheel
-    angle_normalized = (angle + math.pi) / (2 * math.pi)  # 0 to 1
-    hue = int(angle_normalized * 255)
+    # Look up the compass direction as a 0-255 color wheel hue
+    xi = max(0, min(63, int(norm_x * 32 + 32)))
+    yi = max(0, min(63, int(norm_y * 32 + 32)))
+    hue = ATAN2_HUE[(yi << 6) + xi]
+    # Back to an angle (-π to π) for the LED fades
+    angle_normalized = hue / 256  # 0 to 1
+    angle = angle_normalized * TWO_PI - math.pi
     
     # Calculate brightness based on magnitude (normalize magnitude)
     # Typical range: 20-100 microtesla, scale to 0-255
-    mag_normalized = min(1.0, magnitude / 100.0)  # Cap at 100 uT
+    mag_normalized = 1.0 if mag_sq >= 10000.0 else math.sqrt(mag_sq) * 0.01  # Cap at 100 uT
     brightness = int(mag_normalized * 255)
     brightness = max(50, min(255, brightness))  # Keep visible (50-255)
     
     # Update LEDs - create a pattern based on magnetic field
-    # Option 1: All LEDs show direction color with magnitude brightness
-    color = hsv_to_rgbw(hue, 255, brightness)
-    pixels.fill(color)
-    
-    # Option 2: Create a compass-like effect - one LED points in field direction (dimmed to 1%)
-    # Calculate which LED should be dimmest (pointing in field direction)
-    led_index = int((angle_normalized * NUM_PIXELS) % NUM_PIXELS)
-    
-    # Fade LEDs around the direction
-    for i in range(NUM_PIXELS):
-        # Calculate distance from this LED to the direction LED
-        led_angle = (i * 360 / NUM_PIXELS) * math.pi / 180
-        angle_diff = abs(angle - led_angle)
-        # Normalize angle difference to 0-1
-        if angle_diff > math.pi:
-            angle_diff = 2 * math.pi - angle_diff
-        angle_diff_norm = angle_diff / math.pi
-        
-        # Inverted brightness: dimmest (1%) at direction, brighter as distance increases
-        # At direction (angle_diff_norm = 0): fade = 0.01 (1%)
-        # At opposite (angle_diff_norm = 1): fade = 1.0 (100%)
-        fade = 0.01 + (angle_diff_norm * 0.99)  # 1% to 100% brightness
-        fade = max(0.01, min(1.0, fade))
-        
+    # Compass-like effect - every LED shows the direction color at magnitude brightness,
+    # with the one pointing in the field direction dimmed to 1%
+    # Fade LEDs around the direction (build the ring, then write it in one slice)
+    update_led_fades(angle)
+    colors = []
+    for fade in led_fades:
         # Apply magnitude-based brightness
         led_brightness = int(brightness * fade)
         led_brightness = max(3, min(255, led_brightness))  # Minimum 1% of 255 ≈ 3
         
-        pixels[i] = hsv_to_rgbw(hue, 255, led_brightness)
+        colors.append(hsv_to_rgbw(hue, 255, led_brightness))
     
+    pixels[0:NUM_PIXELS] = colors
     pixels.show()
     
     # Print debug info
-    print(f"Mag: X={x:6.2f}, Y={y:6.2f}, Z={z:6.2f} | "
-          f"Angle={math.degrees(angle):5.1f}° | "
-          f"Magnitude={magnitude:5.2f}uT")
+    if frame % 10 == 0:
+        magnitude = math.sqrt(mag_sq)
+        print(f"Mag: X={x:6.2f}, Y={y:6.2f}, Z={z:6.2f} | "
+              f"Angle={math.degrees(angle):5.1f}° | "
+              f"Magnitude={magnitude:5.2f}uT")
 
 # Calibrate on startup
 calibrate_magnetometer()
 
 # Main loop
+frame = 0
 while True:
-    update_leds_from_magnetometer()
+    update_leds_from_magnetometer(frame)
+    frame += 1
     time.sleep(0.01)  # Update 100 times per second (10x faster)
 
@@ -13,6 +13,8 @@ Key constants at top of file. Trevor Hoffman December 2025
 # - neopixel (CircuitPython) - NeoPixel LED control
 # - random (standard library) - random values for candle durations and animations
 # - math (standard library) - mathematical functions for animations
+# - array (standard library) - compact float table for the sine lookup
+# - asyncio (CircuitPython) - cooperative animation and gesture polling tasks
 # - adafruit_apds9960.apds9960 (Adafruit) - APDS-9960 gesture sensor
 # - busio (CircuitPython) - I2C communication for gesture sensor
 
@@ -21,6 +23,8 @@ import board
 import neopixel
 import random
 import math
+import array
+import asyncio
 
 # ============================================================================
 # MOST IMPORTANT PROGRAM CONSTANTS
@@ -52,7 +56,7 @@ PIXEL_ORDER = neopixel.RGBW  # Pixel color order: GRBW (Green, Red, Blue, White)
 # Idk why my LEDs are in GRBW order, but they are. it doesnt match.
 
 # Menorah Night Configuration (~line 53, 619, 622, 625, 870)
-MENORAH_NIGHTS = list(range(1, 9))  # Nights 1-8 (shamash + N candles)
+# Night index i is night i + 1 (nights 1-8: shamash + N candles)
 menorah_night_index = 3  # Current night index
 
 # Startup Configuration (~line 608)
@@ -60,6 +64,11 @@ STARTUP_BRIGHTNESS = MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]
 
 # Candle Color Configuration (~line 552, 607) - Format: (G, R, B, W) GRBW order
 WARM_COLOR = (50, 255, 5, 180)  # Warm white ~2700K-3000K
+# Warm white pre-scaled for each brightness level (index with menorah_brightness_index)
+MENORAH_COLORS = tuple(
+    tuple(int(c * level) for c in WARM_COLOR)
+    for level in MENORAH_BRIGHTNESS_LEVELS
+)
 
 # Menorah Phases: 1) Night selection, 2) Lighting, 3) Burning, 4) Out
 
@@ -86,9 +95,67 @@ FLAME_COLOR_YELLOW = (70, 255, 5, 120)
 FLAME_COLOR_WHITE = (100, 150, 50, 255)  # White flicker layer
 FLAME_COLORS = [FLAME_COLOR_RED, FLAME_COLOR_ORANGE, FLAME_COLOR_YELLOW]
 
+# Precomputed flame palette blend: FLAME_COLOR_LUT_SIZE steps across the whole palette cycle
+# Index with int(flame_color_index * FLAME_COLOR_LUT_SCALE) & FLAME_COLOR_LUT_MASK
+FLAME_COLOR_LUT_SIZE = 64  # Power of two so the index wraps with a mask
+FLAME_COLOR_LUT_MASK = FLAME_COLOR_LUT_SIZE - 1
+FLAME_COLOR_LUT_SCALE = FLAME_COLOR_LUT_SIZE / len(FLAME_COLORS)
+
+def _build_flame_color_lut():
+    lut = []
+    for step in range(FLAME_COLOR_LUT_SIZE):
+        position = step / FLAME_COLOR_LUT_SCALE
+        color1_idx = int(position)
+        mix = position - color1_idx
+        color1 = FLAME_COLORS[color1_idx]
+        color2 = FLAME_COLORS[(color1_idx + 1) % len(FLAME_COLORS)]
+        lut.append(tuple(int(c1 * (1 - mix) + c2 * mix) for c1, c2 in zip(color1, color2)))
+    return tuple(lut)
+
+FLAME_COLOR_LUT = _build_flame_color_lut()
+
+# Precomputed white flicker blend: (keep_q8, white G, white R, white B, white W) per flicker step
+# Index with int(white_flicker * WHITE_FLICKER_STEPS); flicker is clamped to 0.0-1.0
+WHITE_FLICKER_STEPS = 64
+WHITE_FLICKER_LUT = tuple(
+    (int((1 - step / WHITE_FLICKER_STEPS) * 256),) + tuple(int(c * step / WHITE_FLICKER_STEPS) for c in FLAME_COLOR_WHITE)
+    for step in range(WHITE_FLICKER_STEPS + 1)
+)
+
+# Sine lookup table for flame animations (power-of-two size so the index wraps with a mask)
+SIN_LUT_SIZE = 1024
+SIN_LUT_MASK = SIN_LUT_SIZE - 1
+TAU = 2 * math.pi  # Full turn in radians (bound once instead of evaluating math.pi * 2 at each use)
+SIN_LUT_SCALE = SIN_LUT_SIZE / TAU  # Radians to table steps
+SIN_LUT = array.array('f', [math.sin(TAU * i / SIN_LUT_SIZE) for i in range(SIN_LUT_SIZE)])
+COS_LUT_OFFSET = SIN_LUT_SIZE // 4  # cos(x) = sin(x + pi/2)
+
+def _sin(x):
+    """Table lookup replacement for math.sin"""
+    return SIN_LUT[int(x * SIN_LUT_SCALE) & SIN_LUT_MASK]
+
+def _cos(x):
+    """Table lookup replacement for math.cos"""
+    return SIN_LUT[(int(x * SIN_LUT_SCALE) + COS_LUT_OFFSET) & SIN_LUT_MASK]
+
+# Cheap 16-bit xorshift PRNG for per-frame flame noise (stays within small ints, no heap allocation)
+_rng_state = [random.getrandbits(16) or 1]  # Seeded from random; state must be nonzero
+WHITE_RANDOM_SCALE = 0.04 / 65535  # Maps 1-65535 to 0.0-0.04
+BURST_SPAWN_THRESHOLD = int(0.2 * 65536)  # 20% chance
+
+def _rand16():
+    """Advance the xorshift state and return it (1-65535)"""
+    s = _rng_state[0]
+    s ^= (s << 7) & 0xFFFF
+    s ^= s >> 9
+    s ^= (s << 8) & 0xFFFF
+    _rng_state[0] = s
+    return s
+
 # Animation Speed Configuration (~line 411-412)
 ANIMATION_SPEED = 0.5  # Multiplier: 1.0=normal, 2.0=2x faster, 0.5=2x slower
 ANIMATION_VARIATION = 0.2  # Per-candle speed variation: SPEED * (1.0 ± VARIATION)
+ANIMATION_FRAME_INTERVAL = 3  # Recompute flame animation every Nth display frame (50Hz / 3 = ~17Hz)
 
 # Phase 2 Proximity Configuration (unused - kept for reference)
 PROXIMITY_THRESHOLD = 10  # Proximity "close" threshold (0-255)
@@ -113,20 +180,27 @@ CANDLE_PINS = [
     board.D9,   # Night 8 (last candle)
 ]
 
+# Gesture step table: Adafruit gesture values 0x01=UP, 0x02=DOWN map to +1/-1
+# (night selection in phase 1, brightness in phase 3, any step lights a candle in phase 2)
+GESTURE_STEPS = {0x01: 1, 0x02: -1}
+GESTURE_RIGHT = 0x04  # Confirms the night in phase 1
+
 # Initialize APDS-9960 Gesture Sensor
 try:
     from adafruit_apds9960.apds9960 import APDS9960
     try:
         import busio
-        i2c = busio.I2C(board.SCL, board.SDA)  # Try explicit I2C first
+        i2c = busio.I2C(board.SCL, board.SDA, frequency=400_000)  # Try explicit I2C first (400kHz fast mode)
     except (AttributeError, ImportError):
         i2c = board.I2C()  # Fall back to board.I2C()
     apds = APDS9960(i2c)
     apds.enable_proximity = True
     apds.proximity_gain = 3  # Max sensitivity (0-3)
     apds.enable_gesture = True
-    apds.gesture_gain = 3  # Max sensitivity (0-3)
+    apds.gesture_gain = 2  # Sensitivity (0-3); 2 fills the gesture FIFO less often than max
     time.sleep(0.5)  # Sensor initialization delay
+    for _ in range(3):
+        apds.gesture()  # Probe once at startup so a missing or unresponsive sensor disables gestures up front
     GESTURE_ENABLED = True
     print("APDS-9960 gesture sensor initialized")
 except Exception as e:
@@ -140,6 +214,35 @@ candle_strips = []  # [0]=Night 1, [1]=Night 2, ..., [7]=Night 8
 for pin in CANDLE_PINS:
     candle_strips.append(neopixel.NeoPixel(pin, LEDS_PER_STRIP, brightness=1.0, pixel_order=PIXEL_ORDER, auto_write=False))
 
+# Strips by candle index: [0-7]=Night 1-8, [8]=Shamash
+candle_index_strips = candle_strips + [shamash_strip]
+
+# Reusable pixel list for building one strip's frame (avoids a new list per candle per frame)
+strip_pixels = [(0, 0, 0, 0)] * LEDS_PER_STRIP
+
+# Last pixels written to each strip and whether it needs show() on the next flush
+last_strip_pixels = [[None] * LEDS_PER_STRIP for _ in candle_index_strips]
+strip_dirty = [False] * len(candle_index_strips)
+
+# Display state each unlit candle was last drawn with (None = lit or not drawn yet); lets static
+# candles skip the redraw entirely, while lit flames rely on the pixel comparison in write_candle_strip
+last_display_keys = [None] * len(candle_index_strips)
+
+def write_candle_strip(candle_index, pixels):
+    """Write a candle's pixels to its strip, marking it dirty only if they changed"""
+    last_pixels = last_strip_pixels[candle_index]
+    if pixels != last_pixels:
+        last_pixels[:] = pixels
+        candle_index_strips[candle_index][0:LEDS_PER_STRIP] = pixels
+        strip_dirty[candle_index] = True
+
+def flush_strips():
+    """Show every strip that changed since the last flush"""
+    for i in range(len(strip_dirty)):
+        if strip_dirty[i]:
+            candle_index_strips[i].show()
+            strip_dirty[i] = False
+
 # Candle State Structure
 class CandleState:
     def __init__(self):
@@ -147,6 +250,7 @@ class CandleState:
         self.lit = False  # Lit in phase 2
         self.burn_start_time = None  # Phase 3 start time
         self.duration_minutes = None  # Random duration assigned at lighting
+        self.burn_rate = 0.0  # Burn progress per second (1 / duration in seconds), set by start_candle_burn()
         self.candle_base_leds = CANDLE_BASE_LEDS  # Base LEDs (decreases over time)
         self.flame_leds = FLAME_START_LEDS  # Flame LEDs (increases over time)
         self.flame_brightness = FLAME_START_BRIGHTNESS  # Current brightness
@@ -156,14 +260,28 @@ class CandleState:
         self.flame_color_index = 0  # Current color in palette
         self.flame_color_mix = 0.0  # Color mix factor 0.0-1.0
         self.white_flicker = 0.0  # White flicker amount 0.0-1.0
-        self.animation_speed = 1.0  # Per-candle speed multiplier
-        self.animation_phase_offset = random.uniform(0, math.pi * 2)  # Random phase offset
-        self.flame_led_brightness = [1.0] * FLAME_MAX_LEDS  # Per-LED brightness for upward traveling effects
-        self.candle_base_led_brightness = [1.0] * CANDLE_BASE_LEDS  # Per-LED brightness for candle base (dimmer than flame)
+        # Per-candle speed multiplier and phase offset, drawn once so the animation only reads them
+        self.animation_speed = ANIMATION_SPEED * (1.0 + random.uniform(-ANIMATION_VARIATION, ANIMATION_VARIATION))
+        self.animation_phase_offset = random.uniform(0, TAU)  # Random phase offset
+        # Per-LED brightness for upward traveling effects (sized for the tallest animated flame, never resized)
+        self.flame_led_brightness = array.array('f', [1.0] * (FLAME_MAX_LEDS + 1))
+        self.candle_base_led_brightness = array.array('f', [1.0] * CANDLE_BASE_LEDS)  # Per-LED brightness for candle base (dimmer than flame)
+        self.burst_positions = []  # Rising burst positions (animation option 3)
 
 # Initialize candle states (8 regular candles + 1 shamash = 9 total)
 candle_states = [CandleState() for _ in range(NUM_CANDLES + 1)]  # +1 for shamash
 
+def start_candle_burn(state, start_time):
+    """Start a lit candle's burn timer and cache its burn rate so progress is one multiply
+    
+    Args:
+        state: CandleState with duration_minutes already assigned
+        start_time: time.monotonic() timestamp the burn starts at
+    """
+    state.burn_start_time = start_time
+    # Zero or negative durations burn out on the next update
+    state.burn_rate = 1.0 / (state.duration_minutes * 60.0) if state.duration_minutes > 0 else 1e9
+
 def update_candle_display(candle_index, brightness_scale=1.0):
     """Update display for a single candle based on its state
     
@@ -171,24 +289,28 @@ def update_candle_display(candle_index, brightness_scale=1.0):
         candle_index: Index of candle (0-7 for regular candles, 8 for shamash)
         brightness_scale: Additional brightness scaling (0.0 to 1.0)
     """
-    if candle_index >= len(candle_states):
-        return
-    
-    # Handle shamash (index 8) - use shamash_strip
-    if candle_index == 8:
-        strip = shamash_strip
-    elif candle_index < len(candle_strips):
-        strip = candle_strips[candle_index]
-    else:
+    if candle_index >= len(candle_states) or candle_index >= len(candle_index_strips):
         return
     
     state = candle_states[candle_index]
     
-    # Clear the strip first
-    strip.fill((0, 0, 0, 0))
+    # Unplaced and unlit candles are static: skip the redraw if nothing that affects them changed
+    if state.lit:
+        last_display_keys[candle_index] = None
+    else:
+        display_key = (state.placed, state.candle_base_leds, brightness_scale)
+        if display_key == last_display_keys[candle_index]:
+            return
+        last_display_keys[candle_index] = display_key
+    
+    # Build the whole strip in the shared pixel list, then write it in one slice assignment
+    pixels = strip_pixels
     
     if not state.placed:
-        # Candle not placed yet - do nothing
+        # Candle not placed yet - clear the strip
+        for i in range(LEDS_PER_STRIP):
+            pixels[i] = (0, 0, 0, 0)
+        write_candle_strip(candle_index, pixels)
         return
     
     if not state.lit:
@@ -208,9 +330,13 @@ def update_candle_display(candle_index, brightness_scale=1.0):
             int(b * scale),
             int(w * scale)
         )
-        # Show candle base (bottom LEDs)
-        for i in range(min(state.candle_base_leds, LEDS_PER_STRIP)):
-            strip[i] = color
+        # Show candle base (bottom LEDs), rest off
+        base_end_led = min(state.candle_base_leds, LEDS_PER_STRIP)
+        for i in range(base_end_led):
+            pixels[i] = color
+        for i in range(base_end_led, LEDS_PER_STRIP):
+            pixels[i] = (0, 0, 0, 0)
+        write_candle_strip(candle_index, pixels)
         return
     
     # Candle is lit - show candle base and flame
@@ -218,58 +344,62 @@ def update_candle_display(candle_index, brightness_scale=1.0):
     r, g, b, w = CANDLE_BASE_COLOR
     base_brightness_mult = CANDLE_BASE_BRIGHTNESS * 0.4  # Candle base is 40% of flame brightness
     base_scale = base_brightness_mult * brightness_scale
+    base_r, base_g, base_b, base_w = r * base_scale, g * base_scale, b * base_scale, w * base_scale
     
     # Place candle base at bottom (LEDs 0 to candle_base_leds-1) with per-LED brightness
+    base_led_brightness = state.candle_base_led_brightness
+    num_base_multipliers = len(base_led_brightness)
     for i in range(min(state.candle_base_leds, LEDS_PER_STRIP)):
         # Apply per-LED brightness multiplier (if available)
-        led_brightness = state.candle_base_led_brightness[i] if i < len(state.candle_base_led_brightness) else 1.0
-        led_scale = base_scale * led_brightness
+        led_brightness = base_led_brightness[i] if i < num_base_multipliers else 1.0
         base_color = (
-            int(r * led_scale),
-            int(g * led_scale),
-            int(b * led_scale),
-            int(w * led_scale)
+            int(base_r * led_brightness),
+            int(base_g * led_brightness),
+            int(base_b * led_brightness),
+            int(base_w * led_brightness)
         )
-        strip[i] = base_color
+        pixels[i] = base_color
     
     # Flame (top LEDs, animated) - starts right above candle base (no gap)
     flame_start_led = state.candle_base_leds
     flame_end_led = min(state.candle_base_leds + state.flame_leds, LEDS_PER_STRIP)
     
-    # Mix colors from palette (reds, oranges, yellows)
-    color1_idx = int(state.flame_color_index) % len(FLAME_COLORS)
-    color2_idx = (color1_idx + 1) % len(FLAME_COLORS)
-    color1, color2 = FLAME_COLORS[color1_idx], FLAME_COLORS[color2_idx]
-    mix = state.flame_color_mix
-    r = int(color1[0] * (1 - mix) + color2[0] * mix)
-    g = int(color1[1] * (1 - mix) + color2[1] * mix)
-    b = int(color1[2] * (1 - mix) + color2[2] * mix)
-    w = int(color1[3] * (1 - mix) + color2[3] * mix)
-    
-    # Add white flicker layer
-    white_flicker = state.white_flicker
-    wf = FLAME_COLOR_WHITE
-    r = int(r * (1 - white_flicker) + wf[0] * white_flicker)
-    g = int(g * (1 - white_flicker) + wf[1] * white_flicker)
-    b = int(b * (1 - white_flicker) + wf[2] * white_flicker)
-    w = int(w * (1 - white_flicker) + wf[3] * white_flicker)
+    # Mix colors from palette (reds, oranges, yellows) - precomputed blend
+    r, g, b, w = FLAME_COLOR_LUT[int(state.flame_color_index * FLAME_COLOR_LUT_SCALE) & FLAME_COLOR_LUT_MASK]
+    
+    # Add white flicker layer - precomputed Q8 keep factor plus white contribution
+    keep_q8, wf_r, wf_g, wf_b, wf_w = WHITE_FLICKER_LUT[int(state.white_flicker * WHITE_FLICKER_STEPS)]
+    r = ((r * keep_q8) >> 8) + wf_r
+    g = ((g * keep_q8) >> 8) + wf_g
+    b = ((b * keep_q8) >> 8) + wf_b
+    w = ((w * keep_q8) >> 8) + wf_w
     
     # Apply gradient brightness (brightest at bottom) + per-LED multipliers for upward traveling effects
     num_flame_leds = flame_end_led - flame_start_led
+    gradient_divisor = max(1, num_flame_leds - 1)
+    flame_scale = state.flame_brightness * brightness_scale
+    flame_led_brightness = state.flame_led_brightness
+    num_flame_multipliers = len(flame_led_brightness)
     for led_offset in range(num_flame_leds):
         led_index = flame_start_led + led_offset
-        gradient_factor = 1.0 - (led_offset * 0.4 / max(1, num_flame_leds - 1))  # 1.0 to 0.6
-        led_brightness_mult = state.flame_led_brightness[led_offset] if led_offset < len(state.flame_led_brightness) else 1.0
-        led_scale = state.flame_brightness * gradient_factor * led_brightness_mult * brightness_scale
+        gradient_factor = 1.0 - (led_offset * 0.4 / gradient_divisor)  # 1.0 to 0.6
+        led_brightness_mult = flame_led_brightness[led_offset] if led_offset < num_flame_multipliers else 1.0
+        # One float-to-Q8 conversion per LED, then integer-only channel scaling
+        led_scale_q8 = int(flame_scale * gradient_factor * led_brightness_mult * 256)
         
         flame_color = (
-            int(r * led_scale),
-            int(g * led_scale),
-            int(b * led_scale),
-            int(w * led_scale)
+            (r * led_scale_q8) >> 8,
+            (g * led_scale_q8) >> 8,
+            (b * led_scale_q8) >> 8,
+            (w * led_scale_q8) >> 8
         )
         
-        strip[led_index] = flame_color
+        pixels[led_index] = flame_color
+    
+    # Turn off LEDs above the flame
+    for i in range(flame_end_led, LEDS_PER_STRIP):
+        pixels[i] = (0, 0, 0, 0)
+    write_candle_strip(candle_index, pixels)
 
 def calculate_candle_duration():
     """Calculate random candle duration based on min + percentage variation
@@ -312,6 +442,231 @@ def calculate_intensity_curve(burn_progress):
     
     return max(0.0, min(1.0, intensity))
 
+# Base flame height: 3 LEDs (can vary with animation)
+BASE_FLAME_HEIGHT = 3
+
+def _sine_anim(state, animated_frame, height_waves, led_waves, max_flame_height, max_led_brightness):
+    """Shared kernel for the sine-wave animations (options 1, 4, 5, 8, 9)
+    
+    Args:
+        state: Candle state to animate
+        animated_frame: Frame counter scaled by the candle's animation speed
+        height_waves: (amplitude, frame_rate, speed_rate, offset_mult, phase) per wave - flame height varies by
+            the average of amplitude * sin(frame * (frame_rate + speed * speed_rate) + offset * offset_mult + phase)
+        led_waves: (amplitude, speed_rate, offset_mult, phase, led_step) per wave - each LED's brightness varies by
+            the average of amplitude * sin(frame * speed * speed_rate + offset * offset_mult + phase - led * led_step)
+        max_flame_height: Tallest flame in LEDs (shortest is 2)
+        max_led_brightness: Upper clamp for per-LED brightness
+    """
+    speed = state.animation_speed
+    phase_offset = state.animation_phase_offset
+    led_brightness = state.flame_led_brightness
+    
+    # Flame height: base 3, varies with the height waves
+    height_variation = 0.0
+    for amplitude, frame_rate, speed_rate, offset_mult, phase in height_waves:
+        height_variation += amplitude * _sin(animated_frame * (frame_rate + speed * speed_rate) + phase_offset * offset_mult + phase)
+    height_variation /= len(height_waves)
+    flame_height = int(BASE_FLAME_HEIGHT + height_variation + 0.5)  # +0.5 for proper rounding
+    flame_height = max(2, min(max_flame_height, flame_height))
+    state.flame_leds = flame_height
+    
+    # Phase of each LED wave at the bottom LED (each LED above lags by led_step)
+    waves = [
+        (amplitude, animated_frame * speed * speed_rate + phase_offset * offset_mult + phase, led_step)
+        for amplitude, speed_rate, offset_mult, phase, led_step in led_waves
+    ]
+    num_waves = len(waves)
+    
+    for i in range(flame_height):
+        # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
+        base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
+        wave_variation = 0.0
+        for amplitude, wave_phase, led_step in waves:
+            wave_variation += amplitude * _sin(wave_phase - i * led_step)
+        led_brightness[i] = max(0.4, min(max_led_brightness, base_brightness + wave_variation / num_waves))
+
+# Option 1: one wave with a 2.5-flame-height period, 2.2 LEDs between peaks
+_WAVE1_ANGLE = math.pi / (BASE_FLAME_HEIGHT * 1.25)
+_ANIM1_HEIGHT_WAVES = ((1.0, 0.1, 0.0, 1.0, 0.0),)
+_ANIM1_LED_WAVES = ((0.1, 0.12 * _WAVE1_ANGLE, _WAVE1_ANGLE, 0.0, 2.2 * _WAVE1_ANGLE),)
+
+def _anim1(state, animated_frame, frame):
+    """Animation option 1: Smooth upward wave - gentle sine wave traveling upward"""
+    # Flame height varies: base 3, can dip to 2 or rise to 4
+    _sine_anim(state, animated_frame, _ANIM1_HEIGHT_WAVES, _ANIM1_LED_WAVES, 4, 1.1)
+
+# Option 2: pulses span two flame heights
+_PULSE_ANGLE = math.pi / (BASE_FLAME_HEIGHT * 2)
+
+def _anim2(state, animated_frame, frame):
+    """Animation option 2: Smooth upward pulse - gentle bright pulses traveling upward"""
+    speed = state.animation_speed
+    phase_offset = state.animation_phase_offset
+    led_brightness = state.flame_led_brightness
+    pulse_speed = 0.25 * speed
+    pulse_position = animated_frame * pulse_speed + phase_offset
+    # Flame height pulses: base 3, can dip to 2 or rise to 5
+    height_pulse = 2.0 * _sin(animated_frame * 0.15 + phase_offset)
+    flame_height = int(BASE_FLAME_HEIGHT + height_pulse + 0.5)  # +0.5 for proper rounding
+    flame_height = max(2, min(5, flame_height))  # Range: 2-5 LEDs
+    state.flame_leds = flame_height
+    
+    for i in range(flame_height):
+        # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
+        base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
+        pulse_phase = pulse_position - i * 3.5
+        pulse_variation = 0.15 * _sin(pulse_phase * _PULSE_ANGLE)
+        led_brightness[i] = max(0.4, min(1.15, base_brightness + max(0, pulse_variation)))
+
+# Option 3: bursts fade out over 1.5 LEDs
+_BURST_FALLOFF_ANGLE = math.pi / 1.5
+
+def _anim3(state, animated_frame, frame):
+    """Animation option 3: Smooth random bursts - gentle bright spots moving upward"""
+    speed = state.animation_speed
+    phase_offset = state.animation_phase_offset
+    led_brightness = state.flame_led_brightness
+    if frame % 25 < ANIMATION_FRAME_INTERVAL:  # Spawn new burst less frequently (once per 25 frames)
+        if _rand16() < BURST_SPAWN_THRESHOLD:  # 20% chance
+            state.burst_positions.append(0.0)  # Start at bottom
+    # Update and remove old bursts
+    new_bursts = []
+    for burst_pos in state.burst_positions:
+        burst_pos += 0.18 * speed * ANIMATION_FRAME_INTERVAL  # Slower movement
+        if burst_pos < BASE_FLAME_HEIGHT + 3:
+            new_bursts.append(burst_pos)
+    state.burst_positions = new_bursts
+    # Flame height varies with bursts: base 3, can dip to 2 or rise to 4
+    height_boost = 0.0
+    for burst_pos in state.burst_positions:
+        if burst_pos < BASE_FLAME_HEIGHT:
+            height_boost += 0.8
+    # Also add base variation
+    base_variation = 0.5 * _sin(animated_frame * 0.08 + phase_offset)
+    flame_height = int(BASE_FLAME_HEIGHT + height_boost + base_variation + 0.5)
+    flame_height = max(2, min(4, flame_height))  # Range: 2-4 LEDs
+    state.flame_leds = flame_height
+    
+    # Apply bursts with smooth falloff
+    for i in range(flame_height):
+        # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
+        base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
+        burst_boost = 0.0
+        for burst_pos in state.burst_positions:
+            distance = abs(i - burst_pos)
+            if distance < 1.5:
+                burst_boost += 0.2 * (0.5 + 0.5 * _cos(distance * _BURST_FALLOFF_ANGLE))
+        led_brightness[i] = max(0.4, min(1.2, base_brightness + burst_boost))
+
+# Option 4: one ripple with a 5-flame-height period, 4.5 LEDs between peaks
+_RIPPLE_ANGLE = math.pi / (BASE_FLAME_HEIGHT * 2.5)
+_ANIM4_HEIGHT_WAVES = ((1.0, 0.08, 0.0, 1.0, 0.0),)
+_ANIM4_LED_WAVES = ((0.12, 0.1 * _RIPPLE_ANGLE, _RIPPLE_ANGLE, 0.0, 4.5 * _RIPPLE_ANGLE),)
+
+def _anim4(state, animated_frame, frame):
+    """Animation option 4: Smooth upward ripple - gentle wave with multiple peaks"""
+    # Flame height ripples: base 3, can dip to 2 or rise to 4
+    _sine_anim(state, animated_frame, _ANIM4_HEIGHT_WAVES, _ANIM4_LED_WAVES, 4, 1.12)
+
+# Option 5: two option-1 waves offset by 1.2 flame heights
+_ANIM5_HEIGHT_WAVES = ((1.0, 0.12, 0.0, 1.0, 0.0), (1.0, 0.12, 0.0, 1.0, math.pi / 2))
+_ANIM5_LED_WAVES = (
+    (0.1, 0.14 * _WAVE1_ANGLE, _WAVE1_ANGLE, 0.0, 2.2 * _WAVE1_ANGLE),
+    (0.1, 0.14 * _WAVE1_ANGLE, _WAVE1_ANGLE, BASE_FLAME_HEIGHT * 1.2 * _WAVE1_ANGLE, 2.2 * _WAVE1_ANGLE),
+)
+
+def _anim5(state, animated_frame, frame):
+    """Animation option 5: Double wave traveling upward - two smooth waves offset"""
+    # Flame height varies with waves: base 3, can dip to 2 or rise to 4
+    _sine_anim(state, animated_frame, _ANIM5_HEIGHT_WAVES, _ANIM5_LED_WAVES, 4, 1.1)
+
+def _anim6(state, animated_frame, frame):
+    """Animation option 6: Smooth chaotic flicker - multiple sine waves for natural randomness"""
+    speed = state.animation_speed
+    phase_offset = state.animation_phase_offset
+    led_brightness = state.flame_led_brightness
+    chaos_speed = 0.18 * speed
+    # Flame height flickers chaotically: base 3, can dip to 2 or rise to 4
+    chaos_height_phase = (animated_frame * chaos_speed + phase_offset) % 15
+    height_wave1 = 0.8 * _sin(chaos_height_phase)
+    height_wave2 = 0.6 * _sin(chaos_height_phase * 2.3)
+    height_variation = (height_wave1 + height_wave2) / 2.0
+    flame_height = int(BASE_FLAME_HEIGHT + height_variation + 0.5)  # +0.5 for proper rounding
+    flame_height = max(2, min(4, flame_height))  # Range: 2-4 LEDs
+    state.flame_leds = flame_height
+    
+    for i in range(flame_height):
+        # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
+        base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
+        chaos_phase = (animated_frame * chaos_speed - i * 2.5 + phase_offset) % 12
+        wave1 = 0.08 * _sin(chaos_phase)
+        wave2 = 0.06 * _sin(chaos_phase * 2.1)
+        wave3 = 0.04 * _sin(chaos_phase * 3.3)
+        flicker_variation = (wave1 + wave2 + wave3) / 3.0
+        led_brightness[i] = max(0.4, min(1.15, base_brightness + flicker_variation))
+
+# Option 7: height flows over 1.5 flame heights; each flow boost spans one flame height
+_FLOW_HEIGHT_ANGLE = math.pi / (BASE_FLAME_HEIGHT * 1.5)
+_FLOW_BOOST_ANGLE = math.pi / BASE_FLAME_HEIGHT
+
+def _anim7(state, animated_frame, frame):
+    """Animation option 7: Steady upward flow - smooth continuous flow moving upward"""
+    speed = state.animation_speed
+    phase_offset = state.animation_phase_offset
+    led_brightness = state.flame_led_brightness
+    flow_speed = 0.16 * speed
+    flow_position = (animated_frame * flow_speed + phase_offset) % (BASE_FLAME_HEIGHT * 2.5)
+    # Flame height flows upward: base 3, can dip to 2 or rise to 5
+    flow_height_phase = animated_frame * flow_speed * 0.8 + phase_offset
+    height_flow = 2.0 * _sin(flow_height_phase * _FLOW_HEIGHT_ANGLE)
+    flame_height = int(BASE_FLAME_HEIGHT + height_flow + 0.5)  # +0.5 for proper rounding
+    flame_height = max(2, min(5, flame_height))  # Range: 2-5 LEDs
+    state.flame_leds = flame_height
+    
+    for i in range(flame_height):
+        # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
+        base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
+        flow_phase = (flow_position - i * 2.3) % (BASE_FLAME_HEIGHT * 2.5)
+        if flow_phase < BASE_FLAME_HEIGHT:
+            flow_boost = 0.15 * (0.5 + 0.5 * _cos(flow_phase * _FLOW_BOOST_ANGLE))
+        else:
+            flow_boost = 0.0
+        led_brightness[i] = max(0.4, min(1.15, base_brightness + flow_boost))
+
+# Option 8: spiral with a 3.5-flame-height period; height cycles every 4 flame heights
+_SPIRAL_ANGLE = TAU / (BASE_FLAME_HEIGHT * 3.5)
+_SPIRAL_HEIGHT_ANGLE = TAU / (BASE_FLAME_HEIGHT * 4)
+_ANIM8_HEIGHT_WAVES = ((1.0, 0.0, 0.15 * 0.7 * _SPIRAL_HEIGHT_ANGLE, _SPIRAL_HEIGHT_ANGLE, 0.0),)
+_ANIM8_LED_WAVES = ((0.15, 0.15 * _SPIRAL_ANGLE, _SPIRAL_ANGLE, 0.0, 2.8 * _SPIRAL_ANGLE),)
+
+def _anim8(state, animated_frame, frame):
+    """Animation option 8: Upward spiral effect - smooth rotating brightness pattern"""
+    # Flame height spirals: base 3, can dip to 2 or rise to 4
+    _sine_anim(state, animated_frame, _ANIM8_HEIGHT_WAVES, _ANIM8_LED_WAVES, 4, 1.15)
+
+# Option 9: slow wave layer (2.5-flame-height period) plus medium pulse layer (3.5-flame-height period)
+_LAYER2_ANGLE = math.pi / (BASE_FLAME_HEIGHT * 1.75)
+_ANIM9_HEIGHT_WAVES = ((1.2, 0.0, 0.08 * 0.5, 1.0, 0.0), (1.6, 0.0, 0.22 * 0.7, 1.5, 0.0))
+_ANIM9_LED_WAVES = (
+    (0.08, 0.08 * _WAVE1_ANGLE, _WAVE1_ANGLE, 0.0, 2.2 * _WAVE1_ANGLE),
+    (0.1, 0.22 * _LAYER2_ANGLE, 1.5 * _LAYER2_ANGLE, 0.0, 3.2 * _LAYER2_ANGLE),
+)
+
+def _anim9(state, animated_frame, frame):
+    """Animation option 9: Complex multi-layer - smooth combination of multiple effects"""
+    # Flame height varies with both layers: base 3, can dip to 2 or rise to 5
+    _sine_anim(state, animated_frame, _ANIM9_HEIGHT_WAVES, _ANIM9_LED_WAVES, 5, 1.15)
+
+# Animation dispatch table: _ANIM_FUNCS[option - 1]
+_ANIM_FUNCS = (_anim1, _anim2, _anim3, _anim4, _anim5, _anim6, _anim7, _anim8, _anim9)
+# Animation for each candle, bound once at startup
+# Test mode: candle i shows option (i % 9) + 1; normal mode: every candle uses ANIMATION_OPTION
+if TEST_MODE:
+    _ANIM_FUNC_FOR_CANDLE = tuple(_ANIM_FUNCS[i % 9] for i in range(9))
+else:
+    _ANIM_FUNC_FOR_CANDLE = (_ANIM_FUNCS[ANIMATION_OPTION - 1],) * 9
+
 def update_flame_animation(candle_index, frame):
     """Update flame animation with upward traveling effects.
     
@@ -331,20 +686,8 @@ def update_flame_animation(candle_index, frame):
     if not state.lit:
         return
     
-    # Select animation option
-    # Test mode: Each candle displays a different animation (candle 0 = option 1, candle 1 = option 2, etc.)
-    # Normal mode: All candles use ANIMATION_OPTION
-    if TEST_MODE:
-        option = (candle_index % 9) + 1  # Cycle through options 1-9 for each candle
-    else:
-        option = ANIMATION_OPTION
-    
-    # Initialize animation speed and phase offset if needed
-    if not hasattr(state, 'animation_speed') or state.animation_speed == 1.0:
-        speed_variation = random.uniform(-ANIMATION_VARIATION, ANIMATION_VARIATION)
-        state.animation_speed = ANIMATION_SPEED * (1.0 + speed_variation)
-    if not hasattr(state, 'animation_phase_offset'):
-        state.animation_phase_offset = random.uniform(0, math.pi * 2)
+    # Animation option was bound per candle at startup (see _ANIM_FUNC_FOR_CANDLE)
+    animate = _ANIM_FUNC_FOR_CANDLE[candle_index]
     
     # Calculate intensity curve based on burn progress
     # For phase 2 (not burning yet), use low intensity (just lit)
@@ -352,240 +695,52 @@ def update_flame_animation(candle_index, frame):
         intensity_mult = 0.3  # Just lit, tame intensity
         burn_progress = 0.0
     else:
-        current_time = time.monotonic()
-        elapsed_minutes = (current_time - state.burn_start_time) / 60.0
-        burn_progress = elapsed_minutes / state.duration_minutes if state.duration_minutes > 0 else 1.0
+        burn_progress = (time.monotonic() - state.burn_start_time) * state.burn_rate
         intensity_mult = calculate_intensity_curve(burn_progress)
     
-    animated_frame = frame * state.animation_speed
+    speed = state.animation_speed
+    phase_offset = state.animation_phase_offset
+    animated_frame = frame * speed
     
     # Color cycling (reds/oranges/yellows) - smooth, slow transitions
-    color_speed = 0.03 * state.animation_speed  # Slower, smoother color transitions
-    color_phase = (animated_frame * color_speed + candle_index * 0.3 + state.animation_phase_offset) % (len(FLAME_COLORS) * 2)
+    color_speed = 0.03 * speed  # Slower, smoother color transitions
+    color_phase = (animated_frame * color_speed + candle_index * 0.3 + phase_offset) % (len(FLAME_COLORS) * 2)
     state.flame_color_index = color_phase / 2.0
     state.flame_color_mix = (color_phase % 2.0) / 2.0
     
     # Smooth white flicker - multiple sine waves for realistic randomness
     # Use smoother, lower frequency waves for more natural flicker
     flicker_base = 0.15  # Base flicker amount
-    flicker1 = 0.12 * math.sin(animated_frame * 0.08 + candle_index * 0.3 + state.animation_phase_offset)
-    flicker2 = 0.08 * math.sin(animated_frame * 0.15 + candle_index * 0.5 + state.animation_phase_offset * 1.7)
-    flicker3 = 0.05 * math.sin(animated_frame * 0.25 + candle_index * 0.7 + state.animation_phase_offset * 2.3)
+    flicker1 = 0.12 * _sin(animated_frame * 0.08 + candle_index * 0.3 + phase_offset)
+    flicker2 = 0.08 * _sin(animated_frame * 0.15 + candle_index * 0.5 + phase_offset * 1.7)
+    flicker3 = 0.05 * _sin(animated_frame * 0.25 + candle_index * 0.7 + phase_offset * 2.3)
     # Add very small random component for subtle variation (smoother than before)
-    white_random = random.uniform(-0.02, 0.02)
+    white_random = _rand16() * WHITE_RANDOM_SCALE - 0.02
     state.white_flicker = max(0.0, min(0.35, flicker_base + flicker1 + flicker2 + flicker3 + white_random))
     
-    # Base flame height: 3 LEDs (can vary with animation)
-    BASE_FLAME_HEIGHT = 3
-    
     # Apply intensity curve to base brightness
     state.flame_brightness = FLAME_START_BRIGHTNESS * intensity_mult
     
-    # Initialize per-LED brightness array if needed (use max possible height)
-    max_flame_height = FLAME_MAX_LEDS + 1  # Allow going slightly above max
-    if len(state.flame_led_brightness) < max_flame_height:
-        state.flame_led_brightness.extend([1.0] * (max_flame_height - len(state.flame_led_brightness)))
-    
-    # Option 1: Smooth upward wave - gentle sine wave traveling upward
-    if option == 1:
-        wave_speed = 0.12 * state.animation_speed
-        wave_position = (animated_frame * wave_speed + state.animation_phase_offset) % (BASE_FLAME_HEIGHT * 2.5)
-        # Flame height varies: base 3, can dip to 2 or rise to 4
-        height_variation = 1.0 * math.sin(animated_frame * 0.1 + state.animation_phase_offset)
-        flame_height = int(BASE_FLAME_HEIGHT + height_variation + 0.5)  # +0.5 for proper rounding
-        flame_height = max(2, min(4, flame_height))  # Range: 2-4 LEDs
-        state.flame_leds = flame_height
-        
-        for i in range(flame_height):
-            # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
-            base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
-            wave_phase = (wave_position - i * 2.2) % (BASE_FLAME_HEIGHT * 2.5)
-            wave_variation = 0.1 * math.sin(wave_phase * math.pi / (BASE_FLAME_HEIGHT * 1.25))
-            state.flame_led_brightness[i] = max(0.4, min(1.1, base_brightness + wave_variation))
-    
-    # Option 2: Smooth upward pulse - gentle bright pulses traveling upward
-    elif option == 2:
-        pulse_speed = 0.25 * state.animation_speed
-        pulse_position = (animated_frame * pulse_speed + state.animation_phase_offset) % (BASE_FLAME_HEIGHT * 4)
-        # Flame height pulses: base 3, can dip to 2 or rise to 5
-        height_pulse = 2.0 * math.sin(animated_frame * 0.15 + state.animation_phase_offset)
-        flame_height = int(BASE_FLAME_HEIGHT + height_pulse + 0.5)  # +0.5 for proper rounding
-        flame_height = max(2, min(5, flame_height))  # Range: 2-5 LEDs
-        state.flame_leds = flame_height
-        
-        for i in range(flame_height):
-            # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
-            base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
-            pulse_phase = (pulse_position - i * 3.5) % (BASE_FLAME_HEIGHT * 4)
-            pulse_variation = 0.15 * math.sin(pulse_phase * math.pi / (BASE_FLAME_HEIGHT * 2))
-            state.flame_led_brightness[i] = max(0.4, min(1.15, base_brightness + max(0, pulse_variation)))
-    
-    # Option 3: Smooth random bursts - gentle bright spots moving upward
-    elif option == 3:
-        if not hasattr(state, '_burst_positions'):
-            state._burst_positions = []
-        if frame % 25 == 0:  # Spawn new burst less frequently
-            if random.random() < 0.2:  # 20% chance
-                state._burst_positions.append(0.0)  # Start at bottom
-        # Update and remove old bursts
-        new_bursts = []
-        for burst_pos in state._burst_positions:
-            burst_pos += 0.18 * state.animation_speed  # Slower movement
-            if burst_pos < BASE_FLAME_HEIGHT + 3:
-                new_bursts.append(burst_pos)
-        state._burst_positions = new_bursts
-        # Flame height varies with bursts: base 3, can dip to 2 or rise to 4
-        height_boost = 0.0
-        for burst_pos in state._burst_positions:
-            if burst_pos < BASE_FLAME_HEIGHT:
-                height_boost += 0.8
-        # Also add base variation
-        base_variation = 0.5 * math.sin(animated_frame * 0.08 + state.animation_phase_offset)
-        flame_height = int(BASE_FLAME_HEIGHT + height_boost + base_variation + 0.5)
-        flame_height = max(2, min(4, flame_height))  # Range: 2-4 LEDs
-        state.flame_leds = flame_height
-        
-        # Apply bursts with smooth falloff
-        for i in range(flame_height):
-            # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
-            base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
-            burst_boost = 0.0
-            for burst_pos in state._burst_positions:
-                distance = abs(i - burst_pos)
-                if distance < 1.5:
-                    burst_boost += 0.2 * (0.5 + 0.5 * math.cos(distance * math.pi / 1.5))
-            state.flame_led_brightness[i] = max(0.4, min(1.2, base_brightness + burst_boost))
-    
-    # Option 4: Smooth upward ripple - gentle wave with multiple peaks
-    elif option == 4:
-        ripple_speed = 0.1 * state.animation_speed
-        ripple_position = (animated_frame * ripple_speed + state.animation_phase_offset) % (BASE_FLAME_HEIGHT * 5)
-        # Flame height ripples: base 3, can dip to 2 or rise to 4
-        height_ripple = 1.0 * math.sin(animated_frame * 0.08 + state.animation_phase_offset)
-        flame_height = int(BASE_FLAME_HEIGHT + height_ripple + 0.5)  # +0.5 for proper rounding
-        flame_height = max(2, min(4, flame_height))  # Range: 2-4 LEDs
-        state.flame_leds = flame_height
-        
-        for i in range(flame_height):
-            # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
-            base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
-            ripple_phase = (ripple_position - i * 4.5) % (BASE_FLAME_HEIGHT * 5)
-            ripple_variation = 0.12 * math.sin(ripple_phase * math.pi / (BASE_FLAME_HEIGHT * 2.5))
-            state.flame_led_brightness[i] = max(0.4, min(1.12, base_brightness + ripple_variation))
-    
-    # Option 5: Double wave traveling upward - two smooth waves offset
-    elif option == 5:
-        wave_speed = 0.14 * state.animation_speed
-        wave1_pos = (animated_frame * wave_speed + state.animation_phase_offset) % (BASE_FLAME_HEIGHT * 2.5)
-        wave2_pos = (animated_frame * wave_speed + state.animation_phase_offset + BASE_FLAME_HEIGHT * 1.2) % (BASE_FLAME_HEIGHT * 2.5)
-        # Flame height varies with waves: base 3, can dip to 2 or rise to 4
-        height_wave = 1.0 * (math.sin(animated_frame * 0.12 + state.animation_phase_offset) + 
-                            math.sin(animated_frame * 0.12 + state.animation_phase_offset + math.pi / 2)) / 2.0
-        flame_height = int(BASE_FLAME_HEIGHT + height_wave + 0.5)  # +0.5 for proper rounding
-        flame_height = max(2, min(4, flame_height))  # Range: 2-4 LEDs
-        state.flame_leds = flame_height
-        
-        for i in range(flame_height):
-            # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
-            base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
-            phase1 = (wave1_pos - i * 2.2) % (BASE_FLAME_HEIGHT * 2.5)
-            phase2 = (wave2_pos - i * 2.2) % (BASE_FLAME_HEIGHT * 2.5)
-            wave1 = 0.1 * math.sin(phase1 * math.pi / (BASE_FLAME_HEIGHT * 1.25))
-            wave2 = 0.1 * math.sin(phase2 * math.pi / (BASE_FLAME_HEIGHT * 1.25))
-            state.flame_led_brightness[i] = max(0.4, min(1.1, base_brightness + (wave1 + wave2) / 2.0))
-    
-    # Option 6: Smooth chaotic flicker - multiple sine waves for natural randomness
-    elif option == 6:
-        chaos_speed = 0.18 * state.animation_speed
-        # Flame height flickers chaotically: base 3, can dip to 2 or rise to 4
-        chaos_height_phase = (animated_frame * chaos_speed + state.animation_phase_offset) % 15
-        height_wave1 = 0.8 * math.sin(chaos_height_phase)
-        height_wave2 = 0.6 * math.sin(chaos_height_phase * 2.3)
-        height_variation = (height_wave1 + height_wave2) / 2.0
-        flame_height = int(BASE_FLAME_HEIGHT + height_variation + 0.5)  # +0.5 for proper rounding
-        flame_height = max(2, min(4, flame_height))  # Range: 2-4 LEDs
-        state.flame_leds = flame_height
-        
-        for i in range(flame_height):
-            # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
-            base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
-            chaos_phase = (animated_frame * chaos_speed - i * 2.5 + state.animation_phase_offset) % 12
-            wave1 = 0.08 * math.sin(chaos_phase)
-            wave2 = 0.06 * math.sin(chaos_phase * 2.1)
-            wave3 = 0.04 * math.sin(chaos_phase * 3.3)
-            flicker_variation = (wave1 + wave2 + wave3) / 3.0
-            state.flame_led_brightness[i] = max(0.4, min(1.15, base_brightness + flicker_variation))
-    
-    # Option 7: Steady upward flow - smooth continuous flow moving upward
-    elif option == 7:
-        flow_speed = 0.16 * state.animation_speed
-        flow_position = (animated_frame * flow_speed + state.animation_phase_offset) % (BASE_FLAME_HEIGHT * 2.5)
-        # Flame height flows upward: base 3, can dip to 2 or rise to 5
-        flow_height_phase = (animated_frame * flow_speed * 0.8 + state.animation_phase_offset) % (BASE_FLAME_HEIGHT * 3)
-        height_flow = 2.0 * math.sin(flow_height_phase * math.pi / (BASE_FLAME_HEIGHT * 1.5))
-        flame_height = int(BASE_FLAME_HEIGHT + height_flow + 0.5)  # +0.5 for proper rounding
-        flame_height = max(2, min(5, flame_height))  # Range: 2-5 LEDs
-        state.flame_leds = flame_height
-        
-        for i in range(flame_height):
-            # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
-            base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
-            flow_phase = (flow_position - i * 2.3) % (BASE_FLAME_HEIGHT * 2.5)
-            if flow_phase < BASE_FLAME_HEIGHT:
-                flow_boost = 0.15 * (0.5 + 0.5 * math.cos(flow_phase * math.pi / BASE_FLAME_HEIGHT))
-            else:
-                flow_boost = 0.0
-            state.flame_led_brightness[i] = max(0.4, min(1.15, base_brightness + flow_boost))
-    
-    # Option 8: Upward spiral effect - smooth rotating brightness pattern
-    elif option == 8:
-        spiral_speed = 0.15 * state.animation_speed
-        spiral_position = (animated_frame * spiral_speed + state.animation_phase_offset) % (BASE_FLAME_HEIGHT * 3.5)
-        # Flame height spirals: base 3, can dip to 2 or rise to 4
-        spiral_height_phase = (animated_frame * spiral_speed * 0.7 + state.animation_phase_offset) % (BASE_FLAME_HEIGHT * 4)
-        height_spiral = 1.0 * math.sin(spiral_height_phase * 2 * math.pi / (BASE_FLAME_HEIGHT * 4))
-        flame_height = int(BASE_FLAME_HEIGHT + height_spiral + 0.5)  # +0.5 for proper rounding
-        flame_height = max(2, min(4, flame_height))  # Range: 2-4 LEDs
-        state.flame_leds = flame_height
-        
-        for i in range(flame_height):
-            # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
-            base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
-            spiral_phase = (spiral_position - i * 2.8) % (BASE_FLAME_HEIGHT * 3.5)
-            spiral_variation = 0.15 * math.sin(spiral_phase * 2 * math.pi / (BASE_FLAME_HEIGHT * 3.5))
-            state.flame_led_brightness[i] = max(0.4, min(1.15, base_brightness + spiral_variation))
-    
-    # Option 9: Complex multi-layer - smooth combination of multiple effects
-    elif option == 9:
-        # Layer 1: Slow wave
-        wave1_speed = 0.08 * state.animation_speed
-        wave1_pos = (animated_frame * wave1_speed + state.animation_phase_offset) % (BASE_FLAME_HEIGHT * 2.5)
-        # Layer 2: Medium pulse
-        wave2_speed = 0.22 * state.animation_speed
-        wave2_pos = (animated_frame * wave2_speed + state.animation_phase_offset * 1.5) % (BASE_FLAME_HEIGHT * 3.5)
-        # Flame height varies with both layers: base 3, can dip to 2 or rise to 5
-        height_layer1 = 1.2 * math.sin(animated_frame * wave1_speed * 0.5 + state.animation_phase_offset)
-        height_layer2 = 1.6 * math.sin(animated_frame * wave2_speed * 0.7 + state.animation_phase_offset * 1.5)
-        height_variation = (height_layer1 + height_layer2) / 2.0
-        flame_height = int(BASE_FLAME_HEIGHT + height_variation + 0.5)  # +0.5 for proper rounding
-        flame_height = max(2, min(5, flame_height))  # Range: 2-5 LEDs
-        state.flame_leds = flame_height
-        
-        for i in range(flame_height):
-            # Brightness tapers 50%: 1.0 at bottom to 0.5 at top
-            base_brightness = 1.0 - (i * 0.5 / max(1, flame_height - 1))
-            phase1 = (wave1_pos - i * 2.2) % (BASE_FLAME_HEIGHT * 2.5)
-            phase2 = (wave2_pos - i * 3.2) % (BASE_FLAME_HEIGHT * 3.5)
-            layer1 = 0.08 * math.sin(phase1 * math.pi / (BASE_FLAME_HEIGHT * 1.25))
-            layer2 = 0.1 * math.sin(phase2 * math.pi / (BASE_FLAME_HEIGHT * 1.75))
-            state.flame_led_brightness[i] = max(0.4, min(1.15, base_brightness + (layer1 + layer2) / 2.0))
-
-def update_menorah_strips(nights, brightness):
+    animate(state, animated_frame, frame)
+
+def tick_candle(candle_index, frame, brightness_scale):
+    """Advance one candle by a display frame: animate its flame on animation frames, then draw it
+    
+    Args:
+        candle_index: Candle index (0-7 regular, 8 shamash)
+        frame: Display frame counter (flame animation runs every ANIMATION_FRAME_INTERVAL frames)
+        brightness_scale: Menorah brightness scaling (0.0 to 1.0)
+    """
+    if frame % ANIMATION_FRAME_INTERVAL == 0 and candle_states[candle_index].lit:
+        update_flame_animation(candle_index, frame)
+    update_candle_display(candle_index, brightness_scale)
+
+def update_menorah_strips(nights, brightness_index):
     """Light up the specified number of candles for the current night
     
     Args:
         nights: Number of candles to light (1-8), not including the shamash
-        brightness: Brightness level (0.0 to 1.0) to apply to all candles
+        brightness_index: Index into MENORAH_BRIGHTNESS_LEVELS to apply to all candles
     
     Note: The order of CANDLE_PINS array determines night order.
     Night 1: lights candle_strips[0] (first candle)
@@ -593,15 +748,8 @@ def update_menorah_strips(nights, brightness):
     ...
     Night 8: lights candle_strips[0-7] (all 8 candles)
     """
-    # Calculate warm white color with brightness scaling
-    r, g, b, w = WARM_COLOR
-    scale = brightness
-    color = (
-        int(r * scale),
-        int(g * scale),
-        int(b * scale),
-        int(w * scale)
-    )
+    # Warm white color pre-scaled for this brightness level
+    color = MENORAH_COLORS[brightness_index]
     
     # Light up candles based on night number
     # Array order determines night order: [0] = Night 1, [1] = Night 2, etc.
@@ -613,7 +761,7 @@ def update_menorah_strips(nights, brightness):
     for i in range(nights, len(candle_strips)):
         candle_strips[i].fill((0, 0, 0, 0))
 
-def select_startup_night():
+async def select_startup_night():
     """Phase 1: Night selection function
     
     Shows number of LEDs on shamash candle to indicate selected night (1-8).
@@ -640,56 +788,55 @@ def select_startup_night():
     gesture_cooldown = 0.5  # Prevent gesture spam
     current_night_index = menorah_night_index  # Start with default night
     
-    print(f"Current Night: {MENORAH_NIGHTS[current_night_index]}")
+    print(f"Current Night: {current_night_index + 1}")
+    
+    r, g, b, w = WARM_COLOR
+    scale = STARTUP_BRIGHTNESS
+    startup_color = (
+        int(r * scale),
+        int(g * scale),
+        int(b * scale),
+        int(w * scale)
+    )
+    last_drawn_index = -1  # Night index currently shown on the shamash (-1 = not drawn yet)
     
     # Night selection loop
     while True:
         current_time = time.monotonic()
         
-        # Update shamash display - show number of LEDs equal to selected night
-        selected_night = MENORAH_NIGHTS[current_night_index]
-        shamash_strip.fill((0, 0, 0, 0))
-        r, g, b, w = WARM_COLOR
-        scale = STARTUP_BRIGHTNESS
-        startup_color = (
-            int(r * scale),
-            int(g * scale),
-            int(b * scale),
-            int(w * scale)
-        )
-        # Light LEDs 0 to (selected_night - 1) to show the number
-        for i in range(min(selected_night, LEDS_PER_STRIP)):
-            shamash_strip[i] = startup_color
-        shamash_strip.show()
+        # Update shamash display - show number of LEDs equal to selected night (only when it changes)
+        if current_night_index != last_drawn_index:
+            selected_night = current_night_index + 1
+            shamash_strip.fill((0, 0, 0, 0))
+            # Light LEDs 0 to (selected_night - 1) to show the number
+            for i in range(min(selected_night, LEDS_PER_STRIP)):
+                shamash_strip[i] = startup_color
+            shamash_strip.show()
+            last_drawn_index = current_night_index
         
         # Check for gestures
         if GESTURE_ENABLED and apds:
             cooldown_elapsed = current_time - last_gesture_time
             if cooldown_elapsed >= gesture_cooldown:
-                try:
-                    gesture = apds.gesture()
+                gesture = take_gesture()  # Read from the sensor by gesture_task
+                
+                if gesture != 0:  # 0 = no gesture detected
+                    last_gesture_time = current_time
                     
-                    if gesture != 0:  # 0 = no gesture detected
-                        last_gesture_time = current_time
-                        
-                        # Adafruit gesture values: 0x01=UP, 0x02=DOWN, 0x03=LEFT, 0x04=RIGHT
-                        if gesture == 0x01 or gesture == 1:  # UP (0x01) -> increase night
-                            current_night_index = (current_night_index + 1) % len(MENORAH_NIGHTS)
-                            print(f"Night: {MENORAH_NIGHTS[current_night_index]}")
-                        elif gesture == 0x02 or gesture == 2:  # DOWN (0x02) -> decrease night
-                            current_night_index = (current_night_index - 1) % len(MENORAH_NIGHTS)
-                            print(f"Night: {MENORAH_NIGHTS[current_night_index]}")
-                        elif gesture == 0x04 or gesture == 4:  # RIGHT (0x04) -> confirm and enter Phase 2
-                            print(f"Night {MENORAH_NIGHTS[current_night_index]} confirmed. Entering Phase 2.")
-                            return current_night_index
-                        # LEFT (0x03) not used in phase 1
-                except Exception:
-                    pass  # Ignore gesture errors
+                    # UP (0x01) -> increase night, DOWN (0x02) -> decrease night
+                    step = GESTURE_STEPS.get(gesture)
+                    if step is not None:
+                        current_night_index = (current_night_index + step) % NUM_CANDLES
+                        print(f"Night: {current_night_index + 1}")
+                    elif gesture == GESTURE_RIGHT:  # RIGHT (0x04) -> confirm and enter Phase 2
+                        print(f"Night {current_night_index + 1} confirmed. Entering Phase 2.")
+                        return current_night_index
+                    # LEFT (0x03) not used in phase 1
         
         # Small delay to prevent busy loop
-        time.sleep(0.05)
+        await asyncio.sleep(0.05)
 
-def phase2_lighting(nights):
+async def phase2_lighting(nights):
     """Phase 2: Lighting - Place candles and light them one by one
     
     Step 1: Wait for proximity (3 seconds) to light shamash
@@ -718,16 +865,13 @@ def phase2_lighting(nights):
         candle_states[i].flame_color_index = 0.0
         candle_states[i].flame_color_mix = 0.0
         candle_states[i].white_flicker = 0.0
-        # Initialize animation properties
-        speed_variation = random.uniform(-ANIMATION_VARIATION, ANIMATION_VARIATION)
-        candle_states[i].animation_speed = ANIMATION_SPEED * (1.0 + speed_variation)
-        candle_states[i].animation_phase_offset = random.uniform(0, math.pi * 2)
+        # Animation speed and phase offset are already randomized in CandleState
     
-    # Determine lighting order
+    # Determine lighting order (range objects support len() and indexing without building a list)
     if LIGHTING_REVERSE_ORDER:
-        candle_indices = list(range(nights - 1, -1, -1))
+        candle_indices = range(nights - 1, -1, -1)
     else:
-        candle_indices = list(range(nights))
+        candle_indices = range(nights)
     
     # Place all candles (but don't light them yet)
     for i in candle_indices:
@@ -749,9 +893,6 @@ def phase2_lighting(nights):
     shamash_state.flame_leds = FLAME_START_LEDS
     shamash_state.base_flame_brightness = FLAME_START_BRIGHTNESS
     shamash_state.flame_brightness = FLAME_START_BRIGHTNESS
-    speed_variation = random.uniform(-ANIMATION_VARIATION, ANIMATION_VARIATION)
-    shamash_state.animation_speed = ANIMATION_SPEED * (1.0 + speed_variation)
-    shamash_state.animation_phase_offset = random.uniform(0, math.pi * 2)
     print("Shamash lit!")
     
     # Step 2: Light candles one by one with gestures
@@ -764,84 +905,73 @@ def phase2_lighting(nights):
     
     while candles_lit < nights:
         current_time = time.monotonic()
+        frame_start_ns = time.monotonic_ns()
         frame_counter += 1
         
         # Update display with animations
         brightness_scale = MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]
         for i in range(nights):
-            if candle_states[i].lit:
-                # Update animation for lit candles
-                update_flame_animation(i, frame_counter)
-            update_candle_display(i, brightness_scale)
+            tick_candle(i, frame_counter, brightness_scale)
         # Update shamash with animation
-        if candle_states[8].lit:
-            update_flame_animation(8, frame_counter)
-        update_candle_display(8, brightness_scale)
+        tick_candle(8, frame_counter, brightness_scale)
         
-        # Show all strips
-        shamash_strip.show()
-        for strip in candle_strips:
-            strip.show()
+        # Show strips that changed this frame
+        flush_strips()
         
         # Check for gestures to light next candle (UP or DOWN)
         time_since_last_light = current_time - last_light_time
         if GESTURE_ENABLED and apds and time_since_last_light >= min_time_between_lights:
             cooldown_elapsed = current_time - last_gesture_time
             if cooldown_elapsed >= gesture_cooldown:
-                try:
-                    gesture = apds.gesture()
-                    # UP (0x01) or DOWN (0x02) gesture lights next candle
-                    if gesture == 0x01 or gesture == 1 or gesture == 0x02 or gesture == 2:
-                        last_gesture_time = current_time
-                        
-                        if candles_lit < len(candle_indices):
-                            candle_idx = candle_indices[candles_lit]
-                            if candle_idx < len(candle_states):
-                                candle_states[candle_idx].lit = True
-                                candle_states[candle_idx].duration_minutes = calculate_candle_duration()
-                                # burn_start_time will be set when entering phase 3
-                                candles_lit += 1
-                                last_light_time = current_time
-                                print(f"Candle {candles_lit}/{nights} lit (duration: {candle_states[candle_idx].duration_minutes:.2f} min)")
-                except Exception:
-                    pass
+                gesture = take_gesture()  # Read from the sensor by gesture_task, off the render path
+                # UP (0x01) or DOWN (0x02) gesture lights next candle
+                if gesture in GESTURE_STEPS:
+                    last_gesture_time = current_time
+                    
+                    if candles_lit < len(candle_indices):
+                        candle_idx = candle_indices[candles_lit]
+                        if candle_idx < len(candle_states):
+                            candle_states[candle_idx].lit = True
+                            candle_states[candle_idx].duration_minutes = calculate_candle_duration()
+                            # burn_start_time will be set when entering phase 3
+                            candles_lit += 1
+                            last_light_time = current_time
+                            print(f"Candle {candles_lit}/{nights} lit (duration: {candle_states[candle_idx].duration_minutes:.2f} min)")
         
-        time.sleep(0.02)  # 50Hz update rate
+        # 50Hz update rate - yield for the rest of the 20ms frame
+        sleep_ns = update_interval_ns - (time.monotonic_ns() - frame_start_ns)
+        await asyncio.sleep(sleep_ns / 1_000_000_000 if sleep_ns > 0 else 0)
     
     # All candles are lit - set burn_start_time for all lit candles (timer starts now)
     phase3_start_time = time.monotonic()
     for i in range(nights):
         if i < len(candle_states) and candle_states[i].lit:
-            candle_states[i].burn_start_time = phase3_start_time
+            start_candle_burn(candle_states[i], phase3_start_time)
     # Also set shamash burn start time
     if 8 < len(candle_states) and candle_states[8].lit:
-        candle_states[8].burn_start_time = phase3_start_time
+        start_candle_burn(candle_states[8], phase3_start_time)
     
     print(f"All {nights} candles + shamash lit! Entering Phase 3: Burning (timer started)")
 
-def phase3_burning_update(nights):
-    """Phase 3: Burning - Update candle burn-down and flame growth
+# Candle base LEDs for each 20% step of burn progress: 5->4->3->2->1
+# 0-20%: 5 LEDs, 20-40%: 4 LEDs, 40-60%: 3 LEDs, 60-80%: 2 LEDs, 80-100%: 1 LED
+CANDLE_BASE_LEDS_FOR_STEP = (5, 4, 3, 2, 1)
+CANDLE_BASE_STEPS = len(CANDLE_BASE_LEDS_FOR_STEP)
+
+def phase3_burning_update():
+    """Phase 3: Burning - Update candle burn-down and flame growth for the candles in burning_candles
     
-    Args:
-        nights: Number of candles that are lit (1-8)
+    Burned-out candles are removed from burning_candles, so later updates and frames skip them.
     
     Returns True if all candles have burned out, False otherwise.
     """
     current_time = time.monotonic()
-    all_burned_out = True
     
-    for i in range(num_candles):
-        if i >= len(candle_states):
-            continue
-        
+    for i in burning_candles[:]:  # Copy: burned-out candles are removed while iterating
         state = candle_states[i]
         
-        if not state.lit or state.burn_start_time is None:
-            continue
-        
         # Calculate burn progress (0.0 to 1.0)
-        elapsed_minutes = (current_time - state.burn_start_time) / 60.0
-        burn_progress = elapsed_minutes / state.duration_minutes if state.duration_minutes > 0 else 1.0
+        burn_progress = (current_time - state.burn_start_time) * state.burn_rate
         
         if burn_progress >= 1.0:
             # Candle has burned out - keep 1 blue LED
@@ -849,22 +979,11 @@ def phase3_burning_update(nights):
             state.flame_leds = 0
             state.flame_brightness = 0.0
             state.candle_base_leds = 1  # Stay as single blue LED after burn out
+            burning_candles.remove(i)
         else:
             # Candle is still burning
-            all_burned_out = False
-            
-            # Candle base decreases in steps: 5->4->3->2->1 based on burn progress
-            # 0-20%: 5 LEDs, 20-40%: 4 LEDs, 40-60%: 3 LEDs, 60-80%: 2 LEDs, 80-100%: 1 LED
-            if burn_progress < 0.20:
-                state.candle_base_leds = 5
-            elif burn_progress < 0.40:
-                state.candle_base_leds = 4
-            elif burn_progress < 0.60:
-                state.candle_base_leds = 3
-            elif burn_progress < 0.80:
-                state.candle_base_leds = 2
-            else:
-                state.candle_base_leds = 1
+            # Candle base decreases in steps based on burn progress (0.0 <= burn_progress < 1.0)
+            state.candle_base_leds = CANDLE_BASE_LEDS_FOR_STEP[int(burn_progress * CANDLE_BASE_STEPS)]
             
             # Store base values for animation (animation will modify these)
             flame_growth = burn_progress  # 0.0 to 1.0
@@ -876,7 +995,7 @@ def phase3_burning_update(nights):
             
             # Animation will be updated in main loop
     
-    return all_burned_out
+    return not burning_candles
 
 def test_mode_init_all_candles():
     """Test mode: Initialize all 9 candles (8 regular + shamash) and go straight to phase 3
@@ -906,12 +1025,12 @@ def test_mode_init_all_candles():
         if i < len(candle_states):
             candle_states[i].placed = True
             candle_states[i].lit = True
-            candle_states[i].burn_start_time = current_time
             # Shamash (index 8) always uses minimum duration
             if i == 8:  # Shamash
                 candle_states[i].duration_minutes = CANDLE_DURATION_MIN
             else:
                 candle_states[i].duration_minutes = calculate_candle_duration()
+            start_candle_burn(candle_states[i], current_time)
             candle_states[i].candle_base_leds = CANDLE_BASE_LEDS
             candle_states[i].base_flame_leds = FLAME_START_LEDS
             candle_states[i].flame_leds = FLAME_START_LEDS
@@ -934,98 +1053,158 @@ for strip in candle_strips:
     strip.fill((0, 0, 0, 0))
     strip.show()
 
-# Startup: Night Selection (Phase 1) or Test Mode
-if TEST_MODE:
-    # Test Mode: Skip to phase 3 with all candles burning
-    selected_nights = test_mode_init_all_candles()
-    current_phase = 3  # Start in phase 3
-else:
-    # Normal Mode: Night selection and lighting
-    menorah_night_index = select_startup_night()
-    selected_nights = MENORAH_NIGHTS[menorah_night_index]
-    
-    # Phase 2: Lighting
-    phase2_lighting(selected_nights)
-    
-    # Phase state tracking
-    current_phase = 3  # Start in phase 3 after lighting
-
 # Runtime State Variables
-last_gesture_time = time.monotonic()  # Timestamp of last gesture detection
+current_phase = 1  # Phase state tracking (1-4)
+selected_nights = 0  # Number of candles lit for the selected night
 gesture_cooldown = 0.5  # Minimum time between gesture detections (prevents spam)
+gesture_poll_interval = 0.01  # Gesture sensor polling interval (10ms = 100Hz)
+gesture_max_errors = 5  # Consecutive sensor read failures before gestures are disabled
 menorah_frame = 0  # Frame counter for animation timing
-update_interval = 0.02  # Main loop update interval (20ms = 50Hz for smooth animation)
+update_interval_ns = 20_000_000  # Animation update interval (20ms = 50Hz for smooth animation), integer nanoseconds
+burn_update_interval = 1.0  # Burn-down update interval (candle bases shrink over minutes, 1Hz is plenty)
+burning_candles = []  # Indices of candles still burning in phase 3 (filled when phase 3 starts)
+pending_gesture = (0.0, 0)  # (time.monotonic(), gesture) of the latest phase 1/2 gesture read by gesture_task (0 = none)
+pending_gesture_max_age = 0.1  # Older pending gestures are dropped (both phase loops poll at least every 50ms)
 
-# Main Menorah Control Loop
-while True:
-    current_time = time.monotonic()
-    loop_start = current_time
-    
-    # Increment frame counter for animation timing
-    menorah_frame += 1
-    
-    if current_phase == 3:
-        # Phase 3: Burning - timer started when all candles were lit in phase 2
-        # Update candle burn-down and flame growth
+async def burn_task():
+    """Phase 3: Update candle burn-down and flame growth once per second"""
+    global current_phase
+    while current_phase == 3:
         # Update all 9 candles (8 regular + shamash)
-        num_candles = 9  # Always include shamash in phase 3
-        all_burned_out = phase3_burning_update(num_candles)
-        
-        # Update display for all candles with animations
-        brightness_scale = MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]
-        for i in range(num_candles):
-            if i < len(candle_states) and candle_states[i].lit:
-                # Update animation for lit candles
-                update_flame_animation(i, menorah_frame)
-            update_candle_display(i, brightness_scale)
-        
-        # Update all NeoPixel strips
-        shamash_strip.show()
-        for strip in candle_strips:
-            strip.show()
+        all_burned_out = phase3_burning_update()
         
         # Check if all candles burned out (transition to phase 4 if needed)
         if all_burned_out:
             print("All candles have burned out")
             # TODO: Phase 4 implementation
             current_phase = 4
+        
+        await asyncio.sleep(burn_update_interval)
+
+async def animation_task():
+    """Animate the candles at a fixed 50Hz, independent of gesture polling and burn-down"""
+    global menorah_frame
+    static_brightness_scale = None  # Brightness the static (not burning) candles were last drawn at
+    static_burning_count = -1  # Number of burning candles when the static candles were last drawn
+    while True:
+        loop_start_ns = time.monotonic_ns()
+        
+        # Increment frame counter for animation timing
+        menorah_frame += 1
+        
+        if current_phase == 3:
+            # Phase 3: Burning - timer started when all candles were lit in phase 2
+            # Burn-down is updated by burn_task; only the candles still burning are animated
+            brightness_scale = MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]
+            for i in burning_candles:
+                tick_candle(i, menorah_frame, brightness_scale)
+            
+            # Unlit and burned-out candles (8 regular + shamash) show a static frame: redraw them only
+            # when the brightness changes or another candle burns out
+            if brightness_scale != static_brightness_scale or len(burning_candles) != static_burning_count:
+                for i in range(len(candle_states)):
+                    if i not in burning_candles:
+                        update_candle_display(i, brightness_scale)
+                static_brightness_scale = brightness_scale
+                static_burning_count = len(burning_candles)
+            
+            # Update NeoPixel strips that changed this frame
+            flush_strips()
+        
+        elif current_phase == 4:
+            # Phase 4: (Future implementation)
+            # For now, just keep display as-is. Redraw every candle including the shamash: burn_task can
+            # switch to phase 4 in the same tick the last candles burn out, before their final frame is drawn
+            # (unchanged static candles are skipped by update_candle_display)
+            brightness_scale = MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]
+            for i in range(len(candle_states)):
+                update_candle_display(i, brightness_scale)
+            flush_strips()
+        
+        # Maintain consistent frame timing (20ms update interval)
+        # Calculate how long the frame took and yield for the remainder (integer ns avoids float
+        # precision loss in time.monotonic() after long uptimes)
+        sleep_ns = update_interval_ns - (time.monotonic_ns() - loop_start_ns)
+        await asyncio.sleep(sleep_ns / 1_000_000_000 if sleep_ns > 0 else 0)
+
+def take_gesture():
+    """Return the gesture waiting from gesture_task (0 if none or stale) and clear it
     
-    elif current_phase == 4:
-        # Phase 4: (Future implementation)
-        # For now, just keep display as-is
-        brightness_scale = MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]
-        for i in range(selected_nights):
-            update_candle_display(i, brightness_scale)
-        shamash_strip.show()
-        for strip in candle_strips:
-            strip.show()
-    
-    # Gesture Detection (phase-specific behavior)
-    if GESTURE_ENABLED and apds and (current_time - last_gesture_time) >= gesture_cooldown:
+    A gesture made while the caller was in its own cooldown goes stale and is dropped, like a gesture
+    made while the sensor was not being read.
+    """
+    global pending_gesture
+    gesture_time, gesture = pending_gesture
+    pending_gesture = (0.0, 0)
+    if time.monotonic() - gesture_time > pending_gesture_max_age:
+        return 0
+    return gesture
+
+async def gesture_task():
+    """Poll the gesture sensor and apply gestures (phase-specific behavior)"""
+    global menorah_brightness_index, pending_gesture, GESTURE_ENABLED
+    read_errors = 0
+    while True:
         try:
             gesture = apds.gesture()
-            if gesture != 0:  # 0 = no gesture detected
-                last_gesture_time = current_time
-                
-                # Adafruit gesture values: 0x01=UP, 0x02=DOWN, 0x03=LEFT, 0x04=RIGHT
-                if current_phase == 3:
-                    # Phase 3: UP/DOWN gestures change brightness
-                    if gesture == 0x01 or gesture == 1:  # UP (0x01) -> increase brightness
-                        menorah_brightness_index = (menorah_brightness_index + 1) % len(MENORAH_BRIGHTNESS_LEVELS)
-                        print(f"Brightness: {MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]*100:.0f}%")
-                    elif gesture == 0x02 or gesture == 2:  # DOWN (0x02) -> decrease brightness
-                        menorah_brightness_index = (menorah_brightness_index - 1) % len(MENORAH_BRIGHTNESS_LEVELS)
-                        print(f"Brightness: {MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]*100:.0f}%")
-                    # LEFT (0x03) and RIGHT (0x04) not used in phase 3
-                else:
-                    # Other phases: gestures not used (or handled elsewhere)
-                    pass
-        except Exception:
-            pass  # Ignore gesture errors (sensor may be temporarily unavailable)
-    
-    # Maintain consistent loop timing (20ms update interval)
-    # Calculate how long the loop took and sleep for the remainder
-    elapsed_in_loop = time.monotonic() - loop_start
-    sleep_time = max(0, update_interval - elapsed_in_loop)
-    if sleep_time > 0:
-        time.sleep(sleep_time)
+            read_errors = 0
+        except OSError as e:
+            # Transient I2C errors are skipped; a sensor that keeps failing is disabled instead of
+            # ending the whole menorah (this task runs under asyncio.gather in main)
+            read_errors += 1
+            if read_errors >= gesture_max_errors:
+                print(f"APDS-9960 read failed {read_errors} times, disabling gestures: {e}")
+                GESTURE_ENABLED = False
+                return
+            gesture = 0
+        
+        if gesture == 0:  # 0 = no gesture detected
+            await asyncio.sleep(gesture_poll_interval)
+            continue
+        
+        # Adafruit gesture values: 0x01=UP, 0x02=DOWN, 0x03=LEFT, 0x04=RIGHT
+        if current_phase == 3:
+            # Phase 3: UP (0x01) increases and DOWN (0x02) decreases brightness
+            step = GESTURE_STEPS.get(gesture)
+            if step is not None:
+                menorah_brightness_index = (menorah_brightness_index + step) % len(MENORAH_BRIGHTNESS_LEVELS)
+                print(f"Brightness: {MENORAH_BRIGHTNESS_LEVELS[menorah_brightness_index]*100:.0f}%")
+            # LEFT (0x03) and RIGHT (0x04) not used in phase 3
+        elif current_phase < 3:
+            # Phases 1-2: hand the gesture to night selection / lighting (see take_gesture); those loops
+            # apply their own cooldowns, so keep polling at the normal rate
+            pending_gesture = (time.monotonic(), gesture)
+            await asyncio.sleep(gesture_poll_interval)
+            continue
+        # Phase 4: gestures not used
+        
+        # Cooldown before the next gesture read (prevents spam)
+        await asyncio.sleep(gesture_cooldown)
+
+async def main():
+    """Select and light the night (or enter test mode), then run burn-down, animation and gesture polling side by side"""
+    global menorah_night_index, selected_nights, current_phase
+    # Poll the gesture sensor in its own task from the start, so its I2C reads stay out of the render loops
+    tasks = [burn_task(), animation_task()]
+    if GESTURE_ENABLED and apds:
+        tasks.append(asyncio.create_task(gesture_task()))
+    
+    # Startup: Night Selection (Phase 1) or Test Mode
+    if TEST_MODE:
+        # Test Mode: Skip to phase 3 with all candles burning
+        selected_nights = test_mode_init_all_candles()
+    else:
+        # Normal Mode: Night selection and lighting
+        menorah_night_index = await select_startup_night()
+        selected_nights = menorah_night_index + 1
+        
+        # Phase 2: Lighting
+        current_phase = 2
+        await phase2_lighting(selected_nights)
+    current_phase = 3  # Start in phase 3 (after lighting, or straight away in test mode)
+    burning_candles[:] = [i for i in range(len(candle_states)) if candle_states[i].lit]
+    
+    await asyncio.gather(*tasks)
+
+# Main Menorah Control Loop
+asyncio.run(main())